@@ -0,0 +1,70 @@
+"""Per-LIC benchmark of the batched numpy kernels.
+
+Times every kernel of decide.lic_numpy on a batch of random-walk tracks,
+with a fresh PrimitiveStore per call so that the geometry is computed
+inside the timing. Parameters are chosen so that no condition is met.
+Results are written as JSON; given the JSON written at another commit
+with --baseline, the speedup of every kernel over it is printed too.
+
+Usage: python benchmarks/bench_kernels.py [--baseline before.json] [--output after.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import lic_numpy
+from bench_scaling import WORST_CASE_PARAMS, random_walk, time_call
+from bench_suite import metadata
+
+
+def run(batch, size, repeat):
+    tracks = np.stack([random_walk(size, seed) for seed in range(batch)])
+    x = np.ascontiguousarray(tracks[..., 0])
+    y = np.ascontiguousarray(tracks[..., 1])
+    lengths = np.full(batch, size)
+    params = SimpleNamespace(**WORST_CASE_PARAMS)
+    results = {}
+    for index, kernel in enumerate(lic_numpy.LIC_KERNELS):
+        results[f"lic_{index}"] = time_call(
+            lambda: kernel(x, y, lengths, params, lic_numpy.PrimitiveStore(x, y)),
+            repeat,
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--baseline", help="JSON written by an earlier run")
+    parser.add_argument("--output", default="bench_kernels.json")
+    args = parser.parse_args()
+
+    results = run(args.batch, args.size, args.repeat)
+    with open(args.output, "w") as file:
+        labels = {"batch": args.batch, "size": args.size}
+        json.dump({"metadata": metadata(), **labels, "results": results}, file)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+
+    print(f"{'kernel':<10}{'time':>12}{'baseline':>12}{'speedup':>10}")
+    for name, seconds in results.items():
+        line = f"{name:<10}{seconds * 1e3:>10.2f}ms"
+        if name in baseline:
+            before = baseline[name]
+            line += f"{before * 1e3:>10.2f}ms{before / seconds:>9.2f}x"
+        print(line)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
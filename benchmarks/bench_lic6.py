@@ -0,0 +1,107 @@
+"""Benchmark of the LIC 6 kernels against the reference loop.
+
+Times LIC 6 on random-walk tracks for growing numbers of points and
+window sizes N_PTS, by default with a DIST that no window exceeds, so
+every window is examined. Compares the reference LIC.lic_6_check loop, the array kernel
+with one pass per interior offset (the previous numpy kernel, still used
+for short windows) and the bounded kernel, whose cost does not grow with
+N_PTS. The reference loop is skipped above --reference-limit point-window
+pairs, where it takes minutes.
+
+--track zigzag times the worst case of the bounded kernel instead: a
+zigzag of unit amplitude at half the angle between two bound directions,
+with DIST equal to the amplitude. No window is met, but the bound rules
+out none of them, so the bounded kernel takes as long as the one pass
+per interior offset.
+
+Usage: python benchmarks/bench_lic6.py [--sizes 1000 100000] [--windows 5 50 500]
+       [--track walk|zigzag]
+"""
+
+import argparse
+import os
+import sys
+from math import cos, pi, sin
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide.lic import LIC
+from decide.lic_numpy import (
+    BOUND_DIRECTIONS,
+    _interior_distances_exceed_direct,
+    interior_distances_exceed,
+)
+from bench_scaling import random_walk, time_call
+
+# DIST of each track when --dist is not given
+DEFAULT_DIST = {"walk": 1e9, "zigzag": 1.0}
+
+
+def zigzag(n):
+    """Unit steps alternating between two parallel lines one apart, turned
+    so that the lines' normal lies halfway between two bound directions."""
+    angle = pi / BOUND_DIRECTIONS
+    along = np.arange(n, dtype=np.float64)
+    across = (np.arange(n) % 2).astype(np.float64)
+    return np.stack(
+        [
+            cos(angle) * along - sin(angle) * across,
+            sin(angle) * along + cos(angle) * across,
+        ],
+        axis=1,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--windows", type=int, nargs="+", default=[5, 50, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--reference-limit", type=float, default=5e6)
+    parser.add_argument("--track", choices=sorted(DEFAULT_DIST), default="walk")
+    parser.add_argument(
+        "--dist",
+        type=float,
+        help="DIST, by default above every window of the random walk and equal "
+        "to the zigzag's amplitude",
+    )
+    args = parser.parse_args()
+    track = zigzag if args.track == "zigzag" else random_walk
+    dist = DEFAULT_DIST[args.track] if args.dist is None else args.dist
+
+    print(
+        f"{'points':>10}{'N_PTS':>8}{'reference':>14}{'per offset':>14}{'bounded':>14}"
+    )
+    for size in args.sizes:
+        points = track(size)
+        x, y = np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+        for n_pts in args.windows:
+            if n_pts > size:
+                continue
+            if size * n_pts <= args.reference_limit:
+                decide = SimpleNamespace(
+                    POINTS=[tuple(point) for point in points.tolist()],
+                    N_PTS=n_pts,
+                    DIST=dist,
+                )
+                check = LIC(decide).lic_6_check
+                reference = f"{time_call(check, args.repeat) * 1e3:>12.2f}ms"
+            else:
+                reference = f"{'-':>14}"
+            direct = time_call(
+                lambda: _interior_distances_exceed_direct(x, y, n_pts, dist),
+                args.repeat,
+            )
+            bounded = time_call(
+                lambda: interior_distances_exceed(x, y, n_pts, dist), args.repeat
+            )
+            print(
+                f"{size:>10,}{n_pts:>8}{reference}"
+                f"{direct * 1e3:>12.2f}ms{bounded * 1e3:>12.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
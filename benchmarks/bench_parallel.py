@@ -0,0 +1,67 @@
+"""Scaling benchmark for the process-pool runner.
+
+Decides a fixed archive of random scenarios with a compiled plan in this
+process, then with ParallelRunner on growing numbers of workers, and
+prints the speedup and parallel efficiency of each. The pool is warmed up
+with one run before timing, so worker start-up and plan compilation are
+not counted. Near-linear scaling shows as an efficiency close to 1 up to
+the number of cores.
+
+Usage: python benchmarks/bench_parallel.py [--scenarios 20000] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide.parallel import ParallelRunner
+from decide.plan import compile_plan
+from decide.points import PointArray
+from bench_scaling import WORST_CASE_PARAMS
+
+LCM = [["ANDD"] * 15 for _ in range(15)]
+PUV = [True] * 15
+
+
+def archive(count, points, seed=2480):
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(size=(count, points, 2))
+    steps[..., 0] = np.abs(steps[..., 0])
+    return list(np.cumsum(steps, axis=1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=int, default=20_000)
+    parser.add_argument("--points", type=int, default=100)
+    default_workers = [1, 2, 4, 8, 16, 32]
+    default_workers = [n for n in default_workers if n <= (os.cpu_count() or 1)]
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    args = parser.parse_args()
+
+    scenarios = archive(args.scenarios, args.points)
+    plan = compile_plan(WORST_CASE_PARAMS, LCM, PUV)
+    start = time.perf_counter()
+    expected = [plan.decide(PointArray(points)) for points in scenarios]
+    serial = time.perf_counter() - start
+    print(f"{os.cpu_count()} cores, {args.scenarios} scenarios of {args.points} points")
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}{'efficiency':>12}")
+    print(f"{'serial':>8}{serial:>10.2f}{1:>10.2f}{1:>12.2f}")
+
+    for workers in args.workers:
+        with ParallelRunner(workers) as runner:
+            runner.run(scenarios[: workers * 4], WORST_CASE_PARAMS, LCM, PUV)
+            start = time.perf_counter()
+            results = runner.run(scenarios, WORST_CASE_PARAMS, LCM, PUV)
+            seconds = time.perf_counter() - start
+        assert results == expected
+        speedup = serial / seconds
+        print(f"{workers:>8}{seconds:>10.2f}{speedup:>10.2f}{speedup / workers:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Scaling benchmark for the large input mode.
+
+Times every LIC of the numpy engine on random-walk tracks of growing size
+and fits the exponent of time ~ n^k on a log-log scale; linear checks give
+k close to 1. Parameters are chosen so that no condition is met, so every
+check scans the whole track.
+
+Usage: python benchmarks/bench_scaling.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+
+# Thresholds that none of the windows of a unit-step random walk reach
+WORST_CASE_PARAMS = {
+    "LENGTH1": 1e9,
+    "RADIUS1": 1e9,
+    "EPSILON": math.pi,
+    "AREA1": 1e18,
+    "LENGTH2": 0,
+    "RADIUS2": 0,
+    "AREA2": 0,
+    "Q_PTS": 5,
+    "QUADS": 3,
+    "DIST": 1e9,
+    "N_PTS": 5,
+    "K_PTS": 3,
+    "A_PTS": 2,
+    "B_PTS": 3,
+    "C_PTS": 2,
+    "D_PTS": 3,
+    "E_PTS": 2,
+    "F_PTS": 3,
+    "G_PTS": 3,
+}
+
+
+def random_walk(n, seed=2480):
+    """Monotone in x, so LIC 5 and 11 scan everything too."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(size=(n, 2))
+    steps[:, 0] = np.abs(steps[:, 0])
+    return np.cumsum(steps, axis=0)
+
+
+def time_call(function, repeat):
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fitted_exponent(sizes, seconds):
+    """Least squares slope of log(seconds) against log(size)."""
+    logs_n = [math.log(size) for size in sizes]
+    logs_t = [math.log(max(second, 1e-9)) for second in seconds]
+    mean_n = sum(logs_n) / len(logs_n)
+    mean_t = sum(logs_t) / len(logs_t)
+    covariance = sum((a - mean_n) * (b - mean_t) for a, b in zip(logs_n, logs_t))
+    variance = sum((a - mean_n) ** 2 for a in logs_n)
+    return covariance / variance
+
+
+def run(sizes, repeat):
+    timings = {f"lic_{index}": [] for index in range(15)}
+    timings["calculate_CMV"] = []
+    for size in sizes:
+        decide = Decide(large_input=True)
+        decide.POINTS = random_walk(size)
+        for name, value in WORST_CASE_PARAMS.items():
+            setattr(decide, name, value)
+        for index in range(15):
+            check = getattr(decide.LIC, f"lic_{index}_check")
+            timings[f"lic_{index}"].append(time_call(check, repeat))
+        timings["calculate_CMV"].append(time_call(decide.calculate_CMV, repeat))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    timings = run(args.sizes, args.repeat)
+    header = "".join(f"{size:>14,}" for size in args.sizes)
+    print(f"{'check':<16}{header}{'exponent':>10}")
+    for name, seconds in timings.items():
+        cells = "".join(f"{second * 1e3:>12.2f}ms" for second in seconds)
+        print(f"{name:<16}{cells}{fitted_exponent(args.sizes, seconds):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
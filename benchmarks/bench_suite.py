@@ -0,0 +1,171 @@
+"""Micro-benchmark suite for the LICs, the helpers and the decision stages.
+
+Times every LIC check, every geometry helper, calculate_CMV, calculate_PUM,
+calculate_FUV and the end-to-end Decide.decide() for each engine, over
+several track sizes and two parameter regimes: "best", where every
+condition is met by the first window so the checks exit early, and
+"worst", where no condition is met so every check scans the whole track.
+Sizes above 100 points use the large input mode, which only the numpy
+engine supports. Results are written as JSON for comparing engines and
+commits; nothing is downloaded.
+
+Usage: python benchmarks/bench_suite.py [--output bench_results.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide import helpers
+from bench_scaling import WORST_CASE_PARAMS, random_walk
+
+# Thresholds that the first window of a random track meets
+BEST_CASE_PARAMS = {
+    "LENGTH1": 0,
+    "RADIUS1": 0,
+    "EPSILON": 0,
+    "AREA1": 0,
+    "LENGTH2": 1e9,
+    "RADIUS2": 1e9,
+    "AREA2": 1e18,
+    "Q_PTS": 2,
+    "QUADS": 0,
+    "DIST": 0,
+    "N_PTS": 3,
+    "K_PTS": 1,
+    "A_PTS": 1,
+    "B_PTS": 1,
+    "C_PTS": 1,
+    "D_PTS": 1,
+    "E_PTS": 1,
+    "F_PTS": 1,
+    "G_PTS": 1,
+}
+
+REGIMES = {"best": BEST_CASE_PARAMS, "worst": WORST_CASE_PARAMS}
+
+HELPER_ARGUMENTS = {
+    "calculate_distance": ((0.5, -1.25), (3.0, 2.75)),
+    "calculate_triangle_area": ((0.5, -1.25), (3.0, 2.75), (-2.0, 1.5)),
+    "calculate_circumcenter": ((0.5, -1.25), (3.0, 2.75), (-2.0, 1.5)),
+    "calculate_circumradius": ((0.5, -1.25), (3.0, 2.75), (-2.0, 1.5)),
+    "calculate_angle": ((0.5, -1.25), (3.0, 2.75), (-2.0, 1.5)),
+}
+
+
+def track(size, regime, seed=2480):
+    """The worst case walk is monotone in x so that LIC 5 and 11 scan the
+    whole track; the best case walk turns back early."""
+    if regime == "worst":
+        return random_walk(size, seed)
+    rng = np.random.default_rng(seed)
+    return np.cumsum(rng.normal(size=(size, 2)), axis=0)
+
+
+def measure(function, repeat, min_time=0.02):
+    """Best time per call over `repeat` runs of an automatically sized loop."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, math.ceil(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number, number
+
+
+def make_decide(engine, size, regime):
+    decide = Decide(engine=engine, large_input=size > 100)
+    points = track(size, regime)
+    decide.POINTS = points if size > 100 else [tuple(point) for point in points]
+    for name, value in REGIMES[regime].items():
+        setattr(decide, name, value)
+    decide.LCM = [["ANDD"] * 15 for _ in range(15)]
+    decide.PUV = [True] * 15
+    return decide
+
+
+def run(engines, sizes, repeat):
+    results = []
+
+    def record(group, name, function, **labels):
+        seconds, number = measure(function, repeat)
+        results.append(
+            {
+                "group": group,
+                "name": name,
+                **labels,
+                "seconds": seconds,
+                "number": number,
+            }
+        )
+
+    for name, arguments in HELPER_ARGUMENTS.items():
+        function = getattr(helpers, name)
+        record("helper", name, lambda: function(*arguments))
+
+    for engine in engines:
+        for size in sizes:
+            if size > 100 and engine != "numpy":
+                continue
+            for regime in REGIMES:
+                labels = {"engine": engine, "size": size, "regime": regime}
+                decide = make_decide(engine, size, regime)
+                for index, check in enumerate(decide.LIC_methods()):
+                    record("lic", f"lic_{index}", check, **labels)
+                record("stage", "calculate_CMV", decide.calculate_CMV, **labels)
+                record("stage", "calculate_PUM", decide.calculate_PUM, **labels)
+                record("stage", "calculate_FUV", decide.calculate_FUV, **labels)
+                record("stage", "decide", decide.decide, **labels)
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engines", nargs="+", default=["python", "numpy"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 30, 100, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args()
+
+    results = run(args.engines, args.sizes, args.repeat)
+    with open(args.output, "w") as file:
+        json.dump({"metadata": metadata(), "results": results}, file, indent=2)
+
+    print(f"{'benchmark':<44}{'time':>14}")
+    for result in results:
+        labels = [result["name"]] + [
+            str(result[key]) for key in ("engine", "size", "regime") if key in result
+        ]
+        print(f"{' '.join(labels):<44}{result['seconds'] * 1e6:>12.2f}us")
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of parameter sweeps against one Decide instance per grid cell.
+
+Sweeps LENGTH1, RADIUS1 and EPSILON over a cubic grid on a random-walk
+track with decide_sweep, and times the same decision with a Decide
+instance per cell on a sample of the cells, extrapolated to the whole grid.
+Then computes the gap_tables of the track, every value of the gaps and
+gap pairs, against one Decide per gap pair (A_PTS = C_PTS = E_PTS and
+B_PTS = D_PTS = F_PTS), estimated the same way.
+
+Usage: python benchmarks/bench_sweep.py [--points 100] [--steps 100] [--sample 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.sweep import decide_sweep, gap_tables
+from bench_scaling import WORST_CASE_PARAMS, random_walk, time_call
+
+LCM = [["ANDD"] * 15 for _ in range(15)]
+PUV = [True] * 15
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=100, help="values per axis")
+    parser.add_argument(
+        "--sample", type=int, default=200, help="cells decided one by one"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    points = [tuple(point) for point in random_walk(args.points).tolist()]
+    axes = {
+        "LENGTH1": np.linspace(0, 10, args.steps),
+        "RADIUS1": np.linspace(0, 10, args.steps),
+        "EPSILON": np.linspace(0, np.pi, args.steps),
+    }
+    cells = args.steps**3
+    sweep = time_call(
+        lambda: decide_sweep(points, WORST_CASE_PARAMS, LCM, PUV, axes), args.repeat
+    )
+
+    rng = np.random.default_rng(2480)
+    per_cell = time_decisions(
+        points,
+        args.sample,
+        lambda: {name: float(rng.choice(values)) for name, values in axes.items()},
+    )
+    report(f"{cells:,} cells on {args.points} points", sweep, per_cell * cells)
+
+    tables = time_call(lambda: gap_tables(points, WORST_CASE_PARAMS), args.repeat)
+    gap_values = range(args.points)
+    per_pair = time_decisions(
+        points,
+        args.sample,
+        lambda: dict(
+            zip(
+                ["A_PTS", "B_PTS", "C_PTS", "D_PTS", "E_PTS", "F_PTS"],
+                [int(rng.choice(gap_values)) for _ in range(2)] * 3,
+            )
+        ),
+    )
+    report(
+        f"{args.points**2:,} gap pairs on {args.points} points",
+        tables,
+        per_pair * args.points**2,
+        "gap_tables",
+    )
+
+
+def time_decisions(points, sample, draw):
+    """Seconds per decision of a Decide instance with the parameters of
+    WORST_CASE_PARAMS updated with draw()."""
+    start = time.perf_counter()
+    for _ in range(sample):
+        decide = Decide()
+        decide.POINTS = points
+        for name, value in {**WORST_CASE_PARAMS, **draw()}.items():
+            setattr(decide, name, value)
+        decide.LCM, decide.PUV = LCM, PUV
+        decide.decide()
+    return (time.perf_counter() - start) / sample
+
+
+def report(title, seconds, estimate, name="decide_sweep"):
+    print(title)
+    print(f"{name:<24}{seconds:>10.2f}s")
+    print(f"{'Decide per cell (est.)':<24}{estimate:>10.2f}s")
+    print(f"{'speedup':<24}{estimate / seconds:>10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from .decide import check_LCM, check_PUV, make_parameters
+from .lic_numpy import LIC_KERNELS, PrimitiveStore
+
+
+class BatchResult(NamedTuple):
+    """Decisions for a batch of scenarios.
+
+    cmv: (batch, 15) boolean Conditions Met Vectors
+    fuv: (batch, 15) boolean Final Unlocking Vectors
+    launch: (batch,) boolean launch decisions
+    """
+
+    cmv: np.ndarray
+    fuv: np.ndarray
+    launch: np.ndarray
+
+
+def lcm_bool_masks(lcm):
+    """Boolean (15, 15) masks of the "ANDD" and the "ORR" entries of the LCM."""
+    check_LCM(lcm)
+    connectors = np.array(lcm)
+    return connectors == "ANDD", connectors == "ORR"
+
+
+def stack_points(points_batch, lengths=None):
+    """Stack scenarios into padded coordinate arrays.
+
+    points_batch is either an array of shape (batch, n, 2), optionally with
+    the number of valid points of each scenario in `lengths`, or a sequence
+    of point sequences of different lengths. Returns x, y of shape
+    (batch, n) and lengths of shape (batch,).
+    """
+    if isinstance(points_batch, np.ndarray):
+        points = np.asarray(points_batch, dtype=np.float64)
+        if points.ndim != 3 or points.shape[-1] != 2:
+            raise ValueError("points_batch must have shape (batch, n, 2)")
+        if lengths is None:
+            lengths = np.full(points.shape[0], points.shape[1])
+    else:
+        if lengths is not None:
+            raise ValueError("lengths can only be given with a padded array")
+        scenarios = [
+            np.asarray(points, dtype=np.float64).reshape(-1, 2)
+            for points in points_batch
+        ]
+        lengths = np.array([len(points) for points in scenarios], dtype=np.int64)
+        points = np.zeros((len(scenarios), max(lengths, default=0), 2))
+        for index, scenario in enumerate(scenarios):
+            points[index, : len(scenario)] = scenario
+    lengths = np.asarray(lengths, dtype=np.int64)
+    if lengths.shape != points.shape[:1] or np.any(
+        (lengths < 0) | (lengths > points.shape[1])
+    ):
+        raise ValueError("lengths must give one point count per scenario")
+    return points[..., 0], points[..., 1], lengths
+
+
+def batch_fuv(cmv, lcm_masks, puv):
+    """Batched PUM and FUV: the FUV for every row of the (batch, 15) CMV."""
+    and_mask, or_mask = lcm_masks
+    row = cmv[:, :, None]
+    column = cmv[:, None, :]
+    pum = np.where(and_mask, row & column, np.where(or_mask, row | column, True))
+    return ~np.asarray(puv, dtype=bool) | np.all(pum, axis=-1)
+
+
+def decide_batch(points_batch, params, lcm, puv, lengths=None):
+    """Evaluate the launch decision for a whole batch of scenarios.
+
+    All scenarios share the parameters (a mapping of parameter names to
+    values), the LCM and the PUV. The LICs, the PUM and the FUV are
+    evaluated as array operations over the whole batch, giving the same
+    results as one Decide instance per scenario. The kernels share the
+    geometry they have in common through one PrimitiveStore.
+    """
+    parameters = make_parameters(params)
+    lcm_masks = lcm_bool_masks(lcm)
+    check_PUV(puv)
+    x, y, lengths = stack_points(points_batch, lengths)
+
+    primitives = PrimitiveStore(x, y)
+    cmv = np.stack(
+        [kernel(x, y, lengths, parameters, primitives) for kernel in LIC_KERNELS], 1
+    )
+    fuv = batch_fuv(cmv, lcm_masks, puv)
+    return BatchResult(cmv, fuv, np.all(fuv, axis=-1))
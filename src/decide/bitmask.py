@@ -0,0 +1,212 @@
+from typing import NamedTuple
+
+ALL = (1 << 15) - 1  # All 15 conditions
+
+
+def to_mask(values):
+    """Bitmask with bit i set when values[i] is True."""
+    mask = 0
+    for index, value in enumerate(values):
+        if value:
+            mask |= 1 << index
+    return mask
+
+
+def to_list(mask):
+    """List of 15 booleans from a bitmask."""
+    return [bool(mask >> index & 1) for index in range(15)]
+
+
+class CompiledLCM(NamedTuple):
+    """The LCM as two bitmasks per row: the columns connected by "ANDD"
+    and the columns connected by "ORR". Other columns are "NOTUSED"."""
+
+    and_masks: tuple
+    or_masks: tuple
+
+
+def compile_LCM(lcm):
+    """Compile a 15x15 matrix of connector strings into row masks."""
+    return CompiledLCM(
+        tuple(to_mask(connector == "ANDD" for connector in row) for row in lcm),
+        tuple(to_mask(connector == "ORR" for connector in row) for row in lcm),
+    )
+
+
+def recompile_LCM_row(lcm, index, row):
+    """CompiledLCM with the masks of row `index` compiled from `row`."""
+    and_masks, or_masks = list(lcm.and_masks), list(lcm.or_masks)
+    and_masks[index] = to_mask(connector == "ANDD" for connector in row)
+    or_masks[index] = to_mask(connector == "ORR" for connector in row)
+    return CompiledLCM(tuple(and_masks), tuple(or_masks))
+
+
+def pum_rows(cmv, lcm):
+    """Rows of the PUM as bitmasks, from the CMV mask and a CompiledLCM.
+
+    ANDD entries of row i are CMV[i] and CMV[j], ORR entries CMV[i] or
+    CMV[j], and NOTUSED entries are True.
+    """
+    rows = []
+    for index in range(15):
+        and_mask, or_mask = lcm.and_masks[index], lcm.or_masks[index]
+        row = ALL & ~(and_mask | or_mask)
+        if cmv >> index & 1:
+            row |= (and_mask & cmv) | or_mask
+        else:
+            row |= or_mask & cmv
+        rows.append(row)
+    return rows
+
+
+def fuv_from_pum(rows, puv):
+    """FUV mask: bit i is set when PUV[i] is False or PUM row i is all True."""
+    fuv = ALL & ~puv
+    for index, row in enumerate(rows):
+        if row == ALL:
+            fuv |= 1 << index
+    return fuv
+
+
+def fuv_mask(cmv, puv, lcm):
+    """FUV mask straight from the CMV and PUV masks and a CompiledLCM,
+    without building the PUM: a row is all True when every ANDD column is
+    met and, unless the row's own condition is met, every ORR column too."""
+    fuv = ALL & ~puv
+    unmet = ALL & ~cmv
+    for index in range(15):
+        if cmv >> index & 1:
+            row_met = not lcm.and_masks[index] & unmet
+        else:
+            row_met = not lcm.and_masks[index] and not lcm.or_masks[index] & unmet
+        if row_met:
+            fuv |= 1 << index
+    return fuv
+
+
+class BitVector:
+    """List-like view of 15 booleans stored in an integer bitmask.
+
+    get() and put(mask, known) read and write the bitmask and the mask of
+    entries that are known; unknown entries read as None. Reading and
+    assigning items works like on the list this view replaces.
+    """
+
+    def __init__(self, get, put):
+        self._get = get
+        self._put = put
+
+    def __len__(self):
+        return 15
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if not -15 <= index < 15:
+            raise IndexError("index out of range")
+        mask, known = self._get()
+        index %= 15
+        if not known >> index & 1:
+            return None
+        return bool(mask >> index & 1)
+
+    def __setitem__(self, index, value):
+        if not -15 <= index < 15:
+            raise IndexError("index out of range")
+        index %= 15
+        mask, known = self._get()
+        bit = 1 << index
+        mask = mask | bit if value else mask & ~bit
+        self._put(mask, known | bit)
+
+    def __iter__(self):
+        mask, known = self._get()
+        for index in range(15):
+            yield bool(mask >> index & 1) if known >> index & 1 else None
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class ConnectorRow:
+    """List-like view of one row of the LCM.
+
+    Reading works like on the list of connector strings this view
+    replaces; assigning an item passes the column and the connector to
+    put(column, connector), which updates the row and its compiled masks.
+    """
+
+    def __init__(self, row, put):
+        self._row = row
+        self._put = put
+
+    def __len__(self):
+        return len(self._row)
+
+    def __getitem__(self, index):
+        return self._row[index]
+
+    def __setitem__(self, index, connector):
+        if not -15 <= index < 15:
+            raise IndexError("index out of range")
+        self._put(index % 15, connector)
+
+    def __iter__(self):
+        return iter(self._row)
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(self._row)
+
+
+class MatrixView:
+    """List-like view of the 15 rows of the LCM or the PUM.
+
+    row(index) returns the view of one row, through which its entries are
+    assigned; assigning a whole row passes its index and values to
+    put(index, values). Reading works like on the nested lists this view
+    replaces.
+    """
+
+    def __init__(self, row, put):
+        self._row = row
+        self._put = put
+
+    def __len__(self):
+        return 15
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if not -15 <= index < 15:
+            raise IndexError("index out of range")
+        return self._row(index % 15)
+
+    def __setitem__(self, index, values):
+        if not -15 <= index < 15:
+            raise IndexError("index out of range")
+        self._put(index % 15, values)
+
+    def __iter__(self):
+        for index in range(15):
+            yield self._row(index)
+
+    def __eq__(self, other):
+        try:
+            return [list(row) for row in self] == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
@@ -0,0 +1,142 @@
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from itertools import chain
+
+from .decide import PARAMETER_NAMES
+
+# Attributes of a Decide instance that hold the outcome of a decision
+STATE = (
+    "_cmv",
+    "_cmv_known",
+    "_pum",
+    "_pum_known",
+    "_fuv",
+    "_fuv_known",
+    "_LAUNCH",
+    "stats",
+)
+
+
+def decision_key(decide_instance):
+    """Digest of everything a decision depends on: the points, NUMPOINTS,
+    the 19 parameters, the LCM, the PUV and the evaluation mode.
+
+    List points are hashed as float64 coordinates, array points as their
+    float64 buffer, so an integer coordinate and the equal float give the
+    same key.
+    """
+    d = decide_instance
+    digest = blake2b(digest_size=16)
+    mode = (d.engine, d.exact, d.demand_driven, d.NUMPOINTS)
+    digest.update(repr(mode).encode())
+    digest.update(repr(tuple(getattr(d, name) for name in PARAMETER_NAMES)).encode())
+    digest.update(repr((d._lcm_masks, d._puv)).encode())
+    points = d.POINTS
+    if isinstance(points, list):
+        digest.update(array("d", chain.from_iterable(points)).tobytes())
+    else:  # A PointArray, whose data is contiguous float64
+        digest.update(points.data)
+    return digest.digest()
+
+
+def _size(value):
+    """Approximate memory of a cached state: the objects and their items."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(_size(item) for item in value)
+    return size
+
+
+class DecisionCache:
+    """LRU cache of decision outcomes keyed by decision_key.
+
+    maxsize: number of decisions kept
+    max_bytes: approximate memory budget of the cached outcomes, or None
+    ttl: seconds a decision stays valid after it was computed, or None
+    Least recently used decisions are evicted first. Lookups count as hits
+    or misses, and the cache can be shared by several Decide instances
+    and threads.
+    """
+
+    def __init__(self, maxsize=1024, max_bytes=None, ttl=None, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        self._entries = OrderedDict()  # key: (state, size, expiry)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key):
+        """The cached state of key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= self.clock():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, state):
+        size = _size(key) + _size(state)
+        expiry = float("inf") if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (state, size, expiry)
+            self.bytes += size
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def decide(self, decide_instance):
+        """Decide through the cache: on a hit the CMV, PUM, FUV, LAUNCH and
+        stats of the cached decision are restored without evaluating it."""
+        key = decision_key(decide_instance)
+        state = self.get(key)
+        if state is None:
+            decide_instance._evaluate_decision()
+            state = tuple(getattr(decide_instance, name) for name in STATE)
+            # The PUM attributes are lists, cache copies of them
+            state = state[:2] + (tuple(state[2]), tuple(state[3])) + state[4:]
+            self.put(key, state)
+        else:
+            for name, value in zip(STATE, state):
+                setattr(decide_instance, name, value)
+            decide_instance._pum = list(state[2])
+            decide_instance._pum_known = list(state[3])
+        return decide_instance._LAUNCH
@@ -0,0 +1,250 @@
+"""Command line evaluation of scenario files.
+
+Scenarios are read from JSON Lines, one object per line:
+
+    {"id": "a", "points": [[0, 0], [1, 2], ...], "parameters": {...},
+     "LCM": [...], "PUV": [...]}
+
+or from CSV with one point per row, where consecutive rows with the same
+"id" form a scenario:
+
+    id,x,y,LENGTH1,N_PTS
+    a,0,0,4,3
+    a,1,2,,
+
+Parameter columns are read from the first row of a scenario, and "LCM"
+and "PUV" columns hold JSON. Settings missing from a scenario are taken
+from the --configuration file. Each scenario is answered with one JSON
+line holding its id and LAUNCH, CMV and FUV, or an "error" message.
+Scenarios are read, evaluated and written one at a time (or a bounded
+number of chunks at a time with --workers), so memory use does not grow
+with the input.
+
+Usage: python -m decide [FILE] [--format jsonl|csv] [--configuration FILE]
+       [--workers N] [--stats] [--large-input]
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import groupby, islice
+
+from .bitmask import ALL, to_list
+from .decide import PARAMETER_NAMES
+from .inputs import parse_points
+from .plan import compile_plan, configuration_key
+
+SETTINGS = ("parameters", "LCM", "PUV")
+
+
+def read_jsonl(lines, defaults=None):
+    """Scenario dicts from JSON lines; blank lines are skipped. A line that
+    cannot be parsed gives a scenario with an "error" instead."""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            scenario = json.loads(line)
+            if not isinstance(scenario, dict):
+                raise ValueError("scenarios must be JSON objects")
+        except ValueError as error:
+            yield {"id": number, "error": str(error)}
+            continue
+        scenario.setdefault("id", number)
+        yield _with_defaults(scenario, defaults)
+
+
+def read_csv(lines, defaults=None):
+    """Scenario dicts from CSV rows with id, x and y columns, grouping
+    consecutive rows with the same id. Settings columns missing at the end
+    of a row count as empty, and a row without x or y gives a scenario
+    with an "error"."""
+    reader = csv.DictReader(lines)
+    missing = {"id", "x", "y"} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"CSV input needs the columns {', '.join(sorted(missing))}")
+    for identifier, rows in groupby(reader, key=lambda row: row["id"]):
+        try:
+            first = next(rows)
+            points = [(_number(first["x"]), _number(first["y"]))]
+            points += [(_number(row["x"]), _number(row["y"])) for row in rows]
+            scenario = {"id": identifier, "points": points}
+            parameters = {
+                name: _number(first[name])
+                for name in PARAMETER_NAMES
+                if first.get(name) not in (None, "")
+            }
+            if parameters:
+                scenario["parameters"] = parameters
+            for name in ("LCM", "PUV"):
+                if first.get(name) not in (None, ""):
+                    scenario[name] = json.loads(first[name])
+        except ValueError as error:
+            yield {"id": identifier, "error": str(error)}
+            continue
+        yield _with_defaults(scenario, defaults)
+
+
+def _number(text):
+    if text is None:
+        raise ValueError("row has fewer fields than the header")
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _with_defaults(scenario, defaults):
+    if defaults:
+        for name in SETTINGS:
+            if name not in scenario and name in defaults:
+                scenario[name] = defaults[name]
+    return scenario
+
+
+@lru_cache(maxsize=64)
+def _plan(key, large_input):
+    params, lcm, puv = key
+    return compile_plan(dict(params), lcm, puv, large_input)
+
+
+def evaluate(scenario, large_input=False):
+    """The result line of one scenario, with the plans of recently seen
+    configurations kept compiled. Any failure, such as coordinates that
+    overflow, gives an "error" line for this scenario only. Scenarios of
+    more than 100 points need large_input, like on Decide."""
+    if "error" in scenario:
+        return {"id": scenario["id"], "error": scenario["error"]}
+    try:
+        for name in ("LCM", "PUV"):
+            if name not in scenario:
+                raise ValueError(f"{name} is missing")
+        points = scenario.get("points")
+        if not isinstance(points, list) or not all(
+            isinstance(point, tuple) for point in points
+        ):
+            points = parse_points(points)
+        parameters = scenario.get("parameters", {})
+        if not isinstance(parameters, dict):
+            raise ValueError("parameters must map parameter names to values")
+        key = configuration_key(parameters, scenario["LCM"], scenario["PUV"])
+        cmv, fuv = _plan(key, large_input).evaluate(points)
+    except Exception as error:
+        return {"id": scenario["id"], "error": str(error)}
+    return {
+        "id": scenario["id"],
+        "LAUNCH": "YES" if fuv == ALL else "NO",
+        "CMV": to_list(cmv),
+        "FUV": to_list(fuv),
+    }
+
+
+def _evaluate_chunk(chunk, large_input):
+    return [evaluate(scenario, large_input) for scenario in chunk]
+
+
+def evaluate_parallel(scenarios, workers, chunk_size=256, large_input=False):
+    """Results of the scenarios in input order, evaluated in chunks on a
+    process pool. At most two chunks per worker are in flight, so the
+    input is read only as fast as it is evaluated."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    scenarios = iter(scenarios)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        while True:
+            while len(in_flight) < 2 * workers:
+                chunk = list(islice(scenarios, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(pool.submit(_evaluate_chunk, chunk, large_input))
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+
+class Throughput:
+    """Counts results and reports scenarios per second on a stream,
+    at most once per `interval` seconds and once at the end."""
+
+    def __init__(self, stream, interval=1.0):
+        self.stream = stream
+        self.interval = interval
+        self.count = 0
+        self.errors = 0
+        self.start = self.reported = time.perf_counter()
+
+    def add(self, result):
+        self.count += 1
+        self.errors += "error" in result
+        now = time.perf_counter()
+        if now - self.reported >= self.interval:
+            self.reported = now
+            self.report(now)
+
+    def report(self, now=None):
+        seconds = (now or time.perf_counter()) - self.start
+        rate = self.count / seconds if seconds > 0 else 0.0
+        print(
+            f"{self.count} scenarios ({self.errors} errors) in {seconds:.2f}s, "
+            f"{rate:.0f} scenarios/s",
+            file=self.stream,
+            flush=True,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m decide", description="Evaluate scenario files"
+    )
+    parser.add_argument("input", nargs="?", help="scenario file, stdin if omitted")
+    parser.add_argument("--format", choices=("jsonl", "csv"))
+    parser.add_argument(
+        "--configuration", help="JSON file of default parameters, LCM and PUV"
+    )
+    parser.add_argument("--workers", type=int, default=0, help="worker processes")
+    parser.add_argument(
+        "--stats", action="store_true", help="report throughput on stderr"
+    )
+    parser.add_argument(
+        "--large-input",
+        action="store_true",
+        help="accept scenarios of more than 100 points",
+    )
+    args = parser.parse_args(argv)
+
+    defaults = None
+    if args.configuration:
+        with open(args.configuration) as file:
+            defaults = json.load(file)
+    file_format = args.format
+    if file_format is None:
+        is_csv = args.input is not None and args.input.endswith(".csv")
+        file_format = "csv" if is_csv else "jsonl"
+
+    source = open(args.input, newline="") if args.input else sys.stdin
+    try:
+        read = read_csv if file_format == "csv" else read_jsonl
+        scenarios = read(source, defaults)
+        if args.workers > 1:
+            results = evaluate_parallel(
+                scenarios, args.workers, large_input=args.large_input
+            )
+        else:
+            results = (evaluate(scenario, args.large_input) for scenario in scenarios)
+        throughput = Throughput(sys.stderr) if args.stats else None
+        for result in results:
+            sys.stdout.write(json.dumps(result) + "\n")
+            if throughput:
+                throughput.add(result)
+        if throughput:
+            throughput.report()
+    except ValueError as error:
+        parser.exit(2, f"{parser.prog}: error: {error}\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
@@ -1,19 +1,235 @@
 import math
+from numbers import Real
+from types import SimpleNamespace
 
+from .bitmask import (
+    ALL,
+    BitVector,
+    ConnectorRow,
+    MatrixView,
+    compile_LCM,
+    fuv_from_pum,
+    pum_rows,
+    recompile_LCM_row,
+    to_list,
+    to_mask,
+)
+from .instrumentation import DecisionProfile
 from .lic import LIC
+from .planner import DecisionStats, DemandPlanner
+
+# Names of the numeric parameters of a decision, in the order of the specification
+PARAMETER_NAMES = (
+    "LENGTH1",
+    "RADIUS1",
+    "EPSILON",
+    "AREA1",
+    "LENGTH2",
+    "RADIUS2",
+    "AREA2",
+    "Q_PTS",
+    "QUADS",
+    "DIST",
+    "N_PTS",
+    "K_PTS",
+    "A_PTS",
+    "B_PTS",
+    "C_PTS",
+    "D_PTS",
+    "E_PTS",
+    "F_PTS",
+    "G_PTS",
+)
+
+CONNECTORS = ("ANDD", "ORR", "NOTUSED")
+
+
+def make_parameters(params):
+    """Parameter object for the LIC kernels from a mapping of parameter
+    names to values. Parameters that are not given default to 0, like on a
+    fresh Decide instance."""
+    unknown = set(params) - set(PARAMETER_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+    values = {name: 0 for name in PARAMETER_NAMES}
+    values.update(params)
+    return SimpleNamespace(**values)
+
+
+def check_LCM(value):
+    """Raise ValueError unless value is a 15x15 matrix of logical connectors."""
+    if (
+        len(value) != 15
+        or not all(len(row) == 15 for row in value)
+        or not all(connector in CONNECTORS for row in value for connector in row)
+    ):
+        raise ValueError(
+            'LCM must be a 15x15 matrix of "ANDD", "ORR" or "NOTUSED" entries'
+        )
+
+
+def check_PUV(value):
+    """Raise ValueError unless value is a vector of 15 booleans."""
+    if len(value) != 15 or not all(element in (True, False) for element in value):
+        raise ValueError("PUV must be a list of 15 boolean values")
+
+
+def _create_lic(engine, decide_instance):
+    """Instantiate the LIC implementation for the given engine name.
+    The NumPy engine is imported on demand to keep `import decide` light."""
+    if engine == "python":
+        return LIC(decide_instance)
+    if engine == "numpy":
+        from .lic_numpy import VectorizedLIC
+
+        return VectorizedLIC(decide_instance)
+    if engine == "summary":
+        from .summary import SummaryLIC
+
+        return SummaryLIC(decide_instance)
+    raise ValueError('engine must be "python", "numpy" or "summary"')
+
+
+def _as_point_array(value):
+    """Validate an array or buffer of coordinates and wrap it in a frozen
+    PointArray. Contiguous float64 data in read-only memory, such as a
+    track file, is not copied; data the caller can still change is copied
+    once, so that later changes cannot leave the engines' caches stale.
+    The module is imported on demand since it needs NumPy."""
+    if isinstance(value, str) or not (hasattr(value, "__array__") or _is_buffer(value)):
+        raise ValueError(
+            "POINTS must be a list of tuples, each containing exactly 2 elements"
+        )
+    from .points import PointArray
+
+    return PointArray(value).frozen()
+
+
+def _is_buffer(value):
+    """Whether value supports the buffer protocol."""
+    try:
+        memoryview(value)
+    except TypeError:
+        return False
+    return True
+
+
+class PointList(list):
+    """List of points that calls on_change() after every in-place change,
+    so that engines caching the geometry of the points can drop it."""
+
+    def __init__(self, points, on_change):
+        super().__init__(points)
+        self._on_change = on_change
+
+
+def _notifying(name):
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._on_change()
+        return result
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(PointList, _name, _notifying(_name))
+
+
+def _bit_vector(mask_name, known_name=None):
+    """Property exposing the bitmask attribute mask_name, with its mask of
+    known entries in known_name, as a list-like BitVector."""
+
+    def get(self):
+        known = ALL if known_name is None else getattr(self, known_name)
+        return getattr(self, mask_name), known
+
+    def put(self, mask, known):
+        setattr(self, mask_name, mask)
+        if known_name is not None:
+            setattr(self, known_name, known)
+
+    def getter(self):
+        return BitVector(lambda: get(self), lambda mask, known: put(self, mask, known))
+
+    def setter(self, values):
+        put(self, to_mask(values), to_mask(value is not None for value in values))
+
+    return property(getter, setter)
+
+
+def _run_stage(name, function):
+    return function()
 
 
 class Decide:
-    def __init__(self):
+    def __init__(
+        self,
+        exact=False,
+        engine=None,
+        large_input=False,
+        demand_driven=False,
+        instrumented=False,
+        cache=None,
+    ):
+        """Create a decision instance.
+
+        exact: evaluate circumcircles with SymPy instead of the float
+        kernels. SymPy is only imported when this mode is used.
+        engine: "python" evaluates the LICs with the reference LIC class,
+        "numpy" with the array-backed VectorizedLIC and "summary" with
+        SummaryLIC, which keeps the extrema of the points per gap so that
+        changing a threshold does not rescan them. Defaults to "numpy" in
+        the large input mode and to "python" otherwise.
+        large_input: lift the 100 point limit on NUMPOINTS and POINTS.
+        Requires the numpy engine, whose checks all run in linear memory.
+        demand_driven: let decide() evaluate only the LICs that the LCM and
+        PUV consult, stopping at the first False FUV entry. Entries of CMV,
+        PUM and FUV that were not needed are left as None.
+        instrumented: let decide() record a DecisionProfile of the time
+        spent per stage and per LIC, the points each LIC read and the
+        helper calls, available as `profile` afterwards.
+        cache: a DecisionCache that decide() consults first, so a decision
+        with the same points, parameters, LCM and PUV as a cached one is
+        restored instead of evaluated. Instrumented decisions bypass it.
+        """
+        if engine is None:
+            engine = "numpy" if large_input else "python"
+        self.exact = exact
+        self.large_input = large_input
+        self.demand_driven = demand_driven
+        self.instrumented = instrumented
+        self.cache = cache
+        self.stats = None  # DecisionStats of the last decide()
+        self.profile = None  # DecisionProfile of the last instrumented decide()
+        self._recording = None  # DecisionProfile being recorded
         self._NUMPOINTS = None
         self._POINTS = []  # List of planar data points
-        self._CMV = [False] * 15  # Conditions Met Vector
+        # The vectors are bitmasks with bit i for entry i, the PUM one
+        # bitmask per row. The *_known masks mark the entries that have been
+        # computed; the others read as None in the list views.
+        self._cmv, self._cmv_known = 0, ALL  # Conditions Met Vector
         self._LCM = [["NOTUSED"] * 15 for _ in range(15)]  # Logical Connector Matrix
-        self._PUM = [
-            [True for _ in range(15)] for _ in range(15)
-        ]  # Preliminary Unlocking Matrix
-        self._PUV = [False] * 15  # Preliminary Unlocking Vector
-        self._FUV = [False] * 15  # Final Unlocking Vector
+        self._pum = [ALL] * 15  # Preliminary Unlocking Matrix
+        self._pum_known = [ALL] * 15
+        self._puv = 0  # Preliminary Unlocking Vector
+        self._fuv, self._fuv_known = 0, ALL  # Final Unlocking Vector
         self._LAUNCH = "NO"
 
         # Parameters
@@ -37,7 +253,22 @@ class Decide:
         self.F_PTS = 0
         self.G_PTS = 0
 
-        self.LIC = LIC(self)
+        self.engine = engine
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @engine.setter
+    def engine(self, value):
+        if self.large_input and value != "numpy":
+            raise ValueError("the large input mode requires the numpy engine")
+        if self.exact and value != "python":
+            raise ValueError(
+                "exact arithmetic is only available with the python engine"
+            )
+        self.LIC = _create_lic(value, self)
+        self._engine = value
 
     @property
     def NUMPOINTS(self):
@@ -49,7 +280,10 @@ class Decide:
             raise AttributeError(
                 "NUMPOINTS is immutable and cannot be changed after it is set"
             )
-        if not isinstance(value, int) or not (2 <= value <= 100):
+        if self.large_input:
+            if not isinstance(value, int) or value < 2:
+                raise ValueError("NUMPOINTS must be an integer of at least 2")
+        elif not isinstance(value, int) or not (2 <= value <= 100):
             raise ValueError("NUMPOINTS must be an integer between 0 and 100")
         self._NUMPOINTS = value
 
@@ -59,38 +293,149 @@ class Decide:
 
     @POINTS.setter
     def POINTS(self, value):
-        if not isinstance(value, list) or not all(
-            isinstance(point, tuple) and len(point) == 2 for point in value
-        ):
+        if not isinstance(value, list):
+            # Arrays and buffers are validated in one pass by PointArray
+            value = _as_point_array(value)
+        elif not all(isinstance(point, tuple) and len(point) == 2 for point in value):
             raise ValueError(
                 "POINTS must be a list of tuples, each containing exactly 2 elements"
             )
-        if not all(
-            isinstance(coord, (int, float)) for point in value for coord in point
-        ):
+        elif not all(isinstance(coord, Real) for point in value for coord in point):
             raise ValueError(
                 "POINTS must contain only numeric coordinates (int or float)"
             )
         if self.NUMPOINTS is not None and len(value) != self.NUMPOINTS:
             raise ValueError("POINTS must have the same length as NUMPOINTS")
-        if not (2 <= len(value) <= 100):
+        if self.large_input:
+            if len(value) < 2:
+                raise ValueError("POINTS must contain at least 2 points")
+        elif not (2 <= len(value) <= 100):
             raise ValueError("POINTS must contain between 2 and 100 points")
 
+        if isinstance(value, list):
+            # A copy reporting in-place changes, so engine caches stay in step
+            value = PointList(value, self._points_changed)
         self._POINTS = value
+        self._points_changed()
         if self.NUMPOINTS is None:  # Set NUMPOINTS if it hasn't been set
             self.NUMPOINTS = len(value)
 
+    def _points_changed(self):
+        """Let the engine drop what it derived from the previous points."""
+        points_changed = getattr(self.LIC, "points_changed", None)
+        if points_changed is not None:
+            points_changed()
+
+    # List views of the bitmasks, for code that works with the vectors and
+    # matrices as lists of booleans
+    _CMV = _bit_vector("_cmv", "_cmv_known")
+    _PUV = _bit_vector("_puv")
+    _FUV = _bit_vector("_fuv", "_fuv_known")
+
+    @property
+    def _PUM(self):
+        # Row views, so that assigning an entry or a row updates the bitmasks
+        if "_pum_matrix" not in self.__dict__:
+            self._pum_matrix = MatrixView(self._pum_row, self._put_pum_row)
+        return self._pum_matrix
+
+    @_PUM.setter
+    def _PUM(self, rows):
+        self._pum = [to_mask(row) for row in rows]
+        self._pum_known = [to_mask(value is not None for value in row) for row in rows]
+
+    def _pum_row(self, index):
+        def put(mask, known):
+            self._pum[index], self._pum_known[index] = mask, known
+
+        return BitVector(lambda: (self._pum[index], self._pum_known[index]), put)
+
+    def _put_pum_row(self, index, row):
+        row = list(row)
+        self._pum[index] = to_mask(row)
+        self._pum_known[index] = to_mask(value is not None for value in row)
+
+    @property
+    def _LCM(self):
+        # Row views, so that assigning an entry or a row also compiles the
+        # row again
+        if "_lcm_matrix" not in self.__dict__:
+            self._lcm_matrix = MatrixView(self._lcm_row, self._put_lcm_row)
+        return self._lcm_matrix
+
+    @_LCM.setter
+    def _LCM(self, value):
+        self._lcm_rows = [list(row) for row in value]
+        self._lcm_masks = compile_LCM(self._lcm_rows)
+
+    def _lcm_row(self, index):
+        def put(column, connector):
+            row = list(self._lcm_rows[index])
+            row[column] = connector
+            self._put_lcm_row(index, row)
+
+        return ConnectorRow(self._lcm_rows[index], put)
+
+    def _put_lcm_row(self, index, row):
+        row = list(row)
+        if len(row) != 15 or not all(connector in CONNECTORS for connector in row):
+            raise ValueError(
+                'LCM must be a 15x15 matrix of "ANDD", "ORR" or "NOTUSED" entries'
+            )
+        self._lcm_rows[index][:] = row
+        self._lcm_masks = recompile_LCM_row(self._lcm_masks, index, row)
+
+    @property
+    def LCM(self):
+        return self._LCM
+
+    @LCM.setter
+    def LCM(self, value):
+        check_LCM(value)
+        self._LCM = value
+
+    @property
+    def PUV(self):
+        return self._PUV
+
+    @PUV.setter
+    def PUV(self, value):
+        check_PUV(value)
+        self._puv = to_mask(value)
+
+    @property
+    def CMV(self):
+        return self._CMV
+
+    @property
+    def PUM(self):
+        return self._PUM
+
+    @property
+    def FUV(self):
+        return self._FUV
+
+    @property
+    def LAUNCH(self):
+        return self._LAUNCH
+
     def calculate_CMV(self):
         """
         Compute the Conditions Met Vector (CMV).
 
         The CMV is a list of boolean values indicating whether each
-        of the 15 conditions (LIC 0 to LIC 14) is met.
+        of the 15 conditions (LIC 0 to LIC 14) is met. The conditions are
+        evaluated by the engine selected with `engine`.
         """
-        # Mapping of LIC indices to their corresponding evaluation methods
-        LIC_methods = [
-            # boilerplate code for LICs
-            # TODO: replace with actual LIC methods
+        cmv = 0
+        for index, LIC_method in enumerate(self.LIC_methods()):
+            if LIC_method():
+                cmv |= 1 << index
+        self._cmv, self._cmv_known = cmv, ALL
+
+    def LIC_methods(self):
+        """The evaluation methods of LIC 0 to LIC 14 of the selected engine."""
+        methods = [
             self.LIC.lic_0_check,
             self.LIC.lic_1_check,
             self.LIC.lic_2_check,
@@ -107,10 +452,12 @@ class Decide:
             self.LIC.lic_13_check,
             self.LIC.lic_14_check,
         ]
-
-        for index, LIC_method in enumerate(LIC_methods):
-            condition_met = LIC_method()
-            self._CMV[index] = condition_met
+        if self._recording is not None:
+            methods = [
+                self._recording.timed_lic(index, method, self)
+                for index, method in enumerate(methods)
+            ]
+        return methods
 
     def calculate_PUM(self):
         """
@@ -123,15 +470,12 @@ class Decide:
             - "ANDD": Logical AND between CMV[i] and CMV[j].
             - "ORR" : Logical OR between CMV[i] and CMV[j].
             - "NOTUSED": Always True, indicating no condition.
+
+        Each row is computed with bitwise operations from the CMV and the
+        row masks the LCM was compiled into.
         """
-        for i in range(15):
-            for j in range(15):
-                if self._LCM[i][j] == "ANDD":
-                    self._PUM[i][j] = self._CMV[i] and self._CMV[j]
-                elif self._LCM[i][j] == "ORR":
-                    self._PUM[i][j] = self._CMV[i] or self._CMV[j]
-                elif self._LCM[i][j] == "NOTUSED":
-                    self._PUM[i][j] = True
+        self._pum = pum_rows(self._cmv, self._lcm_masks)
+        self._pum_known = [ALL] * 15
 
     def calculate_FUV(self):
         """
@@ -146,11 +490,7 @@ class Decide:
             - If PUV[i] is True, FUV[i] is set to True only if all values in the corresponding
               row of PUM are True.
         """
-        for i in range(15):
-            if not self._PUV[i]:  # If PUV[i] is False, automatically set FUV[i] to True
-                self._FUV[i] = True
-            else:  # If PUV[i] is True, check the corresponding row in PUM
-                self._FUV[i] = all(self._PUM[i])
+        self._fuv, self._fuv_known = fuv_from_pum(self._pum, self._puv), ALL
 
     def decide(self):
         """
@@ -158,14 +498,60 @@ class Decide:
         This function evaluates CMV, PUM, and FUV and determines whether
         the launch is permitted.
         """
-        self.calculate_CMV()
-        self.calculate_PUM()
-        self.calculate_FUV()
+        if self.cache is not None and not self.instrumented:
+            return self.cache.decide(self)
+        return self._evaluate_decision()
+
+    def _evaluate_decision(self):
+        if not self.instrumented:
+            return self._decide(_run_stage)
+
+        profile = DecisionProfile()
+        self._recording = profile
+        try:
+            profile.stage("decide", lambda: self._decide(profile.stage))
+        finally:
+            self._recording = None
+        self.profile = profile
+        return self._LAUNCH
+
+    def _decide(self, stage):
+        """Run the stages of a decision through stage(name, function)."""
+        if self.demand_driven:
+            return stage("decide_on_demand", self.decide_on_demand)
+
+        stage("calculate_CMV", self.calculate_CMV)
+        stage("calculate_PUM", self.calculate_PUM)
+        stage("calculate_FUV", self.calculate_FUV)
 
         # If all values in the FUV are True, launch is permitted
-        self._LAUNCH = "YES" if all(self.FUV) else "NO"
+        self._LAUNCH = "YES" if self._fuv == ALL else "NO"
+        self.stats = DecisionStats(tuple(range(15)), 0, False)
+        return self._LAUNCH
+
+    def decide_on_demand(self):
+        """
+        Compute the launch decision evaluating only the LICs it depends on.
+        The LCM and PUV determine which CMV entries are consulted, they are
+        evaluated lazily, and evaluation stops once a FUV entry is False.
+        The work done is reported in `stats`.
+        """
+        methods = self.LIC_methods()
+        puv = to_list(self._puv)
+        planner = DemandPlanner(self._lcm_rows, puv)
+        cmv, pum, fuv, launch, self.stats = planner.run(
+            lambda index: methods[index](), puv
+        )
+        self._CMV, self._PUM, self._FUV = cmv, pum, fuv
+        self._LAUNCH = "YES" if launch else "NO"
         return self._LAUNCH
 
+    def compile_plan(self):
+        """
+        Compile the current parameters, LCM and PUV into a DecisionPlan
+        that decides for many point sets without re-reading them.
+        """
+        from .plan import compile_plan
 
-if __name__ == "__main__":
-    decide = Decide()
+        params = {name: getattr(self, name) for name in PARAMETER_NAMES}
+        return compile_plan(params, self._lcm_rows, self.PUV, self.large_input)
@@ -1,5 +1,4 @@
-from math import sqrt, acos, pi, fabs
-from sympy import Eq, solve, symbols
+from math import sqrt, acos, pi, fabs, inf, nextafter
 
 
 def calculate_distance(p1, p2):
@@ -19,10 +18,52 @@ def calculate_triangle_area(p1, p2, p3) -> float:
     return area
 
 
+def _circumcenter_offset(p1, p2, p3):
+    """Offset of the circumcenter from p1, using the determinant formula
+    on the triangle translated so that p1 is the origin.
+    Returns None when the points are collinear or coincide."""
+    bx, by = p2[0] - p1[0], p2[1] - p1[1]
+    cx, cy = p3[0] - p1[0], p3[1] - p1[1]
+    determinant = 2 * (bx * cy - by * cx)
+    if determinant == 0:  # Collinear or coinciding points ==> no circumcenter
+        return None
+    b_squared = bx * bx + by * by
+    c_squared = cx * cx + cy * cy
+    ux = (cy * b_squared - by * c_squared) / determinant
+    uy = (bx * c_squared - cx * b_squared) / determinant
+    return ux, uy
+
+
 def calculate_circumcenter(p1, p2, p3):
     """Calculate circumcenter of triangle.
-    Returns coordinates of circumcenter,
+    Returns coordinates of circumcenter as floats,
     otherwise None if input is not a triangle"""
+    offset = _circumcenter_offset(p1, p2, p3)
+    if offset is None:
+        return None
+    return (p1[0] + offset[0], p1[1] + offset[1])
+
+
+def calculate_circumradius(p1, p2, p3):
+    """Calculate circumradius of triangle.
+    Returns the radius as a float,
+    otherwise None if input is not a triangle"""
+    offset = _circumcenter_offset(p1, p2, p3)
+    if offset is None:
+        return None
+    return sqrt(offset[0] ** 2 + offset[1] ** 2)
+
+
+def calculate_circumcenter_exact(p1, p2, p3):
+    """Calculate circumcenter of triangle by solving the perpendicular
+    bisector equations with SymPy.
+    Returns coordinates of circumcenter as SymPy numbers,
+    otherwise None if input is not a triangle.
+    Reference implementation for calculate_circumcenter.
+    SymPy is imported on first use so that importing the package does not
+    depend on it."""
+    from sympy import Eq, solve, symbols
+
     (x_1, y_1), (x_2, y_2), (x_3, y_3) = p1, p2, p3
     midpoints = [
         ((x_1 + x_2) / 2, (y_1 + y_2) / 2),
@@ -58,6 +99,69 @@ def calculate_circumcenter(p1, p2, p3):
     return to_tuple
 
 
+def calculate_circumradius_exact(p1, p2, p3, circumcenter_exact=None):
+    """Calculate circumradius of triangle using the SymPy circumcenter,
+    from circumcenter_exact if given.
+    Returns the radius,
+    otherwise None if input is not a triangle"""
+    if circumcenter_exact is None:
+        circumcenter_exact = calculate_circumcenter_exact
+    circumcenter = circumcenter_exact(p1, p2, p3)
+    if circumcenter is None:
+        return None
+    return calculate_distance(circumcenter, p1)
+
+
+def _triangle_squares(p1, p2, p3):
+    """Squared sides |p1 p2|, |p1 p3| and |p2 p3| of the triangle, and its
+    doubled signed area."""
+    bx, by = p2[0] - p1[0], p2[1] - p1[1]
+    cx, cy = p3[0] - p1[0], p3[1] - p1[1]
+    dx, dy = p3[0] - p2[0], p3[1] - p2[1]
+    # Products rather than powers, which libm may round differently
+    return bx * bx + by * by, cx * cx + cy * cy, dx * dx + dy * dy, bx * cy - by * cx
+
+
+def _encloses_by_longest_side(a, b, c, cross):
+    """Whether the smallest circle around a triangle with squared sides a,
+    b and c and doubled signed area cross has the longest side as its
+    diameter: for right, obtuse, collinear and coinciding points."""
+    return cross == 0 or 2 * max(a, b, c) >= a + b + c
+
+
+def enclosing_radius_squared(p1, p2, p3):
+    """Squared radius of the smallest circle containing the three points.
+
+    For a right or obtuse triangle, or points that are collinear or
+    coincide, this is a quarter of the longest squared side; for an acute
+    triangle, the squared circumradius a * b * c / (4 * cross**2).
+    lic_numpy.triangle_squared_enclosing_radii computes the same floats
+    on arrays.
+    """
+    a, b, c, cross = _triangle_squares(p1, p2, p3)
+    if _encloses_by_longest_side(a, b, c, cross):
+        return max(a, b, c) / 4
+    return (a / cross) * (b / cross) * c / 4
+
+
+def calculate_enclosing_radius(p1, p2, p3):
+    """Radius of the smallest circle containing the three points, the
+    points lying inside or on it."""
+    return sqrt(enclosing_radius_squared(p1, p2, p3))
+
+
+def calculate_enclosing_radius_exact(p1, p2, p3, circumradius_exact=None):
+    """Like calculate_enclosing_radius, with the circumradius of acute
+    triangles computed from the SymPy circumcenter, by circumradius_exact
+    if given."""
+    a, b, c, cross = _triangle_squares(p1, p2, p3)
+    if _encloses_by_longest_side(a, b, c, cross):
+        return sqrt(max(a, b, c)) / 2
+    if circumradius_exact is None:
+        circumradius_exact = calculate_circumradius_exact
+    return circumradius_exact(p1, p2, p3)
+
+
 def calculate_angle(p1, p2, p3):
     """function that allows to calculate the angle given the three point.
     The second point is the vertex of the angle
@@ -73,5 +177,47 @@ def calculate_angle(p1, p2, p3):
         return None
 
     cos_angle = scalar_product / (norm_v1 * norm_v2)
+    # Rounding can push the cosine of (anti)parallel vectors just past +-1
+    cos_angle = max(-1.0, min(1.0, cos_angle))
     angle = acos(cos_angle)
     return angle
+
+
+def calculate_quadrant(point):
+    """Quadrant (1 to 4) of a point, or 0 for no quadrant. Points on the
+    positive axes and the origin are in quadrant 1, points on the negative
+    x-axis or the negative y-axis are in no quadrant.
+    This function is used for calculate LIC 4."""
+    x, y = point
+    if x >= 0 and y >= 0:
+        return 1
+    elif x < 0 and y > 0:
+        return 2
+    elif x < 0 and y < 0:
+        return 3
+    elif x > 0 and y < 0:
+        return 4
+    return 0
+
+
+def square_threshold(limit, strict=True):
+    """Smallest float s such that sqrt(s) > limit (sqrt(s) >= limit unless
+    strict). For an infinite limit this is infinity, for NaN it is NaN.
+
+    sqrt is monotonic, so sqrt(s) > limit exactly when s >= the threshold,
+    and a length can be compared with limit through its square without
+    taking the root and without rounding differences.
+    """
+
+    def above(square):
+        return sqrt(square) > limit if strict else sqrt(square) >= limit
+
+    if limit != limit or limit == inf:
+        return limit
+    bound = max(limit, 0.0)
+    square = bound * bound
+    while square > 0 and above(nextafter(square, 0)):
+        square = nextafter(square, 0)
+    while not above(square):
+        square = nextafter(square, inf)
+    return square
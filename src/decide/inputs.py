@@ -0,0 +1,19 @@
+"""Parsing of the points of JSON requests and scenarios, shared by the
+command line and the daemon without importing either."""
+
+from numbers import Real
+
+
+def parse_points(value):
+    """List of (x, y) tuples from the points of a JSON request."""
+    if not isinstance(value, list) or not all(
+        isinstance(point, list) and len(point) == 2 for point in value
+    ):
+        raise ValueError("points must be a list of [x, y] pairs")
+    if not all(
+        isinstance(coord, Real) and not isinstance(coord, bool)
+        for point in value
+        for coord in point
+    ):
+        raise ValueError("points must contain only numeric coordinates")
+    return [tuple(point) for point in value]
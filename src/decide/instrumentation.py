@@ -0,0 +1,138 @@
+from collections.abc import Sequence
+from functools import partial
+from time import perf_counter
+from types import SimpleNamespace
+
+from . import helpers
+from .lic import HELPERS, LIC
+
+
+class CountingPoints(Sequence):
+    """Read-only view of a point list that counts the points read and the
+    highest index reached, which shows how far a check scanned."""
+
+    def __init__(self, points):
+        self.points = points
+        self.reads = 0
+        self.extent = 0
+
+    def __len__(self):
+        return len(self.points)
+
+    def __getitem__(self, index):
+        point = self.points[index]
+        self.reads += 1
+        if index < 0:
+            index += len(self.points)
+        self.extent = max(self.extent, index + 1)
+        return point
+
+
+class _CountingView:
+    """The attributes of a Decide instance, with POINTS replaced by a
+    CountingPoints view, for an LIC to run one check on."""
+
+    def __init__(self, decide_instance, points):
+        self._decide = decide_instance
+        self.POINTS = points
+
+    def __getattr__(self, name):
+        return getattr(self._decide, name)
+
+
+class DecisionProfile:
+    """Timings and counters of one instrumented decision.
+
+    stage_seconds: wall time of "decide" and of its stages, calculate_CMV,
+    calculate_PUM and calculate_FUV, or decide_on_demand
+    lic_seconds: wall time of each LIC, None for LICs that were not evaluated
+    points_read: number of points each LIC read, and scan_extent: one past
+    the highest point index it read. Both are only recorded for the python
+    engine, whose checks read the points one at a time and stop early.
+    helper_calls, helper_seconds: calls of and time spent in each helper,
+    also only for the python engine
+    """
+
+    def __init__(self):
+        self.stage_seconds = {}
+        self.lic_seconds = [None] * 15
+        self.points_read = [None] * 15
+        self.scan_extent = [None] * 15
+        self.helper_calls = {}
+        self.helper_seconds = {}
+        self._helpers = None
+
+    def stage(self, name, function):
+        """Run function() and record its wall time under name."""
+        start = perf_counter()
+        try:
+            return function()
+        finally:
+            self.stage_seconds[name] = perf_counter() - start
+
+    def timed_lic(self, index, method, decide_instance):
+        """Wrap an LIC method so that its time is recorded. With the python
+        engine the check runs on an LIC of its own, reading the points
+        through a CountingPoints view and calling the counting helpers, so
+        neither the instance nor the helper modules are changed."""
+
+        def timed():
+            counting = decide_instance.engine == "python"
+            check = method
+            if counting:
+                points = CountingPoints(decide_instance.POINTS)
+                lic = LIC(_CountingView(decide_instance, points), self.helpers)
+                check = getattr(lic, method.__name__)
+            start = perf_counter()
+            try:
+                return check()
+            finally:
+                self.lic_seconds[index] = perf_counter() - start
+                if counting:
+                    self.points_read[index] = points.reads
+                    self.scan_extent[index] = points.extent
+
+        return timed
+
+    @property
+    def helpers(self):
+        """The LIC helpers, counting their calls in this profile. The SymPy
+        circumradius and circumcenter that the exact enclosing radius calls
+        in turn are counted as well."""
+        if self._helpers is None:
+            counted = {
+                name: self._counted(name, function)
+                for name, function in vars(HELPERS).items()
+            }
+            circumcenter = self._counted(
+                "calculate_circumcenter_exact", helpers.calculate_circumcenter_exact
+            )
+            circumradius = self._counted(
+                "calculate_circumradius_exact",
+                partial(
+                    helpers.calculate_circumradius_exact,
+                    circumcenter_exact=circumcenter,
+                ),
+            )
+            counted["calculate_enclosing_radius_exact"] = self._counted(
+                "calculate_enclosing_radius_exact",
+                partial(
+                    HELPERS.calculate_enclosing_radius_exact,
+                    circumradius_exact=circumradius,
+                ),
+            )
+            self._helpers = SimpleNamespace(**counted)
+        return self._helpers
+
+    def _counted(self, name, function):
+        def counted(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.helper_calls[name] = self.helper_calls.get(name, 0) + 1
+                self.helper_seconds[name] = (
+                    self.helper_seconds.get(name, 0.0) + perf_counter() - start
+                )
+
+        return counted
@@ -1,18 +1,47 @@
+from collections import deque
 from math import sqrt, pi
+from types import SimpleNamespace
 
 from .helpers import (
     calculate_distance,
     calculate_triangle_area,
-    calculate_circumcenter,
+    calculate_enclosing_radius,
+    calculate_enclosing_radius_exact,
     calculate_angle,
+    calculate_quadrant,
+)
+
+
+# The helpers the checks call, looked up on the LIC instance so that a
+# profiler can pass counting versions of them
+HELPERS = SimpleNamespace(
+    calculate_distance=calculate_distance,
+    calculate_triangle_area=calculate_triangle_area,
+    calculate_enclosing_radius=calculate_enclosing_radius,
+    calculate_enclosing_radius_exact=calculate_enclosing_radius_exact,
+    calculate_angle=calculate_angle,
+    calculate_quadrant=calculate_quadrant,
 )
 
 
 class LIC:
-    """Class encapsulating all Launch Interceptor Conditions (LICs)."""
+    """Class encapsulating all Launch Interceptor Conditions (LICs).
 
-    def __init__(self, decide_instance):
+    The checks read the points and parameters of decide_instance and call
+    the geometry helpers through `helpers`, HELPERS unless given.
+    """
+
+    def __init__(self, decide_instance, helpers=HELPERS):
         self.decide = decide_instance
+        self.helpers = helpers
+
+    def _enclosing_radius(self, p1, p2, p3):
+        """Radius of the smallest circle containing the three points, with
+        the circumradius computed by SymPy when the Decide instance runs in
+        exact arithmetic mode."""
+        if self.decide.exact:
+            return self.helpers.calculate_enclosing_radius_exact(p1, p2, p3)
+        return self.helpers.calculate_enclosing_radius(p1, p2, p3)
 
     def lic_0_check(self):
         """Function for checking requirement LIC 0. Returns True
@@ -23,14 +52,14 @@ class LIC:
         for index in range(len(self.decide.POINTS) - 1):
             p1 = self.decide.POINTS[index]
             p2 = self.decide.POINTS[index + 1]
-            dist = calculate_distance(p1, p2)
+            dist = self.helpers.calculate_distance(p1, p2)
             if dist > self.decide.LENGTH1:
                 return True
         return False
 
     def lic_1_check(self):
         """Function for checking requirement LIC 1. Returns True
-        if there exists 3 consecutive points that cannot fit within
+        if there exists 3 consecutive points that cannot fit within or on
         a circle of radius radius1, False otherwise.
         """
         if len(self.decide.POINTS) < 3:
@@ -41,15 +70,7 @@ class LIC:
                 self.decide.POINTS[index + 1],
                 self.decide.POINTS[index + 2],
             )
-            dist1 = calculate_distance(p1, p2) > 2 * self.decide.RADIUS1
-            dist2 = calculate_distance(p1, p3) > 2 * self.decide.RADIUS1
-            dist3 = calculate_distance(p2, p3) > 2 * self.decide.RADIUS1
-            if dist1 or dist2 or dist3:
-                return True
-            circumcenter = calculate_circumcenter(p1, p2, p3)
-            if circumcenter is None:
-                continue
-            if calculate_distance(circumcenter, p1) > self.decide.RADIUS1:
+            if self._enclosing_radius(p1, p2, p3) > self.decide.RADIUS1:
                 return True
         return False
 
@@ -66,7 +87,7 @@ class LIC:
                 self.decide.POINTS[i + 1],
                 self.decide.POINTS[i + 2],
             )
-            angle = calculate_angle(p1, p2, p3)
+            angle = self.helpers.calculate_angle(p1, p2, p3)
 
             if angle == None:
                 continue
@@ -85,7 +106,7 @@ class LIC:
                 self.decide.POINTS[i + 1],
                 self.decide.POINTS[i + 2],
             )
-            area = calculate_triangle_area(p1, p2, p3)
+            area = self.helpers.calculate_triangle_area(p1, p2, p3)
 
             """if the area is 0, the points are aligned"""
             if area == 0:
@@ -98,25 +119,30 @@ class LIC:
     def lic_4_check(self):
         """function that checks the LIC 4. Returns True if there exists at least one set
         of q_pts consecutive data points that lie in more than quads quadrants.
+        The window slides one point at a time and keeps its number of points per
+        quadrant, so each step costs O(1) instead of O(q_pts).
         """
 
         if self.decide.Q_PTS <= 0 or len(self.decide.POINTS) < self.decide.Q_PTS:
             return False
 
-        for i in range(len(self.decide.POINTS) - self.decide.Q_PTS + 1):
-            quadrants = set()
-            for j in range(i, i + self.decide.Q_PTS):
-                x, y = self.decide.POINTS[j]
-                if x >= 0 and y >= 0:
-                    quadrants.add(1)
-                elif x < 0 and y > 0:
-                    quadrants.add(2)
-                elif x < 0 and y < 0:
-                    quadrants.add(3)
-                elif x > 0 and y < 0:
-                    quadrants.add(4)
-
-            if len(quadrants) > self.decide.QUADS:
+        window = deque()  # Quadrants of the points in the window
+        counts = [0] * 5  # Points in the window per quadrant, 0 for no quadrant
+        distinct = 0  # Quadrants 1 to 4 with points in the window
+        for point in self.decide.POINTS:
+            quadrant = self.helpers.calculate_quadrant(point)
+            window.append(quadrant)
+            if quadrant and counts[quadrant] == 0:
+                distinct += 1
+            counts[quadrant] += 1
+
+            if len(window) > self.decide.Q_PTS:
+                leaving = window.popleft()
+                counts[leaving] -= 1
+                if leaving and counts[leaving] == 0:
+                    distinct -= 1
+
+            if len(window) == self.decide.Q_PTS and distinct > self.decide.QUADS:
                 return True
 
         return False
@@ -156,7 +182,7 @@ class LIC:
             if p1 == p2:
                 for j in range(i + 1, i + self.decide.N_PTS - 1):
                     p = self.decide.POINTS[j]
-                    distance_calculated = calculate_distance(p1, p)
+                    distance_calculated = self.helpers.calculate_distance(p1, p)
                     if distance_calculated > self.decide.DIST:
                         return True
 
@@ -187,7 +213,7 @@ class LIC:
         for index in range(len(self.decide.POINTS) - self.decide.K_PTS - 1):
             p1 = self.decide.POINTS[index]
             p2 = self.decide.POINTS[index + self.decide.K_PTS + 1]
-            distance = calculate_distance(p1, p2)
+            distance = self.helpers.calculate_distance(p1, p2)
             if distance > self.decide.LENGTH1:
                 return True
         return False
@@ -213,26 +239,7 @@ class LIC:
             p2 = self.decide.POINTS[i + self.decide.A_PTS + 1]
             p3 = self.decide.POINTS[i + self.decide.A_PTS + self.decide.B_PTS + 2]
 
-            dist1 = calculate_distance(p1, p2)
-            dist2 = calculate_distance(p3, p1)
-            dist3 = calculate_distance(p3, p2)
-
-            if max(dist1, dist2, dist3) > 2 * self.decide.RADIUS1:
-                return True
-
-            semi_perimeter = (dist1 + dist2 + dist3) / 2
-            area = sqrt(
-                semi_perimeter
-                * (semi_perimeter - dist1)
-                * (semi_perimeter - dist2)
-                * (semi_perimeter - dist3)
-            )
-
-            if area == 0:
-                continue
-
-            circum_radius = (dist1 * dist2 * dist3) / (4 * area)
-            if circum_radius > self.decide.RADIUS1:
+            if self._enclosing_radius(p1, p2, p3) > self.decide.RADIUS1:
                 return True
 
         return False
@@ -256,7 +263,7 @@ class LIC:
                 self.decide.POINTS[index + self.decide.C_PTS + 1],
                 self.decide.POINTS[index + self.decide.C_PTS + self.decide.D_PTS + 2],
             )
-            angle = calculate_angle(p1, p2, p3)
+            angle = self.helpers.calculate_angle(p1, p2, p3)
             if angle is None:
                 continue
             if abs(angle - pi) > self.decide.EPSILON:
@@ -294,7 +301,7 @@ class LIC:
             p3 = self.decide.POINTS[index + self.decide.E_PTS + self.decide.F_PTS + 2]
 
             # Using following formula: 1/2 |x_1(y_2 - y_3) + x_2(y_3 - y_1) + x_3(y_1 - y_2)|
-            area_triangle = calculate_triangle_area(p1, p2, p3)
+            area_triangle = self.helpers.calculate_triangle_area(p1, p2, p3)
 
             if area_triangle > self.decide.AREA1:
                 # Found a match
@@ -362,7 +369,7 @@ class LIC:
             p1 = self.decide.POINTS[index]
             p2 = self.decide.POINTS[index + self.decide.K_PTS + 1]
 
-            dist = calculate_distance(p1, p2)
+            dist = self.helpers.calculate_distance(p1, p2)
 
             if not larger_than_length1 and dist > self.decide.LENGTH1:
                 larger_than_length1 = True
@@ -405,35 +412,10 @@ class LIC:
                 self.decide.POINTS[index + self.decide.A_PTS + 1],
                 self.decide.POINTS[index + self.decide.A_PTS + self.decide.B_PTS + 2],
             )
-            distances = [
-                calculate_distance(p1, p2),
-                calculate_distance(p1, p3),
-                calculate_distance(p2, p3),
-            ]
-            max_distance = max(distances)
-            if max_distance > 2 * self.decide.RADIUS1:
-                condition_a = True
-            if max_distance <= 2 * self.decide.RADIUS2:
-                max_index = distances.index(max_distance)
-                if max_index == 0:
-                    center = ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
-                    if calculate_distance(center, p3) <= 2 * self.decide.RADIUS2:
-                        condition_b = True
-                elif max_index == 1:
-                    center = ((p1[0] + p3[0]) / 2, (p1[1] + p3[1]) / 2)
-                    if calculate_distance(center, p2) <= 2 * self.decide.RADIUS2:
-                        condition_b = True
-                else:
-                    center = ((p2[0] + p3[0]) / 2, (p2[1] + p3[1]) / 2)
-                    if calculate_distance(center, p1) <= 2 * self.decide.RADIUS2:
-                        condition_b = True
-            circumcenter = calculate_circumcenter(p1, p2, p3)
-            if circumcenter is None:
-                continue
-            circumradius = calculate_distance(circumcenter, p1)
-            if circumradius > self.decide.RADIUS1:
+            radius = self._enclosing_radius(p1, p2, p3)
+            if radius > self.decide.RADIUS1:
                 condition_a = True
-            if circumradius < self.decide.RADIUS2:
+            if radius <= self.decide.RADIUS2:
                 condition_b = True
             if condition_a and condition_b:
                 return True
@@ -469,7 +451,7 @@ class LIC:
             p2 = self.decide.POINTS[j]
             p3 = self.decide.POINTS[k]
 
-            area = calculate_triangle_area(p1, p2, p3)
+            area = self.helpers.calculate_triangle_area(p1, p2, p3)
 
             if not condition_a_met and area > self.decide.AREA1:
                 condition_a_met = True
@@ -0,0 +1,736 @@
+from collections import OrderedDict
+from functools import lru_cache
+from math import pi
+
+import numpy as np
+
+from .helpers import square_threshold
+
+# Squared thresholds of the length, radius and diameter parameters, computed
+# once per value rather than by every kernel call
+squared_threshold = lru_cache(maxsize=1024)(square_threshold)
+
+
+def _window(values, offset, count):
+    """View of `count` consecutive entries starting at `offset`."""
+    return values[..., offset : offset + count]
+
+
+def _window_axis(values, offset, count):
+    """Like _window, along the second to last axis."""
+    return values[..., offset : offset + count, :]
+
+
+def _window_count(n, last_offset):
+    """Number of windows whose last point lies `last_offset` after the first."""
+    return max(n - last_offset, 0)
+
+
+def pair_squared_distances(x, y, offset):
+    """Squared distances between every point and the point `offset`
+    positions later."""
+    count = _window_count(x.shape[-1], offset)
+    dx = _window(x, offset, count) - _window(x, 0, count)
+    dy = _window(y, offset, count) - _window(y, 0, count)
+    # In place, with the rounding of dx**2 + dy**2
+    np.multiply(dx, dx, out=dx)
+    np.multiply(dy, dy, out=dy)
+    return np.add(dx, dy, out=dx)
+
+
+def pair_distances(x, y, offset):
+    """Distances between every point and the point `offset` positions later."""
+    return np.sqrt(pair_squared_distances(x, y, offset))
+
+
+def pair_x_deltas(x, offset):
+    """X[j] - X[i] for every pair of points `offset` positions apart."""
+    count = _window_count(x.shape[-1], offset)
+    return _window(x, offset, count) - _window(x, 0, count)
+
+
+def _triple(x, y, offset1, offset2):
+    """Coordinates of the triples (i, i + offset1, i + offset2)."""
+    count = _window_count(x.shape[-1], offset2)
+    return (
+        _window(x, 0, count),
+        _window(y, 0, count),
+        _window(x, offset1, count),
+        _window(y, offset1, count),
+        _window(x, offset2, count),
+        _window(y, offset2, count),
+    )
+
+
+def triangle_doubled_areas(x, y, offset1, offset2):
+    """Twice the areas of the triangles (i, i + offset1, i + offset2): the
+    absolute cross product, without the halving of triangle_areas."""
+    return triple_doubled_areas(*_triple(x, y, offset1, offset2))
+
+
+def triple_doubled_areas(x1, y1, x2, y2, x3, y3):
+    """Twice the areas of the triangles with the given vertex coordinates."""
+    # x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2), in place
+    cross = np.subtract(y2, y3)
+    cross *= x1
+    term = np.subtract(y3, y1)
+    term *= x2
+    cross += term
+    np.subtract(y1, y2, out=term)
+    term *= x3
+    cross += term
+    return np.abs(cross, out=cross)
+
+
+def triangle_areas(x, y, offset1, offset2):
+    """Areas of the triangles (i, i + offset1, i + offset2)."""
+    return 0.5 * triangle_doubled_areas(x, y, offset1, offset2)
+
+
+def triangle_angles(x, y, offset1, offset2):
+    """Angles at the middle vertex of the triples (i, i + offset1, i + offset2).
+    NaN where the middle vertex coincides with one of the others."""
+    return triple_angles(*_triple(x, y, offset1, offset2))
+
+
+def triple_angles(x1, y1, x2, y2, x3, y3):
+    """Angles at the second vertex of the triples with the given coordinates."""
+    v1x, v1y = x1 - x2, y1 - y2
+    v2x, v2y = x3 - x2, y3 - y2
+    scalar_product = v1x * v2x + v1y * v2y
+    norms = np.sqrt(v1x**2 + v1y**2) * np.sqrt(v2x**2 + v2y**2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_angle = np.where(norms == 0, np.nan, scalar_product / norms)
+    return np.arccos(np.clip(cos_angle, -1.0, 1.0))
+
+
+def triangle_squared_enclosing_radii(x, y, offset1, offset2):
+    """Squared radii of the smallest circles containing the triples
+    (i, i + offset1, i + offset2), computed with the same floats as
+    helpers.enclosing_radius_squared: a quarter of the longest squared
+    side for right, obtuse, collinear or coinciding points, the squared
+    circumradius for acute triangles."""
+    return triple_squared_enclosing_radii(*_triple(x, y, offset1, offset2))
+
+
+def triple_squared_enclosing_radii(x1, y1, x2, y2, x3, y3):
+    """Squared enclosing radii of the triples with the given coordinates."""
+    bx, by = x2 - x1, y2 - y1
+    cx, cy = x3 - x1, y3 - y1
+    cross = bx * cy
+    cross -= by * cx
+    # Squared sides in place of the coordinate differences
+    a, b, c = bx, cx, x3 - x2
+    dy = y3 - y2
+    for side, other in ((a, by), (b, cy), (c, dy)):
+        side *= side
+        other *= other
+        side += other
+    longest = np.maximum(a, b)
+    np.maximum(longest, c, out=longest)
+    total = a + b
+    total += c
+    by_longest_side = 2 * longest >= total
+    by_longest_side |= cross == 0
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # (a / cross) * (b / cross) * c / 4
+        squared = a / cross
+        squared *= np.divide(b, cross, out=total)
+        squared *= c
+    squared /= 4
+    longest /= 4
+    np.copyto(squared, longest, where=by_longest_side)
+    return squared
+
+
+def quadrant_memberships(x, y):
+    """One-hot quadrant membership of every point, shape (..., n, 4).
+    Follows the tie-breaking of LIC.lic_4_check: points on the positive
+    axes and the origin belong to quadrant 1, points on the negative
+    x-axis or the negative y-axis belong to no quadrant."""
+    return np.stack(
+        [
+            (x >= 0) & (y >= 0),
+            (x < 0) & (y > 0),
+            (x < 0) & (y < 0),
+            (x > 0) & (y < 0),
+        ],
+        axis=-1,
+    )
+
+
+def window_quadrant_counts(x, y, q_pts):
+    """Number of distinct quadrants in every window of q_pts consecutive points."""
+    memberships = quadrant_memberships(x, y).astype(np.int64)
+    cumulative = np.cumsum(memberships, axis=-2)
+    zeros = np.zeros_like(cumulative[..., :1, :])
+    cumulative = np.concatenate([zeros, cumulative], axis=-2)
+    count = _window_count(x.shape[-1], q_pts - 1)
+    in_window = _window_axis(cumulative, q_pts, count) - _window_axis(
+        cumulative, 0, count
+    )
+    return np.count_nonzero(in_window, axis=-1)
+
+
+def sliding_maxima(values, width):
+    """Maximum of every run of `width` consecutive entries along the last
+    axis, in O(n) whatever the width (van Herk / Gil-Werman). The entries
+    are cut into blocks of `width`; every run covers the end of one block
+    and the start of the next, whose running maxima are precomputed."""
+    n = values.shape[-1]
+    count = _window_count(n, width - 1)
+    blocks = -(-n // width)
+    padded = np.full(values.shape[:-1] + (blocks, width), -np.inf)
+    padded.reshape(values.shape[:-1] + (-1,))[..., :n] = values
+    prefix = np.maximum.accumulate(padded, axis=-1)
+    suffix = np.flip(np.maximum.accumulate(np.flip(padded, -1), axis=-1), -1)
+    prefix = prefix.reshape(values.shape[:-1] + (-1,))
+    suffix = suffix.reshape(values.shape[:-1] + (-1,))
+    return np.maximum(_window(suffix, 0, count), _window(prefix, width - 1, count))
+
+
+# Unit directions whose sliding maxima bound the interior of LIC 6 windows
+BOUND_DIRECTIONS = 16
+# Windows of up to this many interior points are evaluated directly
+DIRECT_INTERIOR_POINTS = 64
+# Interior points evaluated for every long window before the bound is used
+SAMPLED_OFFSETS = 8
+# Relative cost of evaluating a window's interior point by point through
+# gathered coordinates instead of in place
+GATHER_COST = 8
+
+
+def interior_distances_exceed(x, y, n_pts, dist):
+    """Whether an interior point of each window of n_pts consecutive points
+    lies further than dist from the line joining the window's first and
+    last point, or from that point when first and last coincide.
+
+    Long windows are settled in three steps. A few interior points spread
+    over each window find most of the windows that are met. The others
+    are bounded in O(n) whatever n_pts is (see _interior_distance_bounds),
+    and only those whose bound exceeds dist are evaluated point by point.
+    When either step leaves too many windows, the remaining offsets are
+    evaluated in place like for short windows. All results come from the
+    same arithmetic, so they do not depend on the path taken.
+
+    The bound exceeds a window's largest distance by up to about a tenth
+    of its chord (tan(pi / BOUND_DIRECTIONS) / 2 of it), when the line's
+    normal falls between two directions. On tracks where most windows
+    come that close to dist without exceeding it, such as a zigzag at an
+    angle with dist equal to its amplitude, nearly all windows remain and
+    the cost is that of one pass per interior offset, O(n * n_pts): about
+    4 s for 100,000 points and n_pts = 2000 (benchmarks/bench_lic6.py
+    --track zigzag).
+    """
+    count = _window_count(x.shape[-1], n_pts - 1)
+    interior = n_pts - 2
+    if interior <= DIRECT_INTERIOR_POINTS or count == 0:
+        return _interior_distances_exceed_direct(x, y, n_pts, dist)
+
+    ends = _window(x, 0, count), _window(y, 0, count)
+    ends += _window(x, n_pts - 1, count), _window(y, n_pts - 1, count)
+    met = np.zeros(ends[0].shape, dtype=bool)
+    sampled = np.unique(np.linspace(1, interior, SAMPLED_OFFSETS).astype(int))
+    for offset in sampled:
+        point = _window(x, offset, count), _window(y, offset, count)
+        met |= _distances_exceed(*ends, *point, dist)
+
+    if np.count_nonzero(met) * 2 < met.size:
+        bounds, slack = _interior_distance_bounds(x, y, n_pts, count)
+        candidates = ~met & ~(bounds + slack <= dist)  # NaN bounds included
+        if np.count_nonzero(candidates) * GATHER_COST <= met.size:
+            _gathered_distances_exceed(x, y, n_pts, dist, candidates, met)
+            return met
+
+    for offset in np.setdiff1d(np.arange(1, n_pts - 1), sampled):
+        point = _window(x, offset, count), _window(y, offset, count)
+        met |= _distances_exceed(*ends, *point, dist)
+    return met
+
+
+def _interior_distance_bounds(x, y, n_pts, count):
+    """Upper bounds of the LIC 6 distances of every window, and the slack
+    to add for rounding.
+
+    The sliding maxima of the interior points' projections on
+    BOUND_DIRECTIONS unit directions give their support in those
+    directions relative to the window's first point. The window's unit
+    normal lies between two of the directions, so its support is at most
+    a positive combination of theirs; with coincident endpoints every
+    direction is within half a step of one of them.
+    """
+    interior = n_pts - 2
+    x1, y1 = _window(x, 0, count), _window(y, 0, count)
+    x2, y2 = _window(x, n_pts - 1, count), _window(y, n_pts - 1, count)
+    step = 2 * pi / BOUND_DIRECTIONS
+    angles = step * np.arange(BOUND_DIRECTIONS)
+    support = np.stack(
+        [
+            _window(sliding_maxima(c * x[..., 1:] + s * y[..., 1:], interior), 0, count)
+            - (c * x1 + s * y1)
+            for c, s in zip(np.cos(angles), np.sin(angles))
+        ]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bounds = np.full(x1.shape, -np.inf)
+        for sign in (1, -1):
+            phi = np.arctan2(sign * (x2 - x1), -sign * (y2 - y1)) % (2 * pi)
+            j = np.nan_to_num(phi // step).astype(np.int64) % BOUND_DIRECTIONS
+            lower = np.take_along_axis(support, j[None], 0)[0]
+            upper = np.take_along_axis(support, (j + 1)[None] % BOUND_DIRECTIONS, 0)
+            alpha = np.sin((j + 1) * step - phi) / np.sin(step)
+            beta = np.sin(phi - j * step) / np.sin(step)
+            np.maximum(bounds, alpha * lower + beta * upper[0], out=bounds)
+        coincident = (x1 == x2) & (y1 == y2)
+        bounds = np.where(coincident, support.max(axis=0) / np.cos(step / 2), bounds)
+        bounds[~np.isfinite(x1 + y1 + x2 + y2)] = np.inf
+    slack = 1e-9 * (np.abs(x1) + np.abs(y1) + np.abs(support).max(axis=0) + 1)
+    return bounds, slack
+
+
+def _gathered_distances_exceed(x, y, n_pts, dist, candidates, met):
+    """Evaluate the candidate windows point by point through gathered
+    coordinates, dropping each window once it is met, and set met."""
+    count = candidates.shape[-1]
+    flat_x, flat_y = x.reshape(-1, x.shape[-1]), y.reshape(-1, y.shape[-1])
+    rows, starts = np.nonzero(candidates.reshape(-1, count))
+    ends = starts + n_pts - 1
+    ends = (
+        flat_x[rows, starts],
+        flat_y[rows, starts],
+        flat_x[rows, ends],
+        flat_y[rows, ends],
+    )
+    for offset in range(1, n_pts - 1):
+        if len(rows) == 0:
+            break
+        point = flat_x[rows, starts + offset], flat_y[rows, starts + offset]
+        exceeds = _distances_exceed(*ends, *point, dist)
+        met.reshape(-1, count)[rows[exceeds], starts[exceeds]] = True
+        keep = ~exceeds
+        rows, starts = rows[keep], starts[keep]
+        ends = tuple(end[keep] for end in ends)
+
+
+def _interior_distances_exceed_direct(x, y, n_pts, dist):
+    """interior_distances_exceed with one pass per interior offset."""
+    count = _window_count(x.shape[-1], n_pts - 1)
+    ends = _window(x, 0, count), _window(y, 0, count)
+    ends += _window(x, n_pts - 1, count), _window(y, n_pts - 1, count)
+    met = np.zeros(ends[0].shape, dtype=bool)
+    for offset in range(1, n_pts - 1):
+        point = _window(x, offset, count), _window(y, offset, count)
+        met |= _distances_exceed(*ends, *point, dist)
+    return met
+
+
+def _distances_exceed(x1, y1, x2, y2, px, py, dist):
+    """Whether p lies further than dist from the line through the first
+    and last point, or from the first point when they coincide."""
+    coincident = (x1 == x2) & (y1 == y2)
+    chord = np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        line_distance = np.abs((x2 - x1) * (y1 - py) - (x1 - px) * (y2 - y1)) / chord
+    point_distance = np.sqrt((px - x1) ** 2 + (py - y1) ** 2)
+    return np.where(coincident, point_distance, line_distance) > dist
+
+
+class PrimitiveStore:
+    """Geometric primitives of one set of coordinates, shared by the LIC
+    kernels of a decision.
+
+    Entries are keyed by the primitive and its gap offsets, so that for
+    example the squared distances at offset K_PTS + 1 are computed once
+    for LIC 7 and LIC 12. Each entry is computed on first use and stored
+    read-only.
+    maxsize: number of entries kept, enough for a few gap configurations
+    max_bytes: memory budget of the entries, or None
+    Least recently used entries are evicted first, so sweeping the gaps
+    over one track keeps the memory bounded. `hits` and `misses` count the
+    lookups that found an entry and those that computed it, `evictions`
+    the entries dropped.
+    """
+
+    def __init__(self, x, y, maxsize=32, max_bytes=None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.x = x
+        self.y = y
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, primitive, gaps, compute):
+        key = (primitive, gaps)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = compute(self.x, self.y, *gaps)
+        entry.flags.writeable = False
+        self._entries[key] = entry
+        self.bytes += entry.nbytes
+        # The new entry is kept even when it alone exceeds max_bytes
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.maxsize
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.nbytes
+            self.evictions += 1
+        return entry
+
+    def pair_squared_distances(self, offset):
+        return self._get("squared_distance", (offset,), pair_squared_distances)
+
+    def pair_x_deltas(self, offset):
+        return self._get("x_delta", (offset,), lambda x, y, o: pair_x_deltas(x, o))
+
+    def triangle_doubled_areas(self, offset1, offset2):
+        return self._get("doubled_area", (offset1, offset2), triangle_doubled_areas)
+
+    def triangle_angles(self, offset1, offset2):
+        return self._get("angle", (offset1, offset2), triangle_angles)
+
+    def triangle_squared_enclosing_radii(self, offset1, offset2):
+        return self._get(
+            "squared_enclosing_radius",
+            (offset1, offset2),
+            triangle_squared_enclosing_radii,
+        )
+
+
+def _valid_windows(lengths, count, last_offset):
+    """Mask of the windows that lie entirely within each scenario's points.
+    A window starting at i is valid when i + last_offset < length."""
+    return np.arange(count) + last_offset < lengths[..., None]
+
+
+def _any_window(met, lengths, last_offset):
+    """Per scenario: whether any valid window meets the condition."""
+    valid = _valid_windows(lengths, met.shape[-1], last_offset)
+    return np.any(met & valid, axis=-1)
+
+
+def _never(lengths):
+    return np.zeros(lengths.shape, dtype=bool)
+
+
+# Batched LIC kernels. Each takes the x and y coordinates of a batch of
+# point sets, shape (batch, n), padded past each set's length, the lengths,
+# shape (batch,), and an object carrying the parameters as attributes
+# (a Decide instance works). They return one boolean per point set,
+# equal to the result of the matching LIC.lic_N_check method. Passing the
+# same PrimitiveStore of x and y to several kernels shares their geometry.
+# Lengths and radii are compared through their squares against
+# squared_threshold, and areas through the doubled areas against twice
+# the area parameters, which gives the same results without square roots.
+
+
+def _store(x, y, primitives):
+    return PrimitiveStore(x, y) if primitives is None else primitives
+
+
+def lic_0(x, y, lengths, params, primitives=None):
+    """LIC 0: two consecutive points further apart than LENGTH1."""
+    squared = _store(x, y, primitives).pair_squared_distances(1)
+    return _any_window(squared >= squared_threshold(params.LENGTH1), lengths, 1)
+
+
+def lic_1(x, y, lengths, params, primitives=None):
+    """LIC 1: three consecutive points that cannot fit within or on a
+    circle of radius RADIUS1."""
+    squared = _store(x, y, primitives).triangle_squared_enclosing_radii(1, 2)
+    return _any_window(squared >= squared_threshold(params.RADIUS1), lengths, 2)
+
+
+def lic_2(x, y, lengths, params, primitives=None):
+    """LIC 2: three consecutive points forming an angle less than
+    pi - EPSILON or greater than pi + EPSILON."""
+    angles = _store(x, y, primitives).triangle_angles(1, 2)
+    met = (angles < (pi - params.EPSILON)) | (angles > (pi + params.EPSILON))
+    return _any_window(met, lengths, 2)
+
+
+def lic_3(x, y, lengths, params, primitives=None):
+    """LIC 3: three consecutive points forming a triangle with area
+    greater than AREA1."""
+    doubled = _store(x, y, primitives).triangle_doubled_areas(1, 2)
+    return _any_window((doubled != 0) & (doubled > 2 * params.AREA1), lengths, 2)
+
+
+def lic_4(x, y, lengths, params, primitives=None):
+    """LIC 4: Q_PTS consecutive points lying in more than QUADS quadrants."""
+    if params.Q_PTS <= 0:
+        return _never(lengths)
+    counts = window_quadrant_counts(x, y, params.Q_PTS)
+    return _any_window(counts > params.QUADS, lengths, params.Q_PTS - 1)
+
+
+def lic_5(x, y, lengths, params, primitives=None):
+    """LIC 5: two consecutive points with X[j] - X[i] < 0."""
+    deltas = _store(x, y, primitives).pair_x_deltas(1)
+    return _any_window(deltas < 0, lengths, 1)
+
+
+def lic_6(x, y, lengths, params, primitives=None):
+    """LIC 6: N_PTS consecutive points of which one lies further than
+    DIST from the line joining the first and last of them."""
+    if params.N_PTS < 3 or params.DIST < 0:
+        return _never(lengths)
+    met = interior_distances_exceed(x, y, params.N_PTS, params.DIST)
+    return _any_window(met, lengths, params.N_PTS - 1) & (lengths >= 3)
+
+
+def lic_7(x, y, lengths, params, primitives=None):
+    """LIC 7: two points separated by K_PTS intervening points further
+    apart than LENGTH1."""
+    if params.K_PTS < 1:
+        return _never(lengths)
+    squared = _store(x, y, primitives).pair_squared_distances(params.K_PTS + 1)
+    met = squared >= squared_threshold(params.LENGTH1)
+    return _any_window(met, lengths, params.K_PTS + 1)
+
+
+def lic_8(x, y, lengths, params, primitives=None):
+    """LIC 8: three points separated by A_PTS and B_PTS intervening
+    points that cannot be contained in a circle of radius RADIUS1."""
+    a_pts, b_pts = params.A_PTS, params.B_PTS
+    if a_pts < 1 or b_pts < 1:
+        return _never(lengths)
+    last_offset = a_pts + b_pts + 2
+    squared = _store(x, y, primitives).triangle_squared_enclosing_radii(
+        a_pts + 1, last_offset
+    )
+    met = squared >= squared_threshold(params.RADIUS1)
+    return _any_window(met, lengths, last_offset) & (lengths >= 5)
+
+
+def lic_9(x, y, lengths, params, primitives=None):
+    """LIC 9: three points separated by C_PTS and D_PTS intervening
+    points forming an angle with |angle - pi| > EPSILON."""
+    c_pts, d_pts = params.C_PTS, params.D_PTS
+    if c_pts < 1 or d_pts < 1:
+        return _never(lengths)
+    last_offset = c_pts + d_pts + 2
+    angles = _store(x, y, primitives).triangle_angles(c_pts + 1, last_offset)
+    return _any_window(np.abs(angles - pi) > params.EPSILON, lengths, last_offset)
+
+
+def lic_10(x, y, lengths, params, primitives=None):
+    """LIC 10: three points separated by E_PTS and F_PTS intervening
+    points forming a triangle with area greater than AREA1."""
+    e_pts, f_pts = params.E_PTS, params.F_PTS
+    if e_pts < 1 or f_pts < 1:
+        return _never(lengths)
+    last_offset = e_pts + f_pts + 2
+    doubled = _store(x, y, primitives).triangle_doubled_areas(e_pts + 1, last_offset)
+    met = doubled > 2 * params.AREA1
+    return _any_window(met, lengths, last_offset) & (lengths >= 5)
+
+
+def lic_11(x, y, lengths, params, primitives=None):
+    """LIC 11: two points separated by G_PTS intervening points with
+    X[j] - X[i] < 0."""
+    if params.G_PTS < 1:
+        return _never(lengths)
+    deltas = _store(x, y, primitives).pair_x_deltas(params.G_PTS + 1)
+    return _any_window(deltas < 0, lengths, params.G_PTS + 1)
+
+
+def lic_12(x, y, lengths, params, primitives=None):
+    """LIC 12: two points separated by K_PTS intervening points further
+    apart than LENGTH1, and two such points closer than LENGTH2."""
+    if params.K_PTS < 1 or params.LENGTH1 < 0 or params.LENGTH2 < 0:
+        return _never(lengths)
+    squared = _store(x, y, primitives).pair_squared_distances(params.K_PTS + 1)
+    last_offset = params.K_PTS + 1
+    longer = squared >= squared_threshold(params.LENGTH1)
+    shorter = squared < squared_threshold(params.LENGTH2, strict=False)
+    return _any_window(longer, lengths, last_offset) & (
+        _any_window(shorter, lengths, last_offset)
+    )
+
+
+def lic_13(x, y, lengths, params, primitives=None):
+    """LIC 13: three points separated by A_PTS and B_PTS intervening
+    points that cannot be contained in a circle of radius RADIUS1, and
+    three such points that can be contained in a circle of radius RADIUS2."""
+    a_pts, b_pts = params.A_PTS, params.B_PTS
+    if a_pts < 1 or b_pts < 1:
+        return _never(lengths)
+    last_offset = a_pts + b_pts + 2
+    squared = _store(x, y, primitives).triangle_squared_enclosing_radii(
+        a_pts + 1, last_offset
+    )
+    # A radius is at most RADIUS2 when it does not exceed it
+    condition_a = squared >= squared_threshold(params.RADIUS1)
+    condition_b = squared < squared_threshold(params.RADIUS2)
+    return (
+        _any_window(condition_a, lengths, last_offset)
+        & _any_window(condition_b, lengths, last_offset)
+        & (lengths >= 5)
+    )
+
+
+def lic_14(x, y, lengths, params, primitives=None):
+    """LIC 14: three points separated by E_PTS and F_PTS intervening
+    points forming a triangle with area greater than AREA1, and three
+    such points forming a triangle with area less than AREA2."""
+    if params.AREA2 < 0:
+        return _never(lengths)
+    if params.E_PTS >= 0 and params.F_PTS >= 0:
+        last_offset = params.E_PTS + params.F_PTS + 2
+        doubled = _store(x, y, primitives).triangle_doubled_areas(
+            params.E_PTS + 1, last_offset
+        )
+        return (
+            _any_window(doubled > 2 * params.AREA1, lengths, last_offset)
+            & _any_window(doubled < 2 * params.AREA2, lengths, last_offset)
+            & (lengths >= 5)
+        )
+    # Index arrays rather than slices, so that gap values pointing before
+    # the first point wrap around each point set like list indexing does.
+    lengths_column = lengths[..., None]
+    first = np.arange(x.shape[-1])
+    second = first + params.E_PTS + 1
+    third = second + params.F_PTS + 1
+    within = (first < lengths_column) & (third < lengths_column)
+
+    def gather(values, index):
+        index = np.broadcast_to(index, values.shape)
+        index = np.where(index < 0, index + lengths_column, index)
+        index = np.clip(index, 0, values.shape[-1] - 1)
+        return np.take_along_axis(values, index, axis=-1)
+
+    x1, y1 = x, y
+    x2, y2 = gather(x, second), gather(y, second)
+    x3, y3 = gather(x, third), gather(y, third)
+    doubled = np.abs(x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2))
+    return (
+        np.any((doubled > 2 * params.AREA1) & within, axis=-1)
+        & np.any((doubled < 2 * params.AREA2) & within, axis=-1)
+        & (lengths >= 5)
+    )
+
+
+LIC_KERNELS = [
+    lic_0,
+    lic_1,
+    lic_2,
+    lic_3,
+    lic_4,
+    lic_5,
+    lic_6,
+    lic_7,
+    lic_8,
+    lic_9,
+    lic_10,
+    lic_11,
+    lic_12,
+    lic_13,
+    lic_14,
+]
+
+
+class VectorizedLIC:
+    """Array-backed implementation of the Launch Interceptor Conditions.
+
+    Every check gives the same result as the corresponding LIC method, but
+    the window geometry is computed by the batched kernels above, with
+    shifted array operations over an (n, 2) float64 copy of the points
+    instead of Python loops. The checks share one PrimitiveStore per
+    POINTS assignment, available as `primitives`.
+    """
+
+    def __init__(self, decide_instance):
+        self.decide = decide_instance
+        self._source = None
+        self._points = None
+        self._primitives = None
+
+    @property
+    def points(self):
+        """The points as an (n, 2) float64 array. The conversion is done
+        once per POINTS assignment or change rather than once per check."""
+        if self.decide.POINTS is not self._source:
+            self._points = np.asarray(self.decide.POINTS, dtype=np.float64)
+            self._points = self._points.reshape(-1, 2)
+            self._primitives = PrimitiveStore(
+                self._points[None, :, 0], self._points[None, :, 1]
+            )
+            self._source = self.decide.POINTS
+        return self._points
+
+    def points_changed(self):
+        """Drop the array and primitives of the points, which Decide calls
+        when POINTS is assigned or changed in place."""
+        self._source = None
+
+    @property
+    def primitives(self):
+        """The PrimitiveStore of the current points."""
+        self.points
+        return self._primitives
+
+    def _check(self, kernel):
+        points = self.points
+        primitives = self._primitives
+        lengths = np.array([len(points)])
+        return bool(
+            kernel(primitives.x, primitives.y, lengths, self.decide, primitives)[0]
+        )
+
+    def lic_0_check(self):
+        return self._check(lic_0)
+
+    def lic_1_check(self):
+        return self._check(lic_1)
+
+    def lic_2_check(self):
+        return self._check(lic_2)
+
+    def lic_3_check(self):
+        return self._check(lic_3)
+
+    def lic_4_check(self):
+        return self._check(lic_4)
+
+    def lic_5_check(self):
+        return self._check(lic_5)
+
+    def lic_6_check(self):
+        return self._check(lic_6)
+
+    def lic_7_check(self):
+        return self._check(lic_7)
+
+    def lic_8_check(self):
+        return self._check(lic_8)
+
+    def lic_9_check(self):
+        return self._check(lic_9)
+
+    def lic_10_check(self):
+        return self._check(lic_10)
+
+    def lic_11_check(self):
+        return self._check(lic_11)
+
+    def lic_12_check(self):
+        return self._check(lic_12)
+
+    def lic_13_check(self):
+        return self._check(lic_13)
+
+    def lic_14_check(self):
+        return self._check(lic_14)
@@ -0,0 +1,141 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .plan import compile_plan, configuration_key
+from .points import PointArray
+
+# Per worker process: the plans compiled so far, keyed by configuration
+_worker_plans = {}
+
+
+def _decide_range(task):
+    """Decide the scenarios start to stop of a run, in a worker. The
+    shared memory segment of the run is attached for the task and closed
+    at its end, so no worker keeps it mapped once the run is over."""
+    name, total, count, configuration, start, stop = task
+    plan = _worker_plans.get(configuration)
+    if plan is None:
+        (params, lcm, puv), large_input = configuration
+        plan = compile_plan(dict(params), lcm, puv, large_input)
+        _worker_plans[configuration] = plan
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        return _decide_scenarios(plan, segment.buf, total, count, start, stop)
+    finally:
+        try:
+            segment.close()
+        except BufferError:  # Views kept alive by a traceback close with it
+            pass
+
+
+def _decide_scenarios(plan, buffer, total, count, start, stop):
+    coordinates = np.ndarray((total, 2), dtype=np.float64, buffer=buffer)
+    offsets = np.ndarray((count + 1,), dtype=np.int64, buffer=buffer, offset=total * 16)
+    return [
+        plan.decide(PointArray(coordinates[offsets[index] : offsets[index + 1]]))
+        for index in range(start, stop)
+    ]
+
+
+def pack_scenarios(scenarios, buffer=None):
+    """Coordinates of all scenarios in one (total, 2) float64 array followed
+    by the (count + 1,) int64 offsets at which each scenario starts.
+
+    With a buffer the arrays are written into it, otherwise new arrays are
+    allocated. Returns the coordinates, the offsets and the bytes used.
+    """
+    arrays = [
+        np.asarray(points, dtype=np.float64).reshape(-1, 2) for points in scenarios
+    ]
+    lengths = [len(points) for points in arrays]
+    total = sum(lengths)
+    size = total * 16 + (len(arrays) + 1) * 8
+    if buffer is None:
+        buffer = bytearray(size)
+    coordinates = np.ndarray((total, 2), dtype=np.float64, buffer=buffer)
+    offsets = np.ndarray(
+        (len(arrays) + 1,), dtype=np.int64, buffer=buffer, offset=total * 16
+    )
+    offsets[0] = 0
+    np.cumsum(lengths, out=offsets[1:])
+    if arrays:
+        np.concatenate(arrays, out=coordinates)
+    return coordinates, offsets, size
+
+
+class ParallelRunner:
+    """Decides many independent scenarios on a pool of worker processes.
+
+    The points of a run are packed into one shared memory segment that
+    the workers read in place, so no points are pickled; each task only
+    carries the segment's name, the configuration and a range of scenario
+    indices. Workers keep the DecisionPlan of every configuration they have
+    seen, so a runner that is reused for several runs compiles each plan
+    once per worker. Use it as a context manager or call close().
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def run(self, scenarios, params, lcm, puv, chunks_per_worker=4, large_input=False):
+        """The launch decisions, "YES" or "NO", of the scenarios in input
+        order. All scenarios share the parameters (a mapping of parameter
+        names to values), the LCM and the PUV. Scenarios of more than 100
+        points need large_input, like on Decide."""
+        scenarios = list(scenarios)
+        if not scenarios:
+            return []
+        compile_plan(params, lcm, puv)  # Report invalid settings here
+        configuration = (configuration_key(params, lcm, puv), large_input)
+
+        scenarios = [
+            np.asarray(points, dtype=np.float64).reshape(-1, 2) for points in scenarios
+        ]
+        size = sum(len(points) for points in scenarios) * 16
+        size += (len(scenarios) + 1) * 8
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            coordinates, offsets, _ = pack_scenarios(scenarios, segment.buf)
+            total, count = len(coordinates), len(scenarios)
+            del coordinates, offsets  # Release the views before closing
+            # Unmapped before any task is submitted, so workers the pool
+            # forks for this run do not inherit the mapping
+            segment.close()
+            chunk = max(1, -(-count // (self.workers * chunks_per_worker)))
+            tasks = [
+                (
+                    segment.name,
+                    total,
+                    count,
+                    configuration,
+                    start,
+                    min(start + chunk, count),
+                )
+                for start in range(0, count, chunk)
+            ]
+            results = []
+            for decisions in self._pool.map(_decide_range, tasks):
+                results.extend(decisions)
+            return results
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def close(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def decide_parallel(scenarios, params, lcm, puv, workers=None, large_input=False):
+    """Decide the scenarios on a temporary ParallelRunner."""
+    with ParallelRunner(workers) as runner:
+        return runner.run(scenarios, params, lcm, puv, large_input=large_input)
@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+from .bitmask import ALL, compile_LCM, fuv_mask, to_mask
+from .decide import PARAMETER_NAMES, check_LCM, check_PUV, make_parameters
+from .lic import LIC
+
+# Parameters that count points, which the checks use as index offsets
+COUNT_NAMES = (
+    "Q_PTS",
+    "N_PTS",
+    "K_PTS",
+    "A_PTS",
+    "B_PTS",
+    "C_PTS",
+    "D_PTS",
+    "E_PTS",
+    "F_PTS",
+    "G_PTS",
+)
+
+
+def _check_parameters(parameters):
+    """Raise ValueError unless the parameters are numbers and the point
+    counts non-negative integers."""
+    for name in PARAMETER_NAMES:
+        value = getattr(parameters, name)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} must be a number")
+    for name in COUNT_NAMES:
+        value = getattr(parameters, name)
+        if not isinstance(value, int) or value < 0:
+            raise ValueError(f"{name} must be a non-negative integer")
+    if parameters.N_PTS < 1:  # The LIC 6 windows would start before the track
+        raise ValueError("N_PTS must be at least 1")
+
+
+class DecisionPlan:
+    """A decision with fixed parameters, LCM and PUV, evaluated for many
+    point sets.
+
+    The parameters are validated once, the LCM is compiled into row masks
+    and only the LICs that the LCM and PUV consult are evaluated. The
+    conditions are the checks of the LIC class, run on a state made of the
+    validated parameters and the points of the call, so the results equal
+    those of a Decide instance with the same settings. As on Decide, at most
+    100 points are accepted unless large_input is set. A plan is not
+    modified after construction, so decide() can be called from many
+    threads at once.
+    """
+
+    def __init__(self, params, lcm, puv, large_input=False):
+        parameters = make_parameters(params)
+        _check_parameters(parameters)
+        check_LCM(lcm)
+        check_PUV(puv)
+        self.parameters = parameters
+        self.lcm = compile_LCM(lcm)
+        self.puv = to_mask(puv)
+        self._batch_settings = (
+            dict(vars(parameters)),
+            [list(row) for row in lcm],
+            [bool(value) for value in puv],
+        )
+        self.large_input = large_input
+        self._settings = dict(vars(parameters), exact=False)
+
+        checks = [getattr(LIC, f"lic_{index}_check") for index in range(15)]
+        self._checks = tuple(enumerate(checks))
+        self.needed = tuple(
+            index for index in range(15) if self._needed_mask >> index & 1
+        )
+        self._needed_checks = tuple(self._checks[index] for index in self.needed)
+
+    @property
+    def _needed_mask(self):
+        """Conditions in the rows of the PUM that reach LAUNCH."""
+        mask = 0
+        for index in range(15):
+            used = self.lcm.and_masks[index] | self.lcm.or_masks[index]
+            if self.puv >> index & 1 and used:
+                mask |= used | 1 << index
+        return mask
+
+    def conditions(self, points):
+        """The CMV of the point set as a bitmask, with all 15 LICs evaluated."""
+        return self._evaluate(self._checks, points)
+
+    def evaluate(self, points):
+        """The CMV and FUV masks of the point set, with all 15 LICs evaluated."""
+        cmv = self._evaluate(self._checks, points)
+        return cmv, fuv_mask(cmv, self.puv, self.lcm)
+
+    def evaluate_many(self, point_sets):
+        """The CMV and FUV masks of many point sets, evaluated together by the
+        array kernels of decide_batch. Raises ValueError for a point set of
+        the wrong size and FloatingPointError where the array arithmetic
+        overflows, so that the caller can fall back to evaluate()."""
+        import numpy as np  # NumPy is only needed for batches
+
+        from .batch import decide_batch
+
+        for points in point_sets:
+            self._check_size(len(points))
+        with np.errstate(over="raise", invalid="raise"):
+            result = decide_batch(list(point_sets), *self._batch_settings)
+        return [
+            (to_mask(cmv), to_mask(fuv)) for cmv, fuv in zip(result.cmv, result.fuv)
+        ]
+
+    def decide(self, points):
+        """The launch decision, "YES" or "NO", for a list of (x, y) points."""
+        cmv = self._evaluate(self._needed_checks, points)
+        return "YES" if fuv_mask(cmv, self.puv, self.lcm) == ALL else "NO"
+
+    def _check_size(self, n):
+        if self.large_input:
+            if n < 2:
+                raise ValueError("POINTS must contain at least 2 points")
+        elif not (2 <= n <= 100):
+            raise ValueError("POINTS must contain between 2 and 100 points")
+
+    def _evaluate(self, checks, points):
+        n = len(points)
+        self._check_size(n)
+        if not isinstance(points, list):
+            points = list(points)  # A PointArray reads faster as a list
+        lic = LIC(SimpleNamespace(POINTS=points, NUMPOINTS=n, **self._settings))
+        cmv = 0
+        for index, check in checks:
+            if check(lic):
+                cmv |= 1 << index
+        return cmv
+
+
+def configuration_key(params, lcm, puv):
+    """Hashable key of a configuration, equal for equal settings."""
+    return (
+        tuple(sorted(params.items())),
+        tuple(tuple(row) for row in lcm),
+        tuple(bool(value) for value in puv),
+    )
+
+
+def compile_plan(params, lcm, puv, large_input=False):
+    """Compile a DecisionPlan from a mapping of parameter names to values,
+    the LCM and the PUV."""
+    return DecisionPlan(params, lcm, puv, large_input)
@@ -0,0 +1,85 @@
+from typing import NamedTuple
+
+
+class DecisionStats(NamedTuple):
+    """Work done by one decision.
+
+    evaluated: indices of the LICs that were evaluated, in evaluation order
+    skipped: number of LICs that were not evaluated
+    short_circuited: whether planned rows were left unvisited because a FUV
+    entry was already known to be False
+    """
+
+    evaluated: tuple
+    skipped: int
+    short_circuited: bool
+
+
+class DemandPlanner:
+    """Plans which CMV entries a decision needs, from the LCM and PUV.
+
+    Row i of the PUM only reaches LAUNCH through FUV[i], and only when
+    PUV[i] is True; within such a row, only the entries whose connector
+    is not "NOTUSED" can be False. The planner keeps just those rows and
+    entries, evaluates the conditions they consult lazily, at most once
+    each, and stops as soon as one FUV entry is False.
+    """
+
+    def __init__(self, lcm, puv):
+        self.rows = []
+        for i in range(15):
+            if not puv[i]:
+                continue
+            used = [(j, lcm[i][j]) for j in range(15) if lcm[i][j] != "NOTUSED"]
+            if used:
+                self.rows.append((i, used))
+
+    @property
+    def needed(self):
+        """Indices of the conditions that can affect LAUNCH."""
+        indices = set()
+        for i, used in self.rows:
+            indices.add(i)
+            indices.update(j for j, _ in used)
+        return sorted(indices)
+
+    def run(self, evaluate, puv):
+        """Evaluate the decision, calling evaluate(index) for each condition
+        that is needed before LAUNCH is known.
+
+        Returns CMV, PUM and FUV as lists in which the entries that were not
+        computed are None, the launch decision as a bool, and DecisionStats.
+        """
+        cmv = [None] * 15
+        pum = [[None] * 15 for _ in range(15)]
+        planned = {i for i, _ in self.rows}
+        fuv = [None if i in planned else True for i in range(15)]
+        evaluated = []
+
+        def condition(index):
+            if cmv[index] is None:
+                cmv[index] = bool(evaluate(index))
+                evaluated.append(index)
+            return cmv[index]
+
+        launch = True
+        short_circuited = False
+        for position, (i, used) in enumerate(self.rows):
+            fuv[i] = True
+            for j, connector in used:
+                # ANDD needs both entries and ORR either, so the row's own
+                # condition decides some entries without consulting CMV[j]
+                if connector == "ANDD":
+                    pum[i][j] = condition(i) and condition(j)
+                else:
+                    pum[i][j] = condition(i) or condition(j)
+                if not pum[i][j]:
+                    fuv[i] = False
+                    break
+            if not fuv[i]:
+                launch = False
+                short_circuited = position < len(self.rows) - 1
+                break
+
+        stats = DecisionStats(tuple(evaluated), 15 - len(evaluated), short_circuited)
+        return cmv, pum, fuv, launch, stats
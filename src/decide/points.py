@@ -0,0 +1,102 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class PointArray(Sequence):
+    """Planar points stored in one contiguous (n, 2) float64 buffer.
+
+    Accepts any object supporting the buffer protocol (NumPy arrays,
+    array("d"), memoryview, ...) shaped (n, 2), or flat with interleaved
+    x and y coordinates. Contiguous float64 data is used without copying;
+    other numeric types are converted once. Indexing returns (x, y) tuples
+    of floats like the list of tuples the LIC checks were written for.
+    """
+
+    def __init__(self, data):
+        if isinstance(data, PointArray):
+            data = data.data
+        array = np.asarray(data)
+        if array.ndim == 1 and array.size % 2 == 0:
+            array = array.reshape(-1, 2)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError(
+                "POINTS must be a list of tuples, each containing exactly 2 elements"
+            )
+        if array.dtype.kind not in "iuf":
+            raise ValueError(
+                "POINTS must contain only numeric coordinates (int or float)"
+            )
+        self._data = np.ascontiguousarray(array, dtype=np.float64)
+        # Whether the coordinates were converted into memory of their own
+        self._owned = not np.may_share_memory(self._data, array)
+
+    @property
+    def data(self):
+        """The (n, 2) float64 array of the points."""
+        return self._data
+
+    @property
+    def x(self):
+        return self._data[:, 0]
+
+    @property
+    def y(self):
+        return self._data[:, 1]
+
+    def frozen(self):
+        """A PointArray with read-only coordinates that nothing else can
+        change: the coordinates are copied when the memory they were read
+        from is writable, through the source or any object it views, and
+        used as they are otherwise, such as a track file mapped read-only."""
+        data = self._data
+        if not self._owned and _writable(data):
+            data = data.copy()
+        else:
+            data = data.view()
+        data.flags.writeable = False
+        frozen = PointArray(data)
+        frozen._owned = True
+        return frozen
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == self._data.dtype:
+            return self._data.copy() if copy else self._data
+        return self._data.astype(dtype)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PointArray(self._data[index])
+        x, y = self._data[index].tolist()
+        return (x, y)
+
+    def __iter__(self):
+        return zip(self._data[:, 0].tolist(), self._data[:, 1].tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(other) == len(self) and all(
+            point == tuple(item) for point, item in zip(self, other)
+        )
+
+    def __repr__(self):
+        return f"PointArray({self._data.tolist()!r})"
+
+
+def _writable(array):
+    """Whether the memory of array can be written through it or through
+    the arrays and buffers it views."""
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return True
+        array = array.base
+    if array is None:
+        return False
+    try:
+        return not memoryview(array).readonly
+    except TypeError:  # An owner that does not tell
+        return True
@@ -0,0 +1,301 @@
+"""Long-running decision daemon.
+
+Clients connect over a Unix domain socket or localhost TCP and exchange
+one JSON object per line. A decision request names a configuration and
+gives the points:
+
+    {"id": 1, "configuration": "default", "points": [[0, 0], [1, 2], ...]}
+
+and is answered with the LAUNCH decision, the CMV and the FUV:
+
+    {"id": 1, "LAUNCH": "YES", "CMV": [...], "FUV": [...]}
+
+Other requests are {"op": "stats"}, which reports the request count and
+the p50/p99 latency, and {"op": "reload"}, which reloads the
+configurations from their file, or replaces them with the
+"configurations" of the request. Failed requests are answered with an
+"error" message.
+
+Usage: python -m decide.server CONFIGURATIONS.json (--socket PATH | --port PORT)
+"""
+
+import argparse
+import asyncio
+import json
+import signal
+import time
+from collections import deque
+
+from .bitmask import ALL, to_list
+from .inputs import parse_points
+from .plan import compile_plan
+
+LATENCY_SAMPLES = 10_000  # Latencies kept for the percentiles
+MIN_ARRAY_BATCH = 8  # Smaller groups are faster one request at a time
+
+
+def load_configurations(configurations):
+    """Compile a mapping of names to {"parameters": {...}, "LCM": [...],
+    "PUV": [...]}, with an optional "large_input": true for tracks of more
+    than 100 points, into DecisionPlans. Raises ValueError for invalid
+    settings, so that no configuration is replaced by a broken one."""
+    if not isinstance(configurations, dict):
+        raise ValueError("configurations must map names to settings")
+    plans = {}
+    for name, settings in configurations.items():
+        try:
+            plans[name] = compile_plan(
+                settings.get("parameters", {}),
+                settings["LCM"],
+                settings["PUV"],
+                bool(settings.get("large_input", False)),
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"configuration {name!r}: {error}") from error
+    return plans
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a non-empty sequence."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class DecisionServer:
+    """Answers decision requests with plans compiled once per configuration.
+
+    Requests arriving while a batch is being collected, for at most
+    `max_delay` seconds or until `max_batch` requests, are handed to a
+    worker thread together, so the event loop keeps accepting requests. The
+    worker evaluates the requests of each configuration together with the
+    array kernels of decide_batch (see evaluate_batch). A reload
+    compiles the new configurations before swapping them in; batches
+    already collected finish with the plans they started with.
+    """
+
+    def __init__(self, configurations=None, path=None, max_batch=64, max_delay=0.002):
+        self.path = path
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        if configurations is None:
+            configurations = self._read_configurations()
+        self.plans = load_configurations(configurations)
+        self.requests = 0
+        self.batches = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._queue = None
+        self._batcher = None
+        self._servers = []
+        self._connections = set()
+
+    def _read_configurations(self):
+        if self.path is None:
+            raise ValueError("no configuration file to load")
+        with open(self.path) as file:
+            return json.load(file)
+
+    def reload(self, configurations=None):
+        """Replace the configurations, read from the file unless given."""
+        if configurations is None:
+            configurations = self._read_configurations()
+        self.plans = load_configurations(configurations)
+
+    def stats(self):
+        latencies = self.latencies
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "configurations": sorted(self.plans),
+            "p50_ms": percentile(latencies, 0.50) * 1e3 if latencies else None,
+            "p99_ms": percentile(latencies, 0.99) * 1e3 if latencies else None,
+        }
+
+    async def start_unix(self, path):
+        await self._start()
+        self._servers.append(await asyncio.start_unix_server(self._handle, path))
+
+    async def start_tcp(self, host="127.0.0.1", port=0):
+        """Listen on host and port; port 0 picks a free port. Returns the port."""
+        await self._start()
+        server = await asyncio.start_server(self._handle, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def _start(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._collect_batches())
+
+    async def close(self):
+        """Stop accepting connections, answer the queued requests and then
+        close the open connections."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+        if self._queue is not None:
+            await self._queue.join()
+            self._batcher.cancel()
+            self._queue = self._batcher = None
+        for connection in list(self._connections):
+            connection.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _handle(self, reader, writer):
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        pending = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._answer(line, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.wait(pending)
+        except asyncio.CancelledError:
+            pass  # The server is closing
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+
+    async def _answer(self, line, writer):
+        request = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("requests must be JSON objects")
+            response = await self._respond(request)
+        except Exception as error:  # Includes malformed JSON
+            response = {"error": str(error)}
+        if isinstance(request, dict) and "id" in request:
+            response = {"id": request["id"], **response}
+        if not writer.is_closing():
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+    async def _respond(self, request):
+        op = request.get("op", "decide")
+        if op == "stats":
+            return self.stats()
+        if op == "reload":
+            self.reload(request.get("configurations"))
+            return {"reloaded": sorted(self.plans)}
+        if op != "decide":
+            raise ValueError(f"unknown op {op!r}")
+        name = request.get("configuration", "default")
+        if name not in self.plans:
+            raise ValueError(f"unknown configuration {name!r}")
+        points = parse_points(request.get("points"))
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((self.plans[name], points, future, time.perf_counter()))
+        return await future
+
+    async def _collect_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                try:
+                    results = await loop.run_in_executor(None, evaluate_batch, batch)
+                except Exception as error:
+                    # Fail the requests of this batch, not the batcher
+                    for _, _, future, _ in batch:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+                self.batches += 1
+                finished = time.perf_counter()
+                for (_, _, future, arrival), result in zip(batch, results):
+                    self.requests += 1
+                    self.latencies.append(finished - arrival)
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+def evaluate_batch(batch):
+    """Responses for a batch of (plan, points, ...) requests.
+
+    The requests are grouped by plan; groups of at least MIN_ARRAY_BATCH
+    requests are evaluated together by the array kernels, smaller groups one
+    request at a time. A group that fails, because one of its requests has
+    invalid points or coordinates that overflow, is evaluated again one
+    request at a time, so only the failing requests get an "error" response.
+    """
+    groups = {}
+    for index, (plan, *_) in enumerate(batch):
+        groups.setdefault(id(plan), (plan, []))[1].append(index)
+    results = [None] * len(batch)
+    for plan, indices in groups.values():
+        masks = None
+        if len(indices) >= MIN_ARRAY_BATCH:
+            try:
+                masks = plan.evaluate_many([batch[index][1] for index in indices])
+            except Exception:
+                pass  # Find the failing requests one at a time
+        for position, index in enumerate(indices):
+            try:
+                cmv, fuv = (
+                    plan.evaluate(batch[index][1]) if masks is None else masks[position]
+                )
+            except Exception as error:
+                results[index] = {"error": str(error)}
+                continue
+            results[index] = {
+                "LAUNCH": "YES" if fuv == ALL else "NO",
+                "CMV": to_list(cmv),
+                "FUV": to_list(fuv),
+            }
+    return results
+
+
+async def serve(path, socket=None, port=None, host="127.0.0.1"):
+    """Run a DecisionServer until SIGINT or SIGTERM; SIGHUP reloads the
+    configurations from `path`."""
+    server = DecisionServer(path=path)
+    if socket is not None:
+        await server.start_unix(socket)
+        print(f"Listening on {socket}", flush=True)
+    else:
+        port = await server.start_tcp(host, port or 0)
+        print(f"Listening on {host}:{port}", flush=True)
+
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+
+    def reload():
+        try:
+            server.reload()
+        except (OSError, ValueError) as error:
+            print(f"Reload failed, keeping the configurations: {error}", flush=True)
+
+    loop.add_signal_handler(signal.SIGHUP, reload)
+    loop.add_signal_handler(signal.SIGINT, stopped.set)
+    loop.add_signal_handler(signal.SIGTERM, stopped.set)
+    await stopped.wait()
+    await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-running decision daemon")
+    parser.add_argument("configurations", help="JSON file of named configurations")
+    address = parser.add_mutually_exclusive_group(required=True)
+    address.add_argument("--socket", help="Unix domain socket path")
+    address.add_argument("--port", type=int, help="localhost TCP port")
+    args = parser.parse_args()
+    asyncio.run(serve(args.configurations, args.socket, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+from collections import deque
+from math import pi, sqrt
+from numbers import Real
+
+from .decide import check_LCM, check_PUV, make_parameters
+from .helpers import (
+    calculate_angle,
+    calculate_distance,
+    calculate_enclosing_radius,
+    calculate_quadrant,
+    calculate_triangle_area,
+)
+
+
+class _TupleTracker:
+    """Outcomes of one LIC for every tuple of points at fixed offsets
+    (0, ..., last) inside the sliding window, oldest tuple first.
+
+    The predicate returns one boolean per part of the condition (two for
+    LIC 12, 13 and 14), and the tracker keeps the number of tuples meeting
+    each part, so the LIC result is available in O(1) after every push.
+    """
+
+    def __init__(self, offsets, predicate, parts=1):
+        self.offsets = offsets
+        self.last = offsets[-1]
+        self.predicate = predicate
+        self.outcomes = deque()
+        self.counts = [0] * parts
+
+    def push(self, window):
+        """Add the tuple ending at the newest point, if it fits the window."""
+        if len(window) <= self.last:
+            return
+        start = len(window) - 1 - self.last
+        outcome = self.predicate(*(window[start + offset] for offset in self.offsets))
+        self.outcomes.append(outcome)
+        for part, met in enumerate(outcome):
+            self.counts[part] += met
+
+    def evict(self):
+        """Drop the tuple starting at the oldest point, which leaves the window."""
+        if self.outcomes:
+            for part, met in enumerate(self.outcomes.popleft()):
+                self.counts[part] -= met
+
+    def met(self):
+        return all(self.counts)
+
+
+class _QuadrantTracker:
+    """LIC 4 outcomes for every run of q_pts consecutive points. Keeps the
+    number of points per quadrant in the newest run, so each push costs
+    O(1) instead of rebuilding the quadrant set of the whole run."""
+
+    def __init__(self, q_pts, quads):
+        self.q_pts = q_pts
+        self.quads = quads
+        self.run = deque()
+        self.quadrant_counts = [0] * 5
+        self.distinct = 0
+        self.outcomes = deque()
+        self.counts = [0]
+
+    def _add(self, quadrant, change):
+        if quadrant:
+            before = self.quadrant_counts[quadrant]
+            self.quadrant_counts[quadrant] += change
+            self.distinct += (before == 0) - (before + change == 0)
+
+    def push(self, window):
+        quadrant = calculate_quadrant(window[-1])
+        self.run.append(quadrant)
+        self._add(quadrant, 1)
+        if len(self.run) > self.q_pts:
+            self._add(self.run.popleft(), -1)
+        if len(self.run) == self.q_pts and len(window) >= self.q_pts:
+            met = self.distinct > self.quads
+            self.outcomes.append((met,))
+            self.counts[0] += met
+
+    def evict(self):
+        if self.outcomes:
+            self.counts[0] -= self.outcomes.popleft()[0]
+
+    def met(self):
+        return all(self.counts)
+
+
+class StreamingDecide:
+    """Launch decision over a sliding window of the most recent radar points.
+
+    Parameters, LCM and PUV are fixed at construction. Each push appends
+    one point, evicting the oldest point once the window is full, and only
+    evaluates the LIC tuples that end at the new point: consecutive pairs
+    and triples, the K/A/B/C/D/E/F/G_PTS gapped tuples and the Q_PTS and
+    N_PTS runs. CMV, PUM, FUV and LAUNCH are then updated from the entries
+    whose outcome changed. The work per push depends on the gap parameters
+    but not on the window size, and the results are those of a Decide
+    instance evaluated on the points currently in the window.
+    """
+
+    def __init__(self, window, params=None, lcm=None, puv=None):
+        if not isinstance(window, int) or window < 2:
+            raise ValueError("window must be an integer of at least 2")
+        self.window = window
+        self.params = make_parameters(params or {})
+        if lcm is None:
+            lcm = [["NOTUSED"] * 15 for _ in range(15)]
+        if puv is None:
+            puv = [False] * 15
+        check_LCM(lcm)
+        check_PUV(puv)
+        self._LCM = [list(row) for row in lcm]
+        self._PUV = [bool(element) for element in puv]
+
+        self._POINTS = deque()
+        self._trackers = self._create_trackers()
+        self._CMV = [False] * 15
+        self._PUM = [[True] * 15 for _ in range(15)]
+        self._FUV = [not element for element in self._PUV]
+        self._LAUNCH = "YES" if all(self._FUV) else "NO"
+        for index in range(15):
+            self._update_PUM(index)
+        self._update_decision(range(15))
+
+    @property
+    def NUMPOINTS(self):
+        return len(self._POINTS)
+
+    @property
+    def POINTS(self):
+        return list(self._POINTS)
+
+    @property
+    def LCM(self):
+        return self._LCM
+
+    @property
+    def PUV(self):
+        return self._PUV
+
+    @property
+    def CMV(self):
+        return self._CMV
+
+    @property
+    def PUM(self):
+        return self._PUM
+
+    @property
+    def FUV(self):
+        return self._FUV
+
+    @property
+    def LAUNCH(self):
+        return self._LAUNCH
+
+    def push(self, point):
+        """Append a point, any sequence of two real coordinates, to the window
+        and return the updated LAUNCH."""
+        try:
+            point = tuple(point)
+        except TypeError:
+            point = ()
+        if len(point) != 2:
+            raise ValueError("point must be a sequence of exactly 2 coordinates")
+        if not all(
+            isinstance(coord, Real) and not isinstance(coord, bool) for coord in point
+        ):
+            raise ValueError("point must contain only numeric coordinates")
+
+        if len(self._POINTS) == self.window:
+            for tracker in self._trackers.values():
+                tracker.evict()
+            self._POINTS.popleft()
+        self._POINTS.append(point)
+        for tracker in self._trackers.values():
+            tracker.push(self._POINTS)
+
+        changed = []
+        for index in range(15):
+            met = self._condition_met(index)
+            if met != self._CMV[index]:
+                self._CMV[index] = met
+                changed.append(index)
+        for index in changed:
+            self._update_PUM(index)
+        self._update_decision(changed)
+        return self._LAUNCH
+
+    def extend(self, points):
+        """Push several points, returning the LAUNCH after the last one."""
+        for point in points:
+            self.push(point)
+        return self._LAUNCH
+
+    def _condition_met(self, index):
+        """CMV entry from the tracked tuples and the guards of the LIC."""
+        tracker = self._trackers.get(index)
+        if tracker is None:
+            return False
+        if index in (8, 10, 13, 14) and len(self._POINTS) < 5:
+            return False
+        return tracker.met()
+
+    def _update_PUM(self, index):
+        """Recompute the row and column of the PUM that involve CMV[index]."""
+        for i, j in [(index, other) for other in range(15)] + [
+            (other, index) for other in range(15)
+        ]:
+            connector = self._LCM[i][j]
+            if connector == "ANDD":
+                self._PUM[i][j] = self._CMV[i] and self._CMV[j]
+            elif connector == "ORR":
+                self._PUM[i][j] = self._CMV[i] or self._CMV[j]
+            else:
+                self._PUM[i][j] = True
+
+    def _update_decision(self, changed):
+        """Recompute the FUV entries whose PUM rows may have changed."""
+        if not changed:
+            return
+        rows = set(changed)
+        for index in changed:
+            rows.update(row for row in range(15) if self._LCM[row][index] != "NOTUSED")
+        for row in rows:
+            self._FUV[row] = not self._PUV[row] or all(self._PUM[row])
+        self._LAUNCH = "YES" if all(self._FUV) else "NO"
+
+    def _create_trackers(self):
+        """One tracker per LIC whose parameter guards can be met. The
+        predicates mirror the per-window tests of the LIC class."""
+        params = self.params
+        trackers = {}
+
+        def lic_0(p1, p2):
+            return (calculate_distance(p1, p2) > params.LENGTH1,)
+
+        def lic_1(p1, p2, p3):
+            return (calculate_enclosing_radius(p1, p2, p3) > params.RADIUS1,)
+
+        def lic_2(p1, p2, p3):
+            angle = calculate_angle(p1, p2, p3)
+            return (
+                angle is not None
+                and (angle < pi - params.EPSILON or angle > pi + params.EPSILON),
+            )
+
+        def lic_3(p1, p2, p3):
+            area = calculate_triangle_area(p1, p2, p3)
+            return (area != 0 and area > params.AREA1,)
+
+        def lic_5(p1, p2):
+            return (p2[0] - p1[0] < 0,)
+
+        def lic_6(*run):
+            p1, p2 = run[0], run[-1]
+            for p in run[1:-1]:
+                if p1 == p2:
+                    distance = calculate_distance(p1, p)
+                else:
+                    distance = abs(
+                        (p2[0] - p1[0]) * (p1[1] - p[1])
+                        - (p1[0] - p[0]) * (p2[1] - p1[1])
+                    ) / sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
+                if distance > params.DIST:
+                    return (True,)
+            return (False,)
+
+        def lic_8(p1, p2, p3):
+            return (calculate_enclosing_radius(p1, p2, p3) > params.RADIUS1,)
+
+        def lic_9(p1, p2, p3):
+            angle = calculate_angle(p1, p2, p3)
+            return (angle is not None and abs(angle - pi) > params.EPSILON,)
+
+        def lic_10(p1, p2, p3):
+            return (calculate_triangle_area(p1, p2, p3) > params.AREA1,)
+
+        def lic_12(p1, p2):
+            dist = calculate_distance(p1, p2)
+            return (dist > params.LENGTH1, dist < params.LENGTH2)
+
+        def lic_13(p1, p2, p3):
+            radius = calculate_enclosing_radius(p1, p2, p3)
+            return (radius > params.RADIUS1, radius <= params.RADIUS2)
+
+        def lic_14(p1, p2, p3):
+            area = calculate_triangle_area(p1, p2, p3)
+            return (area > params.AREA1, area < params.AREA2)
+
+        def triple(first_gap, second_gap):
+            return (0, first_gap + 1, first_gap + second_gap + 2)
+
+        trackers[0] = _TupleTracker((0, 1), lic_0)
+        trackers[1] = _TupleTracker((0, 1, 2), lic_1)
+        trackers[2] = _TupleTracker((0, 1, 2), lic_2)
+        trackers[3] = _TupleTracker((0, 1, 2), lic_3)
+        if params.Q_PTS > 0:
+            trackers[4] = _QuadrantTracker(params.Q_PTS, params.QUADS)
+        trackers[5] = _TupleTracker((0, 1), lic_5)
+        if params.N_PTS >= 3 and params.DIST >= 0:
+            trackers[6] = _TupleTracker(tuple(range(params.N_PTS)), lic_6)
+        if params.K_PTS >= 1:
+            trackers[7] = _TupleTracker((0, params.K_PTS + 1), lic_0)
+            if params.LENGTH1 >= 0 and params.LENGTH2 >= 0:
+                trackers[12] = _TupleTracker((0, params.K_PTS + 1), lic_12, 2)
+        if params.A_PTS >= 1 and params.B_PTS >= 1:
+            offsets = triple(params.A_PTS, params.B_PTS)
+            trackers[8] = _TupleTracker(offsets, lic_8)
+            trackers[13] = _TupleTracker(offsets, lic_13, 2)
+        if params.C_PTS >= 1 and params.D_PTS >= 1:
+            trackers[9] = _TupleTracker(triple(params.C_PTS, params.D_PTS), lic_9)
+        if params.E_PTS >= 1 and params.F_PTS >= 1:
+            trackers[10] = _TupleTracker(triple(params.E_PTS, params.F_PTS), lic_10)
+        if params.AREA2 >= 0 and params.E_PTS >= -1 and params.F_PTS >= -1:
+            offsets = triple(params.E_PTS, params.F_PTS)
+            trackers[14] = _TupleTracker(offsets, lic_14, 2)
+        if params.G_PTS >= 1:
+            trackers[11] = _TupleTracker((0, params.G_PTS + 1), lic_5)
+        return trackers
@@ -0,0 +1,322 @@
+from math import pi, sqrt
+
+from .helpers import (
+    calculate_angle,
+    calculate_distance,
+    calculate_enclosing_radius,
+    calculate_quadrant,
+    calculate_triangle_area,
+)
+from .lic import LIC
+
+
+class GapSummary:
+    """Extrema of the window quantities of one point set, per gap.
+
+    Whether LIC 0, 7 and 12 are met only depends on the smallest and
+    largest distance between points a gap apart, LIC 3, 10 and 14 on the
+    extreme triangle areas for a pair of gaps, LIC 1, 8 and 13 on the
+    extreme enclosing radii, LIC 2 and 9 on the extreme angles, LIC 5
+    and 11 on the smallest x-delta, LIC 4 on the most quadrants in a
+    window and LIC 6 on the largest distance from a window's line. Each
+    pair of extrema is computed by one scan of the points the first time
+    its gaps are asked for; checking a threshold against it afterwards
+    takes O(1). `scans` counts the scans.
+
+    Gaps are non-negative index offsets from the first point of a window.
+    """
+
+    def __init__(self, points):
+        self.points = points
+        self.scans = 0
+        self._extrema = {}
+
+    def _get(self, key, values):
+        """(smallest, largest) of the values, or (None, None) when there
+        are none. Values that are None, for degenerate windows, are left
+        out."""
+        extrema = self._extrema.get(key)
+        if extrema is None:
+            self.scans += 1
+            low = high = None
+            for value in values():
+                if value is None:
+                    continue
+                if low is None:
+                    low = high = value
+                elif value < low:
+                    low = value
+                elif value > high:
+                    high = value
+            extrema = (low, high)
+            self._extrema[key] = extrema
+        return extrema
+
+    def _pairs(self, gap):
+        points = self.points
+        for i in range(len(points) - gap):
+            yield points[i], points[i + gap]
+
+    def _triples(self, offset1, offset2):
+        points = self.points
+        for i in range(len(points) - offset2):
+            yield points[i], points[i + offset1], points[i + offset2]
+
+    def distances(self, gap):
+        """Extreme distances between points `gap` positions apart."""
+        return self._get(
+            ("distance", gap),
+            lambda: (calculate_distance(p1, p2) for p1, p2 in self._pairs(gap)),
+        )
+
+    def x_deltas(self, gap):
+        """Extreme values of X[j] - X[i] for points `gap` positions apart."""
+        return self._get(
+            ("x_delta", gap),
+            lambda: (p2[0] - p1[0] for p1, p2 in self._pairs(gap)),
+        )
+
+    def areas(self, offset1, offset2):
+        """Extreme areas of the triangles (i, i + offset1, i + offset2)."""
+        return self._get(
+            ("area", offset1, offset2),
+            lambda: (
+                calculate_triangle_area(*triple)
+                for triple in self._triples(offset1, offset2)
+            ),
+        )
+
+    def enclosing_radii(self, offset1, offset2):
+        """Extreme enclosing radii of the triples (i, i + offset1, i + offset2)."""
+        return self._get(
+            ("enclosing_radius", offset1, offset2),
+            lambda: (
+                calculate_enclosing_radius(*triple)
+                for triple in self._triples(offset1, offset2)
+            ),
+        )
+
+    def quadrant_counts(self, size):
+        """Extreme numbers of quadrants occupied by `size` consecutive points."""
+        return self._get(("quadrants", size), lambda: self._quadrant_counts(size))
+
+    def _quadrant_counts(self, size):
+        quadrants = [calculate_quadrant(point) for point in self.points]
+        counts = [0] * 5  # Points in the window per quadrant, 0 for no quadrant
+        distinct = 0
+        for index, quadrant in enumerate(quadrants):
+            if quadrant and counts[quadrant] == 0:
+                distinct += 1
+            counts[quadrant] += 1
+            if index >= size:
+                leaving = quadrants[index - size]
+                counts[leaving] -= 1
+                if leaving and counts[leaving] == 0:
+                    distinct -= 1
+            if index >= size - 1:
+                yield distinct
+
+    def interior_distances(self, size):
+        """Extreme distances of the inner points of `size` consecutive
+        points from the line through the first and the last, or from the
+        first when they coincide, computed like LIC.lic_6_check."""
+        return self._get(
+            ("interior_distance", size), lambda: self._interior_distances(size)
+        )
+
+    def _interior_distances(self, size):
+        points = self.points
+        for i in range(len(points) - size + 1):
+            p1 = points[i]
+            p2 = points[i + size - 1]
+            if p1 == p2:
+                for j in range(i + 1, i + size - 1):
+                    yield calculate_distance(p1, points[j])
+            else:
+                norm = sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
+                for j in range(i + 1, i + size - 1):
+                    p = points[j]
+                    yield abs(
+                        (p2[0] - p1[0]) * (p1[1] - p[1])
+                        - (p1[0] - p[0]) * (p2[1] - p1[1])
+                    ) / norm
+
+    def angles(self, offset1, offset2):
+        """Extreme angles at the middle vertex of the triples
+        (i, i + offset1, i + offset2), leaving out degenerate ones."""
+        return self._get(
+            ("angle", offset1, offset2),
+            lambda: (
+                calculate_angle(*triple) for triple in self._triples(offset1, offset2)
+            ),
+        )
+
+
+class SummaryLIC(LIC):
+    """LIC implementation answering the threshold conditions from a
+    GapSummary of the points.
+
+    The summary is built once per POINTS assignment, so deciding again
+    after changing a threshold (LENGTH1, LENGTH2, RADIUS1, RADIUS2,
+    EPSILON, AREA1, AREA2, QUADS or DIST) does not scan the points, nor
+    after changing a gap back to one already used. Every check gives the
+    same result as the LIC method.
+
+    The thresholds are only compared, with operators that also accept
+    NumPy arrays: given arrays of thresholds, a check returns the array of
+    its results, which is how decide.sweep evaluates parameter grids.
+    """
+
+    def __init__(self, decide_instance):
+        super().__init__(decide_instance)
+        self._source = None
+        self._summary = None
+
+    @property
+    def summary(self):
+        """The GapSummary of the current points."""
+        if self.decide.POINTS is not self._source:
+            self._summary = GapSummary(self.decide.POINTS)
+            self._source = self.decide.POINTS
+        return self._summary
+
+    def points_changed(self):
+        """Drop the summary of the points, which Decide calls when POINTS is
+        assigned or changed in place."""
+        self._source = None
+
+    def answers_from_summary(self, index):
+        """Whether LIC `index` is answered from the summary for the current
+        gaps. Otherwise the reference check runs, which needs scalar
+        thresholds: window sizes below 1 for LIC 6 and gaps pointing before
+        the first point for LIC 14 wrap around, and the reference checks
+        may stop before reaching an invalid index."""
+        if index == 6:
+            return self.decide.N_PTS >= 1
+        if index == 14:
+            return self.decide.E_PTS >= 0 and self.decide.F_PTS >= 0
+        return True
+
+    def lic_0_check(self):
+        if len(self.decide.POINTS) < 2:
+            return False
+        return self.summary.distances(1)[1] > self.decide.LENGTH1
+
+    def lic_1_check(self):
+        if len(self.decide.POINTS) < 3:
+            return False
+        return self.summary.enclosing_radii(1, 2)[1] > self.decide.RADIUS1
+
+    def lic_2_check(self):
+        if len(self.decide.POINTS) < 3:
+            return False
+        low, high = self.summary.angles(1, 2)
+        if low is None:
+            return False
+        return (low < (pi - self.decide.EPSILON)) | (high > (pi + self.decide.EPSILON))
+
+    def lic_3_check(self):
+        if len(self.decide.POINTS) < 3:
+            return False
+        # Zero areas never count, so the largest one must be positive
+        largest = self.summary.areas(1, 2)[1]
+        return (largest != 0) & (largest > self.decide.AREA1)
+
+    def lic_4_check(self):
+        d = self.decide
+        if d.Q_PTS <= 0 or len(d.POINTS) < d.Q_PTS:
+            return False
+        return self.summary.quadrant_counts(d.Q_PTS)[1] > d.QUADS
+
+    def lic_5_check(self):
+        if len(self.decide.POINTS) < 2:
+            return False
+        return self.summary.x_deltas(1)[0] < 0
+
+    def lic_6_check(self):
+        d = self.decide
+        if len(d.POINTS) < 3 or d.N_PTS > len(d.POINTS):
+            return False
+        if not self.answers_from_summary(6):
+            return super().lic_6_check()
+        largest = self.summary.interior_distances(d.N_PTS)[1]
+        if largest is None:
+            return False
+        return (d.DIST >= 0) & (largest > d.DIST)
+
+    def lic_7_check(self):
+        d = self.decide
+        if len(d.POINTS) < 3 or len(d.POINTS) - 2 < d.K_PTS or d.K_PTS < 1:
+            return False
+        return self.summary.distances(d.K_PTS + 1)[1] > d.LENGTH1
+
+    def lic_8_check(self):
+        d = self.decide
+        if (
+            len(d.POINTS) < 5
+            or d.A_PTS < 1
+            or d.B_PTS < 1
+            or d.A_PTS + d.B_PTS > len(d.POINTS) - 3
+        ):
+            return False
+        radii = self.summary.enclosing_radii(d.A_PTS + 1, d.A_PTS + d.B_PTS + 2)
+        return radii[1] > d.RADIUS1
+
+    def lic_9_check(self):
+        d = self.decide
+        if len(d.POINTS) < 3 + d.C_PTS + d.D_PTS or d.C_PTS < 1 or d.D_PTS < 1:
+            return False
+        low, high = self.summary.angles(d.C_PTS + 1, d.C_PTS + d.D_PTS + 2)
+        if low is None:
+            return False
+        return (abs(low - pi) > d.EPSILON) | (abs(high - pi) > d.EPSILON)
+
+    def lic_10_check(self):
+        d = self.decide
+        if (
+            d.NUMPOINTS < 5
+            or d.E_PTS + d.F_PTS > d.NUMPOINTS - 3
+            or d.E_PTS < 1
+            or d.F_PTS < 1
+        ):
+            return False
+        areas = self.summary.areas(d.E_PTS + 1, d.E_PTS + d.F_PTS + 2)
+        return areas[1] > d.AREA1
+
+    def lic_11_check(self):
+        d = self.decide
+        if d.NUMPOINTS < 3 or d.G_PTS < 1 or d.G_PTS > d.NUMPOINTS - 2:
+            return False
+        return self.summary.x_deltas(d.G_PTS + 1)[0] < 0
+
+    def lic_12_check(self):
+        d = self.decide
+        if d.NUMPOINTS < 3 or d.K_PTS < 1 or d.K_PTS > d.NUMPOINTS - 2:
+            return False
+        low, high = self.summary.distances(d.K_PTS + 1)
+        return (
+            (d.LENGTH1 >= 0) & (d.LENGTH2 >= 0) & (high > d.LENGTH1) & (low < d.LENGTH2)
+        )
+
+    def lic_13_check(self):
+        d = self.decide
+        if (
+            len(d.POINTS) < d.A_PTS + d.B_PTS + 3
+            or len(d.POINTS) < 5
+            or d.A_PTS < 1
+            or d.B_PTS < 1
+        ):
+            return False
+        low, high = self.summary.enclosing_radii(d.A_PTS + 1, d.A_PTS + d.B_PTS + 2)
+        return (high > d.RADIUS1) & (low <= d.RADIUS2)
+
+    def lic_14_check(self):
+        d = self.decide
+        if len(d.POINTS) < 5:
+            return False
+        if not self.answers_from_summary(14):
+            return super().lic_14_check()
+        low, high = self.summary.areas(d.E_PTS + 1, d.E_PTS + d.F_PTS + 2)
+        if low is None:
+            return False
+        return (d.AREA2 >= 0) & (high > d.AREA1) & (low < d.AREA2)
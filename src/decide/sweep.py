@@ -0,0 +1,281 @@
+from itertools import product
+from math import pi
+from typing import NamedTuple
+
+import numpy as np
+
+from .bitmask import ALL, compile_LCM, to_mask
+from .decide import PARAMETER_NAMES, check_LCM, check_PUV, make_parameters
+from .lic_numpy import (
+    pair_squared_distances,
+    pair_x_deltas,
+    squared_threshold,
+    triple_angles,
+    triple_doubled_areas,
+    triple_squared_enclosing_radii,
+)
+from .summary import SummaryLIC
+
+# Parameters that are compared with the geometry. They are swept as arrays,
+# and every other parameter, a gap or a window size, one value at a time.
+THRESHOLD_NAMES = (
+    "LENGTH1",
+    "RADIUS1",
+    "EPSILON",
+    "AREA1",
+    "LENGTH2",
+    "RADIUS2",
+    "AREA2",
+    "QUADS",
+    "DIST",
+)
+
+# Gap and window size parameters read by each LIC
+LIC_GAPS = (
+    (),
+    (),
+    (),
+    (),
+    ("Q_PTS",),
+    (),
+    ("N_PTS",),
+    ("K_PTS",),
+    ("A_PTS", "B_PTS"),
+    ("C_PTS", "D_PTS"),
+    ("E_PTS", "F_PTS"),
+    ("G_PTS",),
+    ("K_PTS",),
+    ("A_PTS", "B_PTS"),
+    ("E_PTS", "F_PTS"),
+)
+
+
+class SweepResult(NamedTuple):
+    """Decisions over a grid of parameter values.
+
+    axes: the swept parameter names, in grid order, with their values
+    cmv: (*grid, 15) boolean Conditions Met Vectors
+    fuv: (*grid, 15) boolean Final Unlocking Vectors
+    launch: grid-shaped boolean launch decisions
+    """
+
+    axes: dict
+    cmv: np.ndarray
+    fuv: np.ndarray
+    launch: np.ndarray
+
+
+class GapTables(NamedTuple):
+    """Results of the LICs with gap parameters for every value of the gaps.
+
+    Gaps run from 0 to NUMPOINTS - 1; entries without any window of
+    points are False, like the checks.
+    lic_7, lic_12: (NUMPOINTS,) results, indexed by K_PTS
+    lic_11: (NUMPOINTS,) results, indexed by G_PTS
+    lic_8, lic_13: (NUMPOINTS, NUMPOINTS) results, indexed by A_PTS, B_PTS
+    lic_9: (NUMPOINTS, NUMPOINTS) results, indexed by C_PTS, D_PTS
+    lic_10, lic_14: (NUMPOINTS, NUMPOINTS) results, indexed by E_PTS, F_PTS
+    """
+
+    lic_7: np.ndarray
+    lic_8: np.ndarray
+    lic_9: np.ndarray
+    lic_10: np.ndarray
+    lic_11: np.ndarray
+    lic_12: np.ndarray
+    lic_13: np.ndarray
+    lic_14: np.ndarray
+
+
+def decide_sweep(points, params, lcm, puv, axes):
+    """Evaluate the launch decision of one track over a grid of parameters.
+
+    params maps parameter names to the values they keep, like in
+    decide_batch. axes maps the swept parameter names to their values;
+    the grid has one dimension per axis, in order. The extrema of the track
+    per gap are computed once, in a GapSummary, and each LIC compares its
+    thresholds with them as array operations over the whole grid, looping
+    only over the values of the gaps it reads. The results are the same as
+    one Decide instance per grid cell.
+    """
+    unknown = set(axes) - set(PARAMETER_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+    parameters = make_parameters(params)
+    check_LCM(lcm)
+    check_PUV(puv)
+    if hasattr(points, "tolist"):
+        points = points.tolist()
+    parameters.POINTS = [tuple(point) for point in points]
+    parameters.NUMPOINTS = len(parameters.POINTS)
+    parameters.exact = False
+
+    names = list(axes)
+    values = [np.asarray(axes[name]).ravel() for name in names]
+    shape = tuple(len(axis) for axis in values)
+    for position, name in enumerate(names):
+        if name in THRESHOLD_NAMES:
+            # Thresholds vary along their own dimension of the grid
+            dimensions = [1] * len(shape)
+            dimensions[position] = shape[position]
+            setattr(parameters, name, values[position].reshape(dimensions))
+
+    lic = SummaryLIC(parameters)
+    cmv = np.zeros(shape, dtype=np.uint16)
+    for index, check in enumerate(_checks(lic)):
+        swept = [
+            position for position, name in enumerate(names) if name in LIC_GAPS[index]
+        ]
+        for cell in product(*(range(shape[position]) for position in swept)):
+            region = [slice(None)] * len(shape)
+            for position, value_index in zip(swept, cell):
+                setattr(
+                    parameters, names[position], values[position][value_index].item()
+                )
+                region[position] = value_index
+            if lic.answers_from_summary(index):
+                met = np.broadcast_to(check(), shape)
+            else:
+                met = _reference_cells(check, parameters, names, values, region)
+            region = tuple(region)
+            cmv[region] |= met[region].astype(np.uint16) << index
+
+    fuv = _fuv_masks(cmv, to_mask(puv), compile_LCM(lcm))
+    bits = np.arange(15, dtype=np.uint16)
+    return SweepResult(
+        dict(zip(names, values)),
+        (cmv[..., None] >> bits & 1).astype(bool),
+        (fuv[..., None] >> bits & 1).astype(bool),
+        fuv == ALL,
+    )
+
+
+def gap_tables(points, params, block_size=2**15):
+    """Evaluate LIC 7 to 14 of one track for every value of their gaps.
+
+    params maps the other parameters to their values, like in
+    decide_batch. Pairs of points are compared one gap at a time, over the
+    whole track. Triples are enumerated per first gap, with the second gap
+    as an array dimension, in blocks of about block_size triples so that
+    the temporaries stay in cache. The areas, enclosing radii and angles
+    of the triples are shared by LIC 8, 9, 10, 13 and 14. The results are
+    those of the numpy engine for each gap value.
+    """
+    parameters = make_parameters(params)
+    if hasattr(points, "tolist"):
+        points = points.tolist()
+    coordinates = np.array(points, dtype=np.float64).reshape(-1, 2)
+    x, y = np.ascontiguousarray(coordinates.T)
+    n = len(x)
+    tables = GapTables(
+        *(
+            np.zeros((n,) if index in (7, 11, 12) else (n, n), bool)
+            for index in range(7, 15)
+        )
+    )
+
+    longer = squared_threshold(parameters.LENGTH1)
+    shorter = squared_threshold(parameters.LENGTH2, strict=False)
+    for gap in range(1, n - 1):
+        squared = pair_squared_distances(x, y, gap + 1)
+        tables.lic_7[gap] = np.any(squared >= longer)
+        tables.lic_12[gap] = tables.lic_7[gap] and np.any(squared < shorter)
+        tables.lic_11[gap] = np.any(pair_x_deltas(x, gap + 1) < 0)
+    if parameters.LENGTH1 < 0 or parameters.LENGTH2 < 0:
+        tables.lic_12[:] = False
+
+    radius1 = squared_threshold(parameters.RADIUS1)
+    radius2 = squared_threshold(parameters.RADIUS2)
+    for first in range(n - 2):
+        # Second gaps whose last point lies within the track, in blocks
+        count = n - 2 - first
+        step = max(block_size // (count + 1), 1)
+        for block in range(0, count, step):
+            second = np.arange(block, min(block + step, count))[:, None]
+            # First points of the windows of the smallest second gap
+            start = np.arange(n - first - block - 2)
+            last = start + first + second + 2
+            valid = last < n
+            np.minimum(last, n - 1, out=last)
+            middle = start + first + 1
+            triples = (x[start], y[start], x[middle], y[middle], x[last], y[last])
+            triples = np.broadcast_arrays(*triples)
+
+            rows = (first, slice(block, block + len(second)))
+            doubled = triple_doubled_areas(*triples)
+            radii = triple_squared_enclosing_radii(*triples)
+            angles = triple_angles(*triples)
+            tables.lic_8[rows] = _any_valid(radii >= radius1, valid)
+            tables.lic_13[rows] = tables.lic_8[rows] & _any_valid(
+                radii < radius2, valid
+            )
+            tables.lic_9[rows] = _any_valid(
+                np.abs(angles - pi) > parameters.EPSILON, valid
+            )
+            tables.lic_10[rows] = _any_valid(doubled > 2 * parameters.AREA1, valid)
+            tables.lic_14[rows] = tables.lic_10[rows] & _any_valid(
+                doubled < 2 * parameters.AREA2, valid
+            )
+
+    # Gaps of 0 only count for LIC 14
+    for table in (tables.lic_8, tables.lic_9, tables.lic_10, tables.lic_13):
+        table[0, :] = table[:, 0] = False
+    if n < 5:
+        for table in (tables.lic_8, tables.lic_10, tables.lic_13, tables.lic_14):
+            table[:] = False
+    if parameters.AREA2 < 0:
+        tables.lic_14[:] = False
+    return tables
+
+
+def _any_valid(condition, valid):
+    return np.any(condition & valid, axis=-1)
+
+
+def _checks(lic):
+    return [getattr(lic, f"lic_{index}_check") for index in range(15)]
+
+
+def _reference_cells(check, parameters, names, values, region):
+    """Grid of the results of check, evaluated one cell at a time with
+    scalar thresholds over the dimensions of region that are not fixed.
+    The thresholds are restored afterwards."""
+    thresholds = [
+        position
+        for position, name in enumerate(names)
+        if name in THRESHOLD_NAMES and region[position] == slice(None)
+    ]
+    arrays = {
+        names[position]: getattr(parameters, names[position]) for position in thresholds
+    }
+    met = np.zeros([len(axis) for axis in values], dtype=bool)
+    try:
+        for cell in product(*(range(len(values[position])) for position in thresholds)):
+            for position, value_index in zip(thresholds, cell):
+                setattr(
+                    parameters, names[position], values[position][value_index].item()
+                )
+                region[position] = value_index
+            met[tuple(region)] = check()
+    finally:
+        for position in thresholds:
+            setattr(parameters, names[position], arrays[names[position]])
+            region[position] = slice(None)
+    return met
+
+
+def _fuv_masks(cmv, puv, lcm):
+    """FUV bitmasks for an array of CMV bitmasks, from the PUV mask and a
+    CompiledLCM, like bitmask.fuv_mask."""
+    fuv = np.full_like(cmv, ALL & ~puv)
+    unmet = ~cmv & ALL
+    for index in range(15):
+        if not puv >> index & 1:
+            continue
+        own = (cmv >> index & 1).astype(bool)
+        if lcm.and_masks[index]:
+            row_met = own & ((unmet & lcm.and_masks[index]) == 0)
+        else:
+            row_met = own | ((unmet & lcm.or_masks[index]) == 0)
+        fuv |= row_met.astype(np.uint16) << index
+    return fuv
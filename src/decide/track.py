@@ -0,0 +1,189 @@
+"""Binary track files for recorded radar tracks.
+
+A track file holds one sequence of planar points:
+
+    offset  size  content
+         0     8  magic b"DECTRACK"
+         8     4  format version, little-endian uint32, currently 1
+        12     4  header size in bytes, little-endian uint32, currently 32
+        16     8  number of points, little-endian uint64
+        24     8  NumPy dtype string of the coordinates, ASCII padded with
+                  NUL bytes, "<f8" (little-endian float64) when written here
+        32        the points, x0 y0 x1 y1 ... packed without gaps
+
+open_track() memory-maps the points, so a window of a track of any size
+can be handed to the numpy engine without reading or copying the rest of
+the file. The converters turn tracks into windows in the JSON Lines and
+CSV scenario formats of the command line and back.
+
+Usage: python -m decide.track INPUT OUTPUT [--window 100] [--step N]
+"""
+
+import argparse
+import csv
+import json
+import struct
+from itertools import islice
+
+import numpy as np
+
+from .points import PointArray
+
+MAGIC = b"DECTRACK"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQ8s")
+DTYPE = "<f8"
+CHUNK_POINTS = 1 << 16  # Points per write when streaming
+
+
+class Track:
+    """A memory-mapped track file. Indexing with a slice, or window(),
+    returns a PointArray backed by the mapping, so no points are copied
+    for float64 files; len() is the number of points."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            file.seek(0, 2)
+            file_size = file.tell()
+        if len(header) < HEADER.size or header[:8] != MAGIC:
+            raise ValueError(f"{path} is not a track file")
+        _, version, header_size, count, dtype = HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Unsupported track format version {version}")
+        dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+        if dtype.kind not in "iuf":
+            raise ValueError(f"Unsupported coordinate type {dtype}")
+        if file_size < header_size + count * 2 * dtype.itemsize:
+            raise ValueError(f"{path} is truncated")
+        self.path = path
+        self.dtype = dtype
+        if count:
+            self.data = np.memmap(
+                path, dtype=dtype, mode="r", offset=header_size, shape=(count, 2)
+            )
+        else:  # Empty files cannot be mapped
+            self.data = np.empty((0, 2), dtype=dtype)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError("tracks are indexed with slices, use window()")
+        return PointArray(self.data[index])
+
+    def window(self, start, stop):
+        """Points start to stop as a PointArray over the mapping."""
+        return self[start:stop]
+
+    @property
+    def points(self):
+        """All points as a PointArray over the mapping."""
+        return self[:]
+
+    def __repr__(self):
+        return f"Track({self.path!r}, {len(self)} points)"
+
+
+def open_track(path):
+    return Track(path)
+
+
+def write_track(path, points):
+    """Write points to a track file and return their number.
+
+    points is an (n, 2) array, a buffer or any iterable of (x, y) pairs;
+    iterables are written in chunks, so a track can be converted without
+    holding it in memory.
+    """
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, HEADER.size, 0, DTYPE.encode()))
+        count = 0
+        if hasattr(points, "__array__") or isinstance(points, (list, tuple)):
+            chunks = [PointArray(points).data] if len(points) else []
+        else:
+            iterator = iter(points)
+            chunks = iter(lambda: list(islice(iterator, CHUNK_POINTS)), [])
+        for chunk in chunks:
+            array = np.asarray(chunk, dtype=DTYPE).reshape(-1, 2)
+            file.write(array.tobytes())
+            count += len(array)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, HEADER.size, count, DTYPE.encode()))
+    return count
+
+
+def track_to_scenarios(track, window=100, step=None):
+    """Scenario dicts of consecutive windows of a track, each with the
+    index of its first point as id. Windows advance by `step` points,
+    `window` by default; a shorter last window is kept if it has at least
+    2 points."""
+    step = step or window
+    if window < 2 or step < 1:
+        raise ValueError("window must be at least 2 and step at least 1")
+    for start in range(0, len(track), step):
+        points = track[start : start + window]
+        if len(points) < 2:
+            break
+        yield {"id": start, "points": points.data.tolist()}
+        if start + window >= len(track):
+            break
+
+
+def scenarios_to_points(scenarios):
+    """The points of the scenarios one after the other, the inverse of
+    track_to_scenarios with non-overlapping windows."""
+    for scenario in scenarios:
+        if "error" in scenario:
+            raise ValueError(f"scenario {scenario['id']}: {scenario['error']}")
+        for x, y in scenario["points"]:
+            yield x, y
+
+
+def write_jsonl(scenarios, file):
+    for scenario in scenarios:
+        file.write(json.dumps(scenario) + "\n")
+
+
+def write_csv(scenarios, file):
+    writer = csv.writer(file)
+    writer.writerow(("id", "x", "y"))
+    for scenario in scenarios:
+        for x, y in scenario["points"]:
+            writer.writerow((scenario["id"], repr(x), repr(y)))
+
+
+def main(argv=None):
+    from .cli import read_csv, read_jsonl
+
+    parser = argparse.ArgumentParser(
+        prog="python -m decide.track",
+        description="Convert between track files (.trk) and scenario files "
+        "(.jsonl, .csv)",
+    )
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--window", type=int, default=100, help="points per scenario")
+    parser.add_argument("--step", type=int, help="points between scenario starts")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.input.endswith(".trk"):
+            scenarios = track_to_scenarios(
+                open_track(args.input), args.window, args.step
+            )
+            write = write_csv if args.output.endswith(".csv") else write_jsonl
+            with open(args.output, "w", newline="") as file:
+                write(scenarios, file)
+        else:
+            read = read_csv if args.input.endswith(".csv") else read_jsonl
+            with open(args.input, newline="") as file:
+                count = write_track(args.output, scenarios_to_points(read(file)))
+            print(f"Wrote {count} points to {args.output}")
+    except ValueError as error:
+        parser.exit(2, f"{parser.prog}: error: {error}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import pytest
+import random
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.batch import decide_batch
+from decide.decide import PARAMETER_NAMES
+
+PARAMS = {
+    "LENGTH1": 2,
+    "RADIUS1": 1.5,
+    "EPSILON": 0.5,
+    "AREA1": 2,
+    "LENGTH2": 4,
+    "RADIUS2": 3,
+    "AREA2": 5,
+    "Q_PTS": 3,
+    "QUADS": 2,
+    "DIST": 1,
+    "N_PTS": 3,
+    "K_PTS": 1,
+    "A_PTS": 1,
+    "B_PTS": 2,
+    "C_PTS": 1,
+    "D_PTS": 1,
+    "E_PTS": 1,
+    "F_PTS": 2,
+    "G_PTS": 1,
+}
+
+
+def random_lcm(rng):
+    return [
+        [rng.choice(["ANDD", "ORR", "NOTUSED"]) for _ in range(15)] for _ in range(15)
+    ]
+
+
+def reference_decision(points, params, lcm, puv):
+    decide = Decide()
+    decide.POINTS = points
+    for name, value in params.items():
+        setattr(decide, name, value)
+    decide.LCM = lcm
+    decide.PUV = puv
+    launch = decide.decide()
+    return decide.CMV, decide.FUV, launch == "YES"
+
+
+def test_decide_batch_matches_decide_on_ragged_scenarios():
+    """Each row of the batch result equals a Decide run on that scenario."""
+    rng = random.Random(2480)
+    scenarios = [
+        [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(rng.randint(2, 15))]
+        for _ in range(200)
+    ]
+    lcm = random_lcm(rng)
+    puv = [rng.random() < 0.3 for _ in range(15)]
+
+    result = decide_batch(scenarios, PARAMS, lcm, puv)
+
+    assert result.cmv.shape == (200, 15)
+    assert result.fuv.shape == (200, 15)
+    assert result.launch.shape == (200,)
+    for index, points in enumerate(scenarios):
+        cmv, fuv, launch = reference_decision(points, PARAMS, lcm, puv)
+        assert result.cmv[index].tolist() == cmv, points
+        assert result.fuv[index].tolist() == fuv, points
+        assert bool(result.launch[index]) == launch, points
+
+
+def test_decide_batch_padded_array_with_lengths():
+    """Padding beyond each scenario's length does not affect the result."""
+    rng = np.random.default_rng(2480)
+    points = rng.integers(-4, 5, size=(50, 12, 2)).astype(float)
+    lengths = rng.integers(2, 13, size=50)
+    lcm = [["ORR"] * 15 for _ in range(15)]
+    puv = [True] * 15
+
+    padded = points.copy()
+    for index, length in enumerate(lengths):
+        padded[index, length:] = 1000.0
+
+    result = decide_batch(padded, PARAMS, lcm, puv, lengths=lengths)
+    ragged = decide_batch(
+        [points[index, :length] for index, length in enumerate(lengths)],
+        PARAMS,
+        lcm,
+        puv,
+    )
+    assert np.array_equal(result.cmv, ragged.cmv)
+    assert np.array_equal(result.fuv, ragged.fuv)
+    assert np.array_equal(result.launch, ragged.launch)
+
+
+def test_decide_batch_defaults_and_launch():
+    """Missing parameters default to 0 and an all-False PUV always launches."""
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    result = decide_batch(
+        [[(0, 0), (1, 1)], [(0, 0), (3, 4), (1, 1)]], {}, lcm, [False] * 15
+    )
+    assert result.launch.tolist() == [True, True]
+    assert result.cmv[1, 0]  # Distance 5 > LENGTH1 = 0
+
+
+def test_decide_batch_invalid_input():
+    """Invalid parameters, LCM, PUV and shapes are rejected."""
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    points = [[(0, 0), (1, 1)]]
+
+    with pytest.raises(ValueError, match="Unknown parameters: RADIUS3"):
+        decide_batch(points, {"RADIUS3": 1}, lcm, [False] * 15)
+
+    with pytest.raises(ValueError, match="LCM must be a 15x15 matrix"):
+        decide_batch(points, {}, [["ANDD"] * 15] * 14, [False] * 15)
+
+    with pytest.raises(ValueError, match="PUV must be a list of 15 boolean values"):
+        decide_batch(points, {}, lcm, [False] * 14)
+
+    with pytest.raises(ValueError, match="points_batch must have shape"):
+        decide_batch(np.zeros((2, 3)), {}, lcm, [False] * 15)
+
+    with pytest.raises(ValueError, match="lengths must give one point count"):
+        decide_batch(np.zeros((2, 3, 2)), {}, lcm, [False] * 15, lengths=[2, 4])
+
+
+def test_parameter_names_match_decide():
+    """The batch parameters are exactly the numeric parameters of Decide."""
+    decide = Decide()
+    assert all(getattr(decide, name) == 0 for name in PARAMETER_NAMES)
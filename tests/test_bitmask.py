@@ -0,0 +1,114 @@
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.bitmask import (
+    ALL,
+    compile_LCM,
+    fuv_from_pum,
+    fuv_mask,
+    pum_rows,
+    to_list,
+    to_mask,
+)
+
+
+def random_case(rng):
+    lcm = [
+        [rng.choice(["ANDD", "ORR", "NOTUSED"]) for _ in range(15)] for _ in range(15)
+    ]
+    cmv = [rng.random() < 0.6 for _ in range(15)]
+    puv = [rng.random() < 0.5 for _ in range(15)]
+    return lcm, cmv, puv
+
+
+def test_mask_round_trip():
+    """to_list inverts to_mask."""
+    values = [True, False] * 7 + [True]
+    assert to_mask(values) == 0b101010101010101
+    assert to_list(to_mask(values)) == values
+    assert to_mask([True] * 15) == ALL
+
+
+def test_bitwise_matches_list_computation():
+    """PUM rows and FUV from the masks match the definitions on lists."""
+    rng = random.Random(2480)
+    for _ in range(500):
+        lcm, cmv, puv = random_case(rng)
+        pum = [
+            [
+                {
+                    "ANDD": cmv[i] and cmv[j],
+                    "ORR": cmv[i] or cmv[j],
+                    "NOTUSED": True,
+                }[lcm[i][j]]
+                for j in range(15)
+            ]
+            for i in range(15)
+        ]
+        fuv = [not puv[i] or all(pum[i]) for i in range(15)]
+
+        compiled = compile_LCM(lcm)
+        rows = pum_rows(to_mask(cmv), compiled)
+        assert [to_list(row) for row in rows] == pum
+        assert to_list(fuv_from_pum(rows, to_mask(puv))) == fuv
+        assert to_list(fuv_mask(to_mask(cmv), to_mask(puv), compiled)) == fuv
+
+
+def test_list_views_write_through():
+    """Item assignment on the list views updates the bitmasks."""
+    decide = Decide()
+    decide._CMV[3] = True
+    decide._PUM[2][5] = False
+    assert decide._cmv == 1 << 3
+    assert decide._pum[2] == ALL & ~(1 << 5)
+    assert decide.CMV[3] is True and decide.CMV[-1] is False
+    assert decide.PUM[2][4:6] == [True, False]
+    with pytest.raises(IndexError):
+        decide.CMV[15]
+
+
+def test_row_assignment_writes_through():
+    """Assigning whole rows of the LCM and the PUM updates the decision."""
+    decide = Decide()
+    decide.LCM = [["ANDD"] * 15 for _ in range(15)]
+    assert decide.LCM is decide.LCM
+    decide.LCM[0] = ["ORR"] * 15
+    decide._LCM[-1] = ["NOTUSED"] * 14 + ["ANDD"]
+    assert decide.LCM[0] == ["ORR"] * 15
+    assert decide.LCM[14][13:] == ["NOTUSED", "ANDD"]
+    assert decide._lcm_masks == compile_LCM(decide.LCM)
+    for row in (["ORR"] * 14, ["XOR"] * 15):
+        with pytest.raises(ValueError, match="LCM must be"):
+            decide.LCM[1] = row
+    assert decide.LCM[1] == ["ANDD"] * 15
+    with pytest.raises(IndexError):
+        decide.LCM[15] = ["ORR"] * 15
+
+    decide._PUM[1] = [False] * 15
+    decide.PUM[2] = [True, None] + [False] * 13
+    assert decide._pum[1] == 0 and decide.PUM[1] == [False] * 15
+    assert decide.PUM[2][:3] == [True, None, False]
+    assert decide.PUM[:2] == [[True] * 15, [False] * 15]
+
+
+def test_LCM_item_assignment_recompiles_row():
+    """Assigning an LCM entry updates the row and its compiled masks."""
+    decide = Decide()
+    lcm = [["ANDD"] * 15 for _ in range(15)]
+    decide.LCM = lcm
+    assert decide._lcm_masks.and_masks == (ALL,) * 15
+    decide.LCM[0][0] = "ORR"
+    decide._LCM[3][-1] = "NOTUSED"
+    assert decide.LCM[0][0] == "ORR" and decide.LCM[3][14] == "NOTUSED"
+    assert decide._lcm_masks == compile_LCM(decide.LCM)
+    assert decide._lcm_masks.or_masks[0] == 1
+    assert lcm[0][0] == "ANDD"  # The assigned matrix is copied
+    with pytest.raises(ValueError, match="LCM must be"):
+        decide.LCM[1][1] = "XOR"
+    with pytest.raises(IndexError):
+        decide.LCM[1][15] = "ORR"
+    assert decide.LCM == [list(row) for row in decide.LCM]
@@ -0,0 +1,107 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.cache import DecisionCache, decision_key
+
+POINTS = [(0, 0), (3, 4), (6, 0), (1, 1), (-2, 5)]
+
+
+def make_decide(cache, points=POINTS, **options):
+    decide = Decide(cache=cache, **options)
+    decide.POINTS = list(points)
+    decide.LENGTH1 = 4
+    decide.N_PTS = 3
+    decide.LCM = [["ANDD"] * 15 for _ in range(15)]
+    decide.PUV = [index < 3 for index in range(15)]
+    return decide
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hits_restore_the_decision_without_evaluating(monkeypatch):
+    cache = DecisionCache()
+    first = make_decide(cache)
+    launch = first.decide()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    second = make_decide(cache)
+    monkeypatch.setattr(second, "_evaluate_decision", lambda: pytest.fail("evaluated"))
+    assert second.decide() == launch
+    assert list(second.CMV) == list(first.CMV)
+    assert [list(row) for row in second.PUM] == [list(row) for row in first.PUM]
+    assert list(second.FUV) == list(first.FUV)
+    assert second.stats == first.stats
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+    # The restored PUM is a copy of the cached one
+    second._pum[0] = 0
+    third = make_decide(cache)
+    third.decide()
+    assert list(third.PUM[0]) == list(first.PUM[0])
+
+
+def test_key_covers_points_parameters_lcm_puv_and_mode():
+    cache = DecisionCache()
+    base = decision_key(make_decide(cache))
+    assert decision_key(make_decide(cache, [(float(x), y) for x, y in POINTS])) == base
+    assert decision_key(make_decide(cache, POINTS[:-1] + [(-2, 6)])) != base
+    assert decision_key(make_decide(cache, exact=True)) != base
+    assert decision_key(make_decide(cache, demand_driven=True)) != base
+    changed = make_decide(cache)
+    changed.AREA1 = 1
+    assert decision_key(changed) != base
+    changed = make_decide(cache)
+    changed.PUV = [True] * 15
+    assert decision_key(changed) != base
+    changed = make_decide(cache)
+    changed.LCM = [["ORR"] * 15 for _ in range(15)]
+    assert decision_key(changed) != base
+
+
+def test_key_of_array_points():
+    np = pytest.importorskip("numpy")
+    cache = DecisionCache()
+    decide = make_decide(cache)
+    decide.POINTS = np.array(POINTS, dtype=np.float64)
+    assert decision_key(decide) == decision_key(make_decide(cache))
+
+
+def test_size_bytes_and_ttl_eviction():
+    clock = FakeClock()
+    cache = DecisionCache(maxsize=2, ttl=10, clock=clock)
+    for shift in range(3):
+        make_decide(cache, [(x + shift, y) for x, y in POINTS]).decide()
+    assert len(cache) == 2 and cache.evictions == 1
+
+    clock.now = 5
+    make_decide(cache, [(x + 2, y) for x, y in POINTS]).decide()
+    assert cache.hits == 1
+    clock.now = 11
+    make_decide(cache, [(x + 2, y) for x, y in POINTS]).decide()
+    assert cache.expirations == 1 and cache.misses == 4
+
+    cache = DecisionCache(max_bytes=1)
+    make_decide(cache).decide()
+    assert len(cache) == 0 and cache.bytes == 0
+    cache = DecisionCache()
+    make_decide(cache).decide()
+    assert cache.bytes > 0
+    cache.clear()
+    assert len(cache) == 0 and cache.bytes == 0
+
+
+def test_instrumented_decisions_bypass_the_cache():
+    cache = DecisionCache()
+    decide = make_decide(cache, instrumented=True)
+    decide.decide()
+    decide.decide()
+    assert len(cache) == 0 and decide.profile is not None
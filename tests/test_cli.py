@@ -0,0 +1,173 @@
+import io
+import json
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.cli import evaluate_parallel, main, read_csv, read_jsonl
+
+PARAMS = {"LENGTH1": 4, "RADIUS1": 2, "AREA1": 3, "N_PTS": 3, "DIST": 1}
+LCM = [["NOTUSED"] * 15 for _ in range(15)]
+LCM[0][3] = LCM[3][0] = "ANDD"
+LCM[6][1] = "ORR"
+PUV = [index in (0, 6) for index in range(15)]
+
+
+def reference(points, params=PARAMS):
+    decide = Decide()
+    decide.POINTS = [tuple(point) for point in points]
+    for name, value in params.items():
+        setattr(decide, name, value)
+    decide.LCM, decide.PUV = LCM, PUV
+    launch = decide.decide()
+    return {"LAUNCH": launch, "CMV": list(decide.CMV), "FUV": list(decide.FUV)}
+
+
+def random_scenarios(count, seed=2480):
+    rng = random.Random(seed)
+    return [
+        [[rng.randint(-4, 4), rng.randint(-4, 4)] for _ in range(rng.randint(2, 30))]
+        for _ in range(count)
+    ]
+
+
+def run(argv, capsys, stdin=""):
+    sys.stdin = io.StringIO(stdin)
+    try:
+        main(argv)
+    finally:
+        sys.stdin = sys.__stdin__
+    out, err = capsys.readouterr()
+    return [json.loads(line) for line in out.splitlines()], err
+
+
+def test_jsonl_from_stdin_with_default_configuration(tmp_path, capsys):
+    configuration = tmp_path / "configuration.json"
+    configuration.write_text(json.dumps({"parameters": PARAMS, "LCM": LCM, "PUV": PUV}))
+    scenarios = random_scenarios(40)
+    lines = [json.dumps({"points": points}) for points in scenarios]
+    # A scenario can override the defaults
+    lines.append(
+        json.dumps({"id": "own", "points": scenarios[0], "parameters": {"N_PTS": 3}})
+    )
+    results, err = run(
+        ["--configuration", str(configuration), "--stats"],
+        capsys,
+        "\n".join(lines) + "\n",
+    )
+    assert [result.pop("id") for result in results] == list(range(1, 41)) + ["own"]
+    for points, result in zip(scenarios, results):
+        assert result == reference(points)
+    assert results[-1]["CMV"][0] == reference(scenarios[0], {"N_PTS": 3})["CMV"][0]
+    assert "41 scenarios (0 errors)" in err and "scenarios/s" in err
+
+
+def test_csv_file_groups_rows_by_id(tmp_path, capsys):
+    path = tmp_path / "scenarios.csv"
+    rows = ["id,x,y,LENGTH1,N_PTS,LCM,PUV"]
+    scenarios = random_scenarios(5)
+    for index, points in enumerate(scenarios):
+        lcm = json.dumps(LCM).replace('"', '""')  # Quoted JSON
+        puv = json.dumps(PUV)
+        rows.append(f'{index},{points[0][0]},{points[0][1]},4,3,"{lcm}","{puv}"')
+        rows += [f"{index},{x},{y},,,," for x, y in points[1:]]
+    rows.append("bad,1,one,,,,")
+    path.write_text("\n".join(rows) + "\n")
+    results, _ = run([str(path)], capsys)
+    for index, (points, result) in enumerate(zip(scenarios, results)):
+        assert result.pop("id") == str(index)
+        assert result == reference(points, {"LENGTH1": 4, "N_PTS": 3})
+    assert results[-1]["id"] == "bad" and "error" in results[-1]
+
+
+def test_invalid_scenarios_are_reported_per_line():
+    lines = [
+        "not json",
+        json.dumps({"id": "a", "points": [[0, 0], [1, 1]]}),
+        json.dumps(
+            {
+                "id": "b",
+                "points": [[0, 0]],
+                "parameters": PARAMS,
+                "LCM": LCM,
+                "PUV": PUV,
+            }
+        ),
+        json.dumps({"id": "c", "points": [[0, 0], [1, 1]], "LCM": LCM, "PUV": PUV}),
+    ]
+    defaults = {"parameters": {"N_PTS": 0}}
+    results = list(evaluate_parallel(read_jsonl(lines, defaults), workers=2))
+    assert results[0]["id"] == 1 and "error" in results[0]
+    assert results[1] == {"id": "a", "error": "LCM is missing"}
+    assert results[2]["error"] == "POINTS must contain between 2 and 100 points"
+    assert results[3]["error"] == "N_PTS must be at least 1"
+
+
+def test_failed_scenarios_do_not_stop_the_stream(capsys):
+    # Coordinates whose squares overflow, then a valid scenario
+    scenarios = [[[0, 0], [1e200, 1], [2, 2]], [[0, 0], [5, 5]]]
+    stdin = "\n".join(
+        json.dumps(
+            {
+                "id": index,
+                "points": points,
+                "parameters": PARAMS,
+                "LCM": LCM,
+                "PUV": PUV,
+            }
+        )
+        for index, points in enumerate(scenarios)
+    )
+    results, _ = run([], capsys, stdin)
+    assert results[0]["id"] == 0 and "error" in results[0]
+    assert results[1] == {"id": 1, **reference([[0, 0], [5, 5]])}
+
+
+def test_csv_rows_with_missing_fields():
+    lines = ["id,x,y,LENGTH1", "a,1", "b,0,0,4", "b,1,1", "c,0,0", "c,2,2,"]
+    scenarios = list(read_csv(lines))
+    assert scenarios[0] == {"id": "a", "error": "row has fewer fields than the header"}
+    assert scenarios[1] == {
+        "id": "b",
+        "points": [(0, 0), (1, 1)],
+        "parameters": {"LENGTH1": 4},
+    }
+    assert scenarios[2] == {"id": "c", "points": [(0, 0), (2, 2)]}
+
+
+def test_large_input_option(capsys):
+    points = [[index % 7, index % 5] for index in range(150)]
+    stdin = json.dumps({"points": points, "parameters": PARAMS, "LCM": LCM, "PUV": PUV})
+    results, _ = run([], capsys, stdin)
+    assert results[0]["error"] == "POINTS must contain between 2 and 100 points"
+    results, _ = run(["--large-input"], capsys, stdin)
+    decide = Decide(large_input=True)
+    decide.POINTS = [tuple(point) for point in points]
+    for name, value in PARAMS.items():
+        setattr(decide, name, value)
+    decide.LCM, decide.PUV = LCM, PUV
+    assert results[0]["LAUNCH"] == decide.decide()
+    assert results[0]["CMV"] == list(decide.CMV)
+
+
+def test_parallel_results_keep_input_order(capsys):
+    scenarios = random_scenarios(600, seed=3)
+    lines = [
+        json.dumps({"id": index, "points": points, "parameters": PARAMS})
+        for index, points in enumerate(scenarios)
+    ]
+    defaults = {"LCM": LCM, "PUV": PUV}
+    results = list(evaluate_parallel(read_jsonl(lines, defaults), workers=2))
+    assert [result["id"] for result in results] == list(range(600))
+    for points, result in zip(scenarios[:50], results):
+        del result["id"]
+        assert result == reference(points)
+
+
+def test_csv_needs_point_columns():
+    with pytest.raises(ValueError, match="needs the columns id"):
+        list(read_csv(["x,y", "0,0"]))
@@ -228,3 +228,116 @@ def test_calculate_FUV():
             )
         else:
             assert decide._FUV[i], f"FUV[{i}] should be True because PUV[{i}] is False"
+
+
+def test_engine_selection():
+    """Test that the LIC engine can be selected and switched."""
+    decide = Decide(engine="numpy")
+    assert type(decide.LIC).__name__ == "VectorizedLIC"
+
+    decide.engine = "python"
+    assert type(decide.LIC).__name__ == "LIC"
+
+    decide.engine = "summary"
+    assert type(decide.LIC).__name__ == "SummaryLIC"
+
+    with pytest.raises(ValueError, match="engine must be "):
+        Decide(engine="fortran")
+
+    with pytest.raises(ValueError, match="exact arithmetic is only available"):
+        Decide(exact=True, engine="numpy")
+
+    # Exact mode is kept when the engine is changed afterwards
+    decide = Decide(exact=True)
+    for engine in ["numpy", "summary"]:
+        with pytest.raises(ValueError, match="exact arithmetic is only available"):
+            decide.engine = engine
+        assert decide.engine == "python" and type(decide.LIC).__name__ == "LIC"
+
+
+def test_calculate_CMV_engines_agree():
+    """Test that calculate_CMV gives the same vector with both engines."""
+    vectors = []
+    for engine in ["python", "numpy", "summary"]:
+        decide = Decide(engine=engine)
+        decide.POINTS = [(0, 0), (4, 0), (4, 3), (-1, 2), (-3, -3), (2, -1), (0, 0)]
+        decide.LENGTH1 = 3
+        decide.RADIUS1 = 2
+        decide.EPSILON = 0.5
+        decide.AREA1 = 4
+        decide.Q_PTS, decide.QUADS = 3, 2
+        decide.N_PTS, decide.DIST = 4, 1
+        decide.K_PTS = decide.A_PTS = decide.B_PTS = 1
+        decide.C_PTS = decide.D_PTS = decide.E_PTS = decide.F_PTS = 1
+        decide.G_PTS = 1
+        decide.LENGTH2, decide.RADIUS2, decide.AREA2 = 10, 10, 10
+        decide.calculate_CMV()
+        vectors.append(list(decide._CMV))
+    assert vectors[0] == vectors[1] == vectors[2]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "summary"])
+def test_engines_follow_in_place_changes_of_POINTS(engine):
+    """Engines caching the geometry of the points see in-place changes."""
+    points = [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)]
+    decide, reference = Decide(engine=engine), Decide()
+    for instance in (decide, reference):
+        instance.POINTS = points
+        instance.LENGTH1 = 5
+        instance.RADIUS1 = 3
+        instance.AREA1 = 1
+        instance.N_PTS = 3
+    changes = [
+        lambda points: points.__setitem__(1, (10, 0)),
+        lambda points: points.__setitem__(slice(2, 4), [(0, 5), (5, 5)]),
+        lambda points: points.reverse(),
+        lambda points: points.sort(key=lambda point: point[1]),
+    ]
+    for change in changes:
+        change(decide.POINTS)
+        change(reference.POINTS)
+        decide.calculate_CMV()
+        reference.calculate_CMV()
+        assert list(decide.CMV) == list(reference.CMV)
+
+    # The assigned list is copied
+    points[0] = (100, 100)
+    assert decide.POINTS[0] != (100, 100)
+
+
+def test_large_input_lifts_point_limit():
+    """Test that the large input mode accepts more than 100 points."""
+    decide = Decide(large_input=True)
+    decide.POINTS = [(index, index % 7) for index in range(1000)]
+    assert decide.NUMPOINTS == 1000
+    assert decide.engine == "numpy"
+
+    decide = Decide(large_input=True)
+    decide.NUMPOINTS = 5000
+    assert decide.NUMPOINTS == 5000
+
+    with pytest.raises(ValueError, match="POINTS must contain at least 2 points"):
+        Decide(large_input=True).POINTS = [(0, 0)]
+
+    with pytest.raises(ValueError, match="the large input mode requires the numpy"):
+        Decide(large_input=True, engine="python")
+
+
+def test_large_input_accepts_point_arrays():
+    """Test that the large input mode accepts (n, 2) NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    track = np.column_stack([np.arange(200_000), np.sin(np.arange(200_000))])
+
+    decide = Decide(large_input=True)
+    decide.POINTS = track
+    decide.LENGTH1 = 1.5
+    decide.K_PTS = 1
+    assert decide.NUMPOINTS == 200_000
+    assert decide.LIC.lic_0_check() is False
+    assert decide.LIC.lic_7_check() is True
+
+    with pytest.raises(ValueError, match="POINTS must be a list of tuples"):
+        Decide(large_input=True).POINTS = np.zeros((10, 3))
+
+    with pytest.raises(ValueError, match="POINTS must contain only numeric"):
+        Decide(large_input=True).POINTS = np.array([["a", "b"], ["c", "d"]])
@@ -1,5 +1,6 @@
 import pytest
-from math import sqrt
+import random
+from math import sqrt, pi
 import sys
 import os
 
@@ -8,9 +9,39 @@ from decide.helpers import (
     calculate_distance,
     calculate_triangle_area,
     calculate_circumcenter,
+    calculate_circumcenter_exact,
+    calculate_circumradius,
+    calculate_enclosing_radius,
+    calculate_enclosing_radius_exact,
+    enclosing_radius_squared,
+    calculate_angle,
+    calculate_quadrant,
 )
 
 
+def random_triples(count, seed=2480):
+    """Random triangles with integer and float coordinates, mixed with
+    collinear and coinciding integer triples to exercise the degenerate cases."""
+    rng = random.Random(seed)
+    triples = []
+    for index in range(count):
+        if index % 2:
+            p1, p2, p3 = [
+                (rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(3)
+            ]
+        else:
+            p1, p2, p3 = [
+                (rng.randint(-50, 50), rng.randint(-50, 50)) for _ in range(3)
+            ]
+        if index % 10 == 4:  # Collinear: p3 on the line through p1 and p2
+            t = rng.randint(-3, 3)
+            p3 = (p1[0] + t * (p2[0] - p1[0]), p1[1] + t * (p2[1] - p1[1]))
+        elif index % 10 == 8:  # Two coinciding points
+            p2 = p1
+        triples.append((p1, p2, p3))
+    return triples
+
+
 class TestAllHelpers:
     @pytest.mark.parametrize(
         "p1, p2, p3, expected",
@@ -58,4 +89,103 @@ class TestAllHelpers:
         ],
     )
     def test_calculate_circumcenter(self, p1, p2, p3, expected):
-        assert calculate_circumcenter(p1, p2, p3) == expected
+        circumcenter = calculate_circumcenter(p1, p2, p3)
+        if expected is None:
+            assert circumcenter is None
+        else:
+            assert all(isinstance(coord, float) for coord in circumcenter)
+            assert circumcenter == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "p1, p2, p3, expected",
+        [
+            ((0, 0), (0, 0), (0, 0), None),  # coinciding points
+            ((0, 0), (1, 1), (2, 2), None),  # colinear points
+            ((0, 0), (2, 0), (1, 3**0.5), 2 / 3**0.5),  # Equilateral triangle
+            ((0, 0), (0, 1), (1, 1), sqrt(2) / 2),  # Right triangle
+            ((0, 0), (6, 0), (3, 4), 25 / 8),  # Isosceles triangle
+        ],
+    )
+    def test_calculate_circumradius(self, p1, p2, p3, expected):
+        circumradius = calculate_circumradius(p1, p2, p3)
+        if expected is None:
+            assert circumradius is None
+        else:
+            assert circumradius == pytest.approx(expected)
+
+    @pytest.mark.parametrize("count", [100, pytest.param(5000, marks=pytest.mark.slow)])
+    def test_calculate_circumcenter_matches_exact(self, count):
+        """The closed-form circumcenter agrees with the SymPy reference. The
+        corpus of 5000 triples takes minutes and runs with --run-slow."""
+        pytest.importorskip("sympy")
+        for p1, p2, p3 in random_triples(count):
+            exact = calculate_circumcenter_exact(p1, p2, p3)
+            circumcenter = calculate_circumcenter(p1, p2, p3)
+            if exact is None:
+                assert circumcenter is None, (p1, p2, p3)
+                continue
+            expected = (float(exact[0]), float(exact[1]))
+            assert circumcenter == pytest.approx(expected, rel=1e-9, abs=1e-9), (
+                p1,
+                p2,
+                p3,
+            )
+            assert calculate_circumradius(p1, p2, p3) == pytest.approx(
+                calculate_distance(expected, p1), rel=1e-9
+            )
+
+    @pytest.mark.parametrize(
+        "p1, p2, p3, expected",
+        [
+            ((0, 0), (0, 0), (0, 0), 0),  # coinciding points
+            ((0, 0), (0, 0), (2, 0), 1),
+            ((0, 0), (1, 0), (3, 0), 1.5),  # colinear points
+            ((0, 0), (4, 0), (1, 1), 2),  # Obtuse triangle
+            ((0, 0), (4, 0), (0, 3), 2.5),  # Right triangle
+            ((0, 0), (4, 0), (2, 3), 13 / 6),  # Acute triangle
+        ],
+    )
+    def test_calculate_enclosing_radius(self, p1, p2, p3, expected):
+        for a, b, c in [(p1, p2, p3), (p3, p1, p2), (p2, p1, p3)]:
+            assert calculate_enclosing_radius(a, b, c) == pytest.approx(expected)
+        assert enclosing_radius_squared(p1, p2, p3) == pytest.approx(expected**2)
+
+    def test_calculate_enclosing_radius_matches_exact(self):
+        pytest.importorskip("sympy")
+        for p1, p2, p3 in random_triples(100):
+            assert calculate_enclosing_radius(p1, p2, p3) == pytest.approx(
+                float(calculate_enclosing_radius_exact(p1, p2, p3)), rel=1e-9
+            ), (p1, p2, p3)
+
+    @pytest.mark.parametrize(
+        "p1, p2, p3, expected",
+        [
+            ((1, 0), (0, 0), (0, 1), pi / 2),
+            ((0, 0), (0, 0), (1, 1), None),  # vertex coincides with a point
+            ((-2, -3), (0, 0), (2, 3), pi),  # rounding pushes cos past -1
+            ((2, 3), (0, 0), (2, 3), 0),  # rounding pushes cos past 1
+        ],
+    )
+    def test_calculate_angle(self, p1, p2, p3, expected):
+        angle = calculate_angle(p1, p2, p3)
+        if expected is None:
+            assert angle is None
+        else:
+            assert angle == pytest.approx(expected, abs=1e-7)
+
+    @pytest.mark.parametrize(
+        "point, expected",
+        [
+            ((1, 2), 1),
+            ((-1, 2), 2),
+            ((-1, -2), 3),
+            ((1, -2), 4),
+            ((0, 0), 1),  # the origin and the positive axes are in quadrant 1
+            ((3, 0), 1),
+            ((0, 3), 1),
+            ((-3, 0), 0),  # the negative axes are in no quadrant
+            ((0, -3), 0),
+        ],
+    )
+    def test_calculate_quadrant(self, point, expected):
+        assert calculate_quadrant(point) == expected
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+
+# Cold-start budget for `import decide`, in microseconds of cumulative
+# import time as reported by `python -X importtime`.
+IMPORT_BUDGET_US = 100_000
+
+
+def run_python(code, *flags):
+    """Run code in a fresh interpreter with the package on the path."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def test_import_does_not_load_sympy():
+    """Importing the package must not pull in SymPy."""
+    result = run_python("import sys, decide; print('sympy' in sys.modules)")
+    assert result.stdout.strip() == "False"
+
+
+def test_import_time_within_budget():
+    """Guard the cold-start cost of `import decide`."""
+    result = run_python("import decide", "-X", "importtime")
+    cumulative = None
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <package>"
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "decide":
+            cumulative = int(fields[1])
+    assert cumulative is not None, result.stderr
+    assert cumulative < IMPORT_BUDGET_US, f"import decide took {cumulative} us"
+
+
+def test_exact_mode_loads_sympy():
+    """SymPy is only imported once exact arithmetic is actually used."""
+    pytest.importorskip("sympy")
+    code = (
+        "import sys\n"
+        "from decide import Decide\n"
+        "decide = Decide(exact=True)\n"
+        "decide.POINTS = [(0, 0), (3, 0), (1.5, 2.598)]\n"
+        "decide.RADIUS1 = 2.0\n"
+        "loaded = 'sympy' in sys.modules\n"
+        "result = decide.LIC.lic_1_check()\n"
+        "print(loaded, 'sympy' in sys.modules, result)"
+    )
+    result = run_python(code)
+    assert result.stdout.split() == ["False", "True", "False"]
+
+
+def test_cli_does_not_load_the_server():
+    """`python -m decide` does not pull in the daemon, asyncio or NumPy."""
+    result = run_python(
+        "import sys, decide.cli\n"
+        "print([name in sys.modules for name in "
+        "('decide.server', 'asyncio', 'numpy')])"
+    )
+    assert result.stdout.strip() == "[False, False, False]"
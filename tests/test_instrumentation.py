@@ -0,0 +1,141 @@
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide import helpers, lic
+
+
+def make_decide(**options):
+    decide = Decide(**options)
+    decide.POINTS = [(0, 0), (5, 0), (5, 1), (6, 1), (6, 2), (7, 3)]
+    decide.LENGTH1, decide.RADIUS1, decide.AREA1 = 3, 1, 0.25
+    decide.N_PTS, decide.Q_PTS, decide.QUADS = 3, 2, 1
+    decide.K_PTS = decide.A_PTS = decide.B_PTS = decide.C_PTS = 1
+    decide.D_PTS = decide.E_PTS = decide.F_PTS = decide.G_PTS = 1
+    return decide
+
+
+def test_profile_records_stages_lics_and_helpers():
+    decide = make_decide(instrumented=True)
+    decide.decide()
+    profile = decide.profile
+
+    assert set(profile.stage_seconds) == {
+        "decide",
+        "calculate_CMV",
+        "calculate_PUM",
+        "calculate_FUV",
+    }
+    assert profile.stage_seconds["decide"] >= profile.stage_seconds["calculate_CMV"]
+    assert all(seconds >= 0 for seconds in profile.lic_seconds)
+    # LIC 0 stops at the first pair, LIC 5 never finds x decreasing
+    assert profile.scan_extent[0] == 2
+    assert profile.points_read[0] == 2
+    assert profile.scan_extent[5] == 6
+    assert profile.helper_calls["calculate_distance"] >= 1
+    assert profile.helper_seconds["calculate_distance"] >= 0
+    # The helpers are restored afterwards
+    assert lic.calculate_distance is helpers.calculate_distance
+
+
+def test_profile_counts_sympy_calls_in_exact_mode():
+    pytest.importorskip("sympy")
+    decide = make_decide(instrumented=True, exact=True)
+    # Acute triangles, whose enclosing circle is the circumcircle
+    decide.POINTS = [(0, 0), (4, 0), (2, 3), (0, 1), (4, 1), (2, 4)]
+    decide.RADIUS1 = 100
+    decide.decide()
+    calls = decide.profile.helper_calls
+    assert (
+        calls["calculate_circumcenter_exact"] == calls["calculate_circumradius_exact"]
+    )
+    assert calls["calculate_circumradius_exact"] > 0
+    assert (
+        calls["calculate_enclosing_radius_exact"]
+        >= calls["calculate_circumradius_exact"]
+    )
+
+
+def test_profile_of_demand_driven_and_numpy_decisions():
+    decide = make_decide(instrumented=True, demand_driven=True, engine="numpy")
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    lcm[0][3] = "ANDD"
+    decide.LCM = lcm
+    decide.PUV = [True] + [False] * 14
+    decide.decide()
+    profile = decide.profile
+
+    assert set(profile.stage_seconds) == {"decide", "decide_on_demand"}
+    evaluated = [index for index in range(15) if profile.lic_seconds[index] is not None]
+    assert evaluated == sorted(decide.stats.evaluated) == [0, 3]
+    assert profile.points_read == [None] * 15
+
+
+def test_helper_counts_ignore_decisions_in_other_threads():
+    decide = make_decide(instrumented=True)
+    decide.decide()
+    expected = dict(decide.profile.helper_calls)
+
+    stop = threading.Event()
+
+    def decide_until_stopped(options):
+        other = make_decide(**options)
+        while not stop.is_set():
+            other.decide()
+
+    threads = [
+        threading.Thread(target=decide_until_stopped, args=(options,))
+        for options in ({}, {"instrumented": True})
+    ]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for _ in range(20):
+            decide.decide()
+            assert decide.profile.helper_calls == expected
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(interval)
+    assert lic.calculate_distance is helpers.calculate_distance
+
+
+def test_profiling_leaves_the_instance_and_helpers_untouched():
+    decide = make_decide(instrumented=True)
+    points = decide.POINTS
+    stop = threading.Event()
+    seen = set()
+
+    def read_points():
+        while not stop.is_set():
+            seen.add(type(decide.POINTS))
+
+    reader = threading.Thread(target=read_points)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        reader.start()
+        for _ in range(20):
+            decide.decide()
+    finally:
+        stop.set()
+        reader.join()
+        sys.setswitchinterval(interval)
+    assert seen == {type(points)}
+    assert decide.POINTS is points
+    assert decide.profile.helper_calls["calculate_distance"] >= 1
+    # Decisions without a profile call the helpers directly
+    assert decide.LIC.helpers is lic.HELPERS
+    assert lic.HELPERS.calculate_distance is helpers.calculate_distance
+
+
+def test_no_profile_without_instrumentation():
+    decide = make_decide()
+    decide.decide()
+    assert decide.profile is None
@@ -1,10 +1,19 @@
 import pytest
-from math import pi
+import random
+from math import pi, sqrt
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 from decide import Decide
+from decide.helpers import calculate_quadrant
+
+
+@pytest.fixture(params=["python", "numpy", "summary"])
+def engine(request):
+    """Run every LIC case against the reference, the NumPy and the summary
+    engine."""
+    return request.param
 
 
 class TestAllLicChecks:
@@ -25,8 +34,8 @@ class TestAllLicChecks:
             ),  # Distance between (1,1) and (4,5) ≈ 5 > 4
         ],
     )
-    def test_lic_0_check(self, data_points, length1, expected):
-        decide = Decide()
+    def test_lic_0_check(self, engine, data_points, length1, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.LENGTH1 = length1
         assert decide.LIC.lic_0_check() == expected
@@ -76,10 +85,14 @@ class TestAllLicChecks:
                 0.0,
                 False,
             ),  # identical points
+            # Obtuse triangle: the longest side is the smallest diameter,
+            # although the circumradius is larger
+            ([(0, 0), (4, 0), (1, 1)], 2.0, False),
+            ([(0, 0), (4, 0), (1, 1)], 1.99, True),
         ],
     )
-    def test_lic_1_check(self, data_points, radius1, expected):
-        decide = Decide()
+    def test_lic_1_check(self, engine, data_points, radius1, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.RADIUS1 = radius1
         assert decide.LIC.lic_1_check() == expected
@@ -120,8 +133,8 @@ class TestAllLicChecks:
             ),  # Non-colinear triplet satisfies with epsilon=0
         ],
     )
-    def test_lic_2_check(self, data_points, epsilon, expected):
-        decide = Decide()
+    def test_lic_2_check(self, engine, data_points, epsilon, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.EPSILON = epsilon
         assert decide.LIC.lic_2_check() == expected
@@ -207,8 +220,8 @@ class TestAllLicChecks:
             ),  # Colinear, area = 0, not > 0
         ],
     )
-    def test_lic_3_check(self, data_points, area1, expected):
-        decide = Decide()
+    def test_lic_3_check(self, engine, data_points, area1, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.AREA1 = area1
         assert decide.LIC.lic_3_check() == expected
@@ -258,10 +271,24 @@ class TestAllLicChecks:
                 1,
                 False,
             ),
+            # Test with points on the negative axes, which lie in no quadrant
+            (
+                [(-1, 0), (0, -2), (1, 1), (-3, 0)],
+                4,
+                1,
+                False,
+            ),
+            # Test with the only window in enough quadrants at the end
+            (
+                [(1, 1), (2, 2), (3, 3), (1, 1), (-1, 1), (-1, -1)],
+                3,
+                2,
+                True,
+            ),
         ],
     )
-    def test_lic_4_check(self, data_points, q_pts, quads, expected):
-        decide = Decide()
+    def test_lic_4_check(self, engine, data_points, q_pts, quads, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.Q_PTS = q_pts
         decide.QUADS = quads
@@ -297,8 +324,8 @@ class TestAllLicChecks:
             ),
         ],
     )
-    def test_lic_5_check(self, data_points, expected):
-        decide = Decide()
+    def test_lic_5_check(self, engine, data_points, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         assert decide.LIC.lic_5_check() == expected
 
@@ -356,8 +383,8 @@ class TestAllLicChecks:
             ),
         ],
     )
-    def test_lic_6_check(self, data_points, dist, n_pts, expected):
-        decide = Decide()
+    def test_lic_6_check(self, engine, data_points, dist, n_pts, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.DIST = dist
         decide.N_PTS = n_pts
@@ -410,8 +437,8 @@ class TestAllLicChecks:
             ),
         ],
     )
-    def test_lic_7_check(self, data_points, k_pts, length1, expected):
-        decide = Decide()
+    def test_lic_7_check(self, engine, data_points, k_pts, length1, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.K_PTS = k_pts
         decide.LENGTH1 = length1
@@ -484,10 +511,20 @@ class TestAllLicChecks:
                 1,
                 False,
             ),
+            # Test with collinear points where rounding makes Heron's product negative
+            (
+                [(-1, 1), (0, 0), (0, 0), (2, -2), (0, 0), (0, 0), (0, 0), (-2, 2)],
+                2,
+                3,
+                3.5,
+                False,
+            ),
+            # Obtuse triangle contained in the circle on its longest side
+            ([(0, 0), (9, 9), (4, 0), (9, 9), (1, 1)], 1, 1, 2, False),
         ],
     )
-    def test_lic_8_check(self, data_points, a_pts, b_pts, radius1, expected):
-        decide = Decide()
+    def test_lic_8_check(self, engine, data_points, a_pts, b_pts, radius1, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.A_PTS = a_pts
         decide.B_PTS = b_pts
@@ -582,8 +619,8 @@ class TestAllLicChecks:
             ),
         ],
     )
-    def test_lic_9_check(self, data_points, c_pts, d_pts, epsilon, expected):
-        decide = Decide()
+    def test_lic_9_check(self, engine, data_points, c_pts, d_pts, epsilon, expected):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.C_PTS = c_pts
         decide.D_PTS = d_pts
@@ -680,8 +717,10 @@ class TestAllLicChecks:
             ),
         ],
     )
-    def test_lic_10_check(self, data_points, numpoints, e_pts, f_pts, area1, expected):
-        decide = Decide()
+    def test_lic_10_check(
+        self, engine, data_points, numpoints, e_pts, f_pts, area1, expected
+    ):
+        decide = Decide(engine=engine)
         decide.NUMPOINTS = numpoints
         decide.POINTS = data_points
         decide.E_PTS = e_pts
@@ -716,8 +755,8 @@ class TestAllLicChecks:
             ([(-2, 2), (1, 0), (5, 5), (3, 3), (1, 1), (4, 4), (2, 2)], 7, 2, True),
         ],
     )
-    def test_lic_11_check(self, data_points, numpoints, g_pts, expected):
-        decide = Decide()
+    def test_lic_11_check(self, engine, data_points, numpoints, g_pts, expected):
+        decide = Decide(engine=engine)
         decide.NUMPOINTS = numpoints
         decide.POINTS = data_points
         decide.G_PTS = g_pts
@@ -759,9 +798,9 @@ class TestAllLicChecks:
         ],
     )
     def test_lic_12_check(
-        self, data_points, numpoints, k_pts, length1, length2, expected
+        self, engine, data_points, numpoints, k_pts, length1, length2, expected
     ):
-        decide = Decide()
+        decide = Decide(engine=engine)
         decide.NUMPOINTS = numpoints
         decide.POINTS = data_points
         decide.K_PTS = k_pts
@@ -835,10 +874,15 @@ class TestAllLicChecks:
                 1,
                 False,
             ),
+            # An obtuse triangle lying on a circle of radius RADIUS2
+            ([(0, 0), (0, 0), (4, 0), (0, 0), (1, 1)], 1, 1, 1.5, 2, True),
+            ([(0, 0), (0, 0), (4, 0), (0, 0), (1, 1)], 1, 1, 1.5, 1.99, False),
         ],
     )
-    def test_lic_13_check(self, data_points, a_pts, b_pts, radius1, radius2, expected):
-        decide = Decide()
+    def test_lic_13_check(
+        self, engine, data_points, a_pts, b_pts, radius1, radius2, expected
+    ):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.A_PTS = a_pts
         decide.B_PTS = b_pts
@@ -931,11 +975,215 @@ class TestAllLicChecks:
             ),  # invalid AREA2
         ],
     )
-    def test_lic_14_check(self, data_points, e_pts, f_pts, area1, area2, expected):
-        decide = Decide()
+    def test_lic_14_check(
+        self, engine, data_points, e_pts, f_pts, area1, area2, expected
+    ):
+        decide = Decide(engine=engine)
         decide.POINTS = data_points
         decide.E_PTS = e_pts
         decide.F_PTS = f_pts
         decide.AREA1 = area1
         decide.AREA2 = area2
         assert decide.LIC.lic_14_check() == expected
+
+
+def random_decide(rng, engine):
+    """Decide instance with a random small-integer track and random parameters,
+    so that duplicates, collinear triples and axis points occur often."""
+    decide = Decide(engine=engine)
+    decide.POINTS = [
+        (rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(rng.randint(2, 12))
+    ]
+    for name in ["LENGTH1", "RADIUS1", "AREA1", "LENGTH2", "RADIUS2", "AREA2", "DIST"]:
+        setattr(decide, name, rng.choice([0, 0.5, 1, 2, 3.5, 5]))
+    decide.EPSILON = rng.choice([0, 0.1, 1, pi / 2])
+    decide.N_PTS = rng.randint(1, 6)  # N_PTS = 0 makes the reference loop overrun
+    for name in [
+        "Q_PTS",
+        "QUADS",
+        "K_PTS",
+        "A_PTS",
+        "B_PTS",
+        "C_PTS",
+        "D_PTS",
+        "E_PTS",
+        "F_PTS",
+        "G_PTS",
+    ]:
+        setattr(decide, name, rng.randint(0, 5))
+    return decide
+
+
+def test_engines_agree_on_random_tracks():
+    """The NumPy engine returns the same booleans as the reference LIC class."""
+    rng = random.Random(2480)
+    for _ in range(300):
+        state = rng.getstate()
+        reference = random_decide(rng, "python")
+        rng.setstate(state)
+        vectorized = random_decide(rng, "numpy")
+        for index in range(15):
+            check = f"lic_{index}_check"
+            assert (
+                getattr(vectorized.LIC, check)() == getattr(reference.LIC, check)()
+            ), (check, reference.POINTS)
+
+
+def test_lic_4_sliding_counts_match_window_sets():
+    """The sliding quadrant counts give the result of building the set of
+    quadrants of every window, axis points included."""
+    rng = random.Random(2480)
+    for _ in range(500):
+        decide = Decide()
+        decide.POINTS = [
+            (rng.randint(-2, 2), rng.randint(-2, 2)) for _ in range(rng.randint(2, 15))
+        ]
+        decide.Q_PTS = rng.randint(1, 6)
+        decide.QUADS = rng.randint(0, 3)
+        windows = [
+            decide.POINTS[start : start + decide.Q_PTS]
+            for start in range(len(decide.POINTS) - decide.Q_PTS + 1)
+        ]
+        expected = any(
+            len({calculate_quadrant(point) for point in window} - {0}) > decide.QUADS
+            for window in windows
+        )
+        assert decide.LIC.lic_4_check() == expected, (decide.POINTS, decide.Q_PTS)
+
+
+def test_lic_6_long_windows_match_per_offset_kernel():
+    """The sampled, bounded and gathered evaluation of long LIC 6 windows
+    gives the result of evaluating every interior offset."""
+    np = pytest.importorskip("numpy")
+    from decide.lic_numpy import (
+        _interior_distances_exceed_direct,
+        interior_distances_exceed,
+        sliding_maxima,
+    )
+
+    values = np.array([[3.0, 1, 4, 1, 5, 9, 2, 6], [2, 7, 1, 8, 2, 8, 1, 8]])
+    assert sliding_maxima(values, 3).tolist() == [
+        [4, 4, 5, 9, 9, 9],
+        [7, 8, 8, 8, 8, 8],
+    ]
+
+    rng = np.random.default_rng(2480)
+    for trial in range(40):
+        walk = np.cumsum(rng.normal(size=(3, 2, 400)), axis=-1)
+        if trial % 2:
+            walk[..., ::9] = walk[..., :1]  # Windows with coincident endpoints
+        x, y = walk[:, 0], walk[:, 1]
+        n_pts = int(rng.integers(70, 200))
+        for dist in (0.5, 2, 5, 10, 20, 1e9):
+            assert np.array_equal(
+                interior_distances_exceed(x, y, n_pts, dist),
+                _interior_distances_exceed_direct(x, y, n_pts, dist),
+            ), (trial, n_pts, dist)
+
+    # A turned zigzag, which the bound cannot rule out near its amplitude
+    along, across = np.arange(2000.0), np.arange(2000) % 2
+    angle = np.pi / 16
+    x = np.cos(angle) * along - np.sin(angle) * across
+    y = np.sin(angle) * along + np.cos(angle) * across
+    for dist in (0.99, 1.0, 1.01):
+        assert np.array_equal(
+            interior_distances_exceed(x, y, 150, dist),
+            _interior_distances_exceed_direct(x, y, 150, dist),
+        ), dist
+
+
+def test_numpy_squared_comparisons_on_rounded_limits():
+    """Lengths equal to a rounded root and areas equal to the limit compare
+    like the reference, although sqrt(k) ** 2 differs from k."""
+    pytest.importorskip("numpy")
+    for a in range(1, 8):
+        for b in range(a, 8):
+            k = a * a + b * b
+            points = [(0, 0), (a, b), (0, 0), (a, b), (2 * a, 2 * b), (0, 0)]
+            for limit in [sqrt(k), sqrt(k) / 2, k / 4]:
+                results = []
+                for engine in ["python", "numpy"]:
+                    decide = Decide(engine=engine)
+                    decide.POINTS = points
+                    decide.LENGTH1 = decide.LENGTH2 = limit
+                    decide.RADIUS1 = decide.RADIUS2 = limit / 2
+                    decide.AREA1 = decide.AREA2 = limit
+                    decide.N_PTS = decide.Q_PTS = 3
+                    for name in ["A_PTS", "B_PTS", "E_PTS", "F_PTS", "K_PTS"]:
+                        setattr(decide, name, 1)
+                    decide.calculate_CMV()
+                    results.append(list(decide.CMV))
+                assert results[0] == results[1], (k, limit)
+
+
+def test_numpy_enclosing_radii_match_helper():
+    """The array enclosing radii are the floats of the scalar helper."""
+    np = pytest.importorskip("numpy")
+    from decide.helpers import enclosing_radius_squared
+    from decide.lic_numpy import triangle_squared_enclosing_radii
+
+    rng = random.Random(2480)
+    points = [(rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(300)]
+    points += [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(300)]
+    x = np.array([point[0] for point in points], dtype=float)
+    y = np.array([point[1] for point in points], dtype=float)
+    for offset1, offset2 in [(1, 2), (2, 5)]:
+        squared = triangle_squared_enclosing_radii(x, y, offset1, offset2)
+        expected = [
+            enclosing_radius_squared(points[i], points[i + offset1], points[i + offset2])
+            for i in range(len(points) - offset2)
+        ]
+        assert squared.tolist() == expected
+
+
+def test_numpy_engine_shares_primitives():
+    """Distances, areas, angles and enclosing radii with the same gaps are
+    computed once per point set and shared between the LICs."""
+    decide = Decide(engine="numpy")
+    decide.POINTS = [(0, 0), (1, 2), (3, 1), (2, -1), (-1, 0), (0, 3), (2, 2)]
+    for name in ["A_PTS", "B_PTS", "C_PTS", "D_PTS", "E_PTS", "F_PTS", "G_PTS"]:
+        setattr(decide, name, 1)
+    decide.K_PTS, decide.N_PTS, decide.Q_PTS = 1, 3, 3
+    decide.calculate_CMV()
+
+    primitives = decide.LIC.primitives
+    # Squared distances and x-deltas at gaps 1 and 2, and doubled areas,
+    # angles and squared enclosing radii for the gap pairs (1, 2) and (2, 4)
+    assert primitives.misses == 10
+    assert primitives.hits == 3
+
+    decide.calculate_CMV()
+    assert primitives.misses == 10
+    assert primitives.hits == 16
+
+
+def test_primitive_store_is_bounded():
+    """Sweeping the gaps over one track evicts the least recently used
+    primitives instead of keeping every gap."""
+    pytest.importorskip("numpy")
+    from decide.lic_numpy import PrimitiveStore
+
+    rng = random.Random(3)
+    decide, reference = Decide(engine="numpy"), Decide()
+    points = [(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(60)]
+    for instance in (decide, reference):
+        instance.POINTS = points
+        instance.N_PTS, instance.LENGTH1, instance.LENGTH2 = 3, 6, 4
+    primitives = decide.LIC.primitives
+    for k_pts in range(1, 50):
+        for instance in (decide, reference):
+            instance.K_PTS = instance.A_PTS = instance.G_PTS = k_pts
+            instance.calculate_CMV()
+        assert list(decide.CMV) == list(reference.CMV)
+        assert len(primitives) <= primitives.maxsize
+    assert primitives.evictions > 0
+    assert primitives.bytes == sum(
+        entry.nbytes for entry in primitives._entries.values()
+    )
+
+    store = PrimitiveStore(*decide.LIC.points.T[:, None], max_bytes=600)
+    for offset in range(1, 10):
+        store.pair_squared_distances(offset)
+    assert store.bytes <= 600 and len(store) < 9
+    store.pair_squared_distances(9)
+    assert store.hits == 1
@@ -0,0 +1,94 @@
+import pytest
+import random
+import sys
+import os
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.parallel import ParallelRunner, decide_parallel, pack_scenarios
+
+PARAMS = {"LENGTH1": 4, "RADIUS1": 2, "AREA1": 3, "N_PTS": 3, "DIST": 1}
+
+
+def random_scenarios(rng, count):
+    return [
+        [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(rng.randint(2, 30))]
+        for _ in range(count)
+    ]
+
+
+def reference_decision(points, lcm, puv):
+    decide = Decide()
+    decide.POINTS = points
+    for name, value in PARAMS.items():
+        setattr(decide, name, value)
+    decide.LCM, decide.PUV = lcm, puv
+    return decide.decide()
+
+
+def test_pack_scenarios():
+    coordinates, offsets, size = pack_scenarios([[(0, 1), (2, 3)], [(4, 5)], []])
+    assert coordinates.tolist() == [[0, 1], [2, 3], [4, 5]]
+    assert offsets.tolist() == [0, 2, 3, 3]
+    assert size == 3 * 16 + 4 * 8
+
+
+def test_parallel_decisions_in_input_order():
+    rng = random.Random(2480)
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    lcm[0][3] = lcm[3][0] = "ANDD"
+    lcm[6][1] = "ORR"
+    puv = [False] * 15
+    puv[0] = puv[6] = True
+    scenarios = random_scenarios(rng, 120)
+    expected = [reference_decision(points, lcm, puv) for points in scenarios]
+    assert "YES" in expected and "NO" in expected
+
+    with ParallelRunner(workers=2) as runner:
+        assert runner.run(scenarios, PARAMS, lcm, puv) == expected
+        # The runner and the workers' plans are reused for later runs
+        assert runner.run(scenarios[::-1], PARAMS, lcm, puv) == expected[::-1]
+        assert runner.run([], PARAMS, lcm, puv) == []
+
+
+def test_parallel_rejects_invalid_settings_up_front():
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    with pytest.raises(ValueError, match="N_PTS must be at least 1"):
+        decide_parallel([[(0, 0), (1, 1)]], {}, lcm, [False] * 15, workers=1)
+
+
+def test_parallel_large_input():
+    rng = random.Random(5)
+    lcm = [["ORR"] * 15 for _ in range(15)]
+    puv = [True] * 15
+    scenarios = [
+        [(rng.uniform(-4, 4), rng.uniform(-4, 4)) for _ in range(150)] for _ in range(4)
+    ]
+    expected = []
+    for points in scenarios:
+        decide = Decide(large_input=True)
+        decide.POINTS = points
+        for name, value in PARAMS.items():
+            setattr(decide, name, value)
+        decide.LCM, decide.PUV = lcm, puv
+        expected.append(decide.decide())
+    with ParallelRunner(workers=2) as runner:
+        assert runner.run(scenarios, PARAMS, lcm, puv, large_input=True) == expected
+        with pytest.raises(ValueError, match="between 2 and 100 points"):
+            runner.run(scenarios, PARAMS, lcm, puv)
+
+
+def _mapped_segments():
+    with open("/proc/self/maps") as maps:
+        return [line for line in maps if "/psm_" in line or "/wnsm_" in line]
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/maps"), reason="needs /proc")
+def test_workers_release_the_segment_after_a_run():
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    scenarios = random_scenarios(random.Random(1), 20)
+    with ParallelRunner(workers=1) as runner:
+        runner.run(scenarios, PARAMS, lcm, [False] * 15)
+        assert runner._pool.submit(_mapped_segments).result() == []
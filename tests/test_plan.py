@@ -0,0 +1,131 @@
+import pytest
+import random
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from math import inf, nan, nextafter, sqrt
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.bitmask import to_list
+from decide.decide import PARAMETER_NAMES
+from decide.helpers import square_threshold
+from decide.plan import compile_plan
+from test_lic import random_decide
+
+
+def random_configuration(decide, rng):
+    decide.LCM = [
+        [rng.choice(["ANDD", "ORR", "NOTUSED"]) for _ in range(15)] for _ in range(15)
+    ]
+    decide.PUV = [rng.random() < 0.3 for _ in range(15)]
+
+
+def test_plan_matches_decide():
+    """A compiled plan gives the CMV and decision of the Decide instance."""
+    rng = random.Random(2480)
+    for _ in range(300):
+        decide = random_decide(rng, "python")
+        random_configuration(decide, rng)
+        plan = decide.compile_plan()
+        points = decide.POINTS
+        assert plan.decide(points) == decide.decide()
+        assert to_list(plan.conditions(points)) == list(decide.CMV), points
+
+
+def test_plan_reuse_across_point_sets_and_threads():
+    """One plan serves many point sets, also from concurrent threads."""
+    rng = random.Random(7)
+    decide = random_decide(rng, "python")
+    random_configuration(decide, rng)
+    plan = decide.compile_plan()
+    tracks = [
+        [(rng.uniform(-3, 3), rng.uniform(-3, 3)) for _ in range(rng.randint(5, 40))]
+        for _ in range(200)
+    ]
+    expected = []
+    for track in tracks:
+        reference = Decide()
+        for name in PARAMETER_NAMES:
+            setattr(reference, name, getattr(decide, name))
+        reference.LCM, reference.PUV = decide.LCM, decide.PUV
+        reference.POINTS = track
+        expected.append(reference.decide())
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(plan.decide, tracks)) == expected
+
+
+def test_square_threshold():
+    """Comparing squares with the threshold equals comparing roots with the limit."""
+    for limit in [0, 0.1, 1, 2.5, 3, 1e-170, 1e160, 1e300, -1]:
+        for strict in [True, False]:
+            threshold = square_threshold(limit, strict)
+            for square in [threshold, nextafter(threshold, 0), limit * limit]:
+                met = sqrt(square) > limit if strict else sqrt(square) >= limit
+                assert met == (square >= threshold), (limit, strict, square)
+    assert square_threshold(inf) == inf
+    assert square_threshold(nan) != square_threshold(nan)
+
+
+def test_plan_validates_parameters():
+    """Invalid parameters are rejected when the plan is compiled."""
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    puv = [False] * 15
+    with pytest.raises(ValueError, match="Unknown parameters: RADIUS3"):
+        compile_plan({"RADIUS3": 1}, lcm, puv)
+    with pytest.raises(ValueError, match="K_PTS must be a non-negative integer"):
+        compile_plan({"K_PTS": 1.5, "N_PTS": 3}, lcm, puv)
+    with pytest.raises(ValueError, match="LENGTH1 must be a number"):
+        compile_plan({"LENGTH1": "5", "N_PTS": 3}, lcm, puv)
+    with pytest.raises(ValueError, match="N_PTS must be at least 1"):
+        compile_plan({}, lcm, puv)
+    with pytest.raises(ValueError, match="PUV must be a list of 15 boolean values"):
+        compile_plan({"N_PTS": 3}, lcm, [True])
+
+
+def test_plan_evaluates_only_needed_conditions():
+    """The plan only evaluates the LICs that the LCM and PUV consult."""
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    lcm[2][7] = lcm[7][2] = "ANDD"
+    puv = [False] * 15
+    puv[2] = True
+    plan = compile_plan({"N_PTS": 3}, lcm, puv)
+    assert plan.needed == (2, 7)
+    with pytest.raises(ValueError, match="between 2 and 100 points"):
+        plan.decide([(0, 0)])
+
+
+def test_plan_follows_large_input():
+    """Plans compiled with large_input accept more than 100 points, like Decide."""
+    rng = random.Random(11)
+    decide = Decide(large_input=True)
+    decide.POINTS = [(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(250)]
+    decide.LENGTH1, decide.N_PTS, decide.K_PTS, decide.QUADS = 12, 3, 4, 3
+    decide.Q_PTS, decide.A_PTS, decide.B_PTS = 4, 1, 1
+    random_configuration(decide, rng)
+    plan = decide.compile_plan()
+    assert plan.large_input
+    decide.calculate_CMV()
+    assert to_list(plan.conditions(decide.POINTS)) == list(decide.CMV)
+    assert plan.decide(decide.POINTS) == decide.decide()
+    with pytest.raises(ValueError, match="at least 2 points"):
+        plan.decide([(0, 0)])
+    with pytest.raises(ValueError, match="between 2 and 100 points"):
+        compile_plan({"N_PTS": 3}, decide.LCM, decide.PUV).decide(decide.POINTS)
+
+
+def test_plan_evaluate_many():
+    """Point sets evaluated together give the masks of evaluate()."""
+    rng = random.Random(23)
+    decide = random_decide(rng, "python")
+    random_configuration(decide, rng)
+    plan = decide.compile_plan()
+    tracks = [
+        [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(rng.randint(2, 40))]
+        for _ in range(50)
+    ]
+    assert plan.evaluate_many(tracks) == [plan.evaluate(track) for track in tracks]
+    with pytest.raises(ValueError, match="between 2 and 100 points"):
+        plan.evaluate_many(tracks + [[(0, 0)]])
+    with pytest.raises(FloatingPointError):
+        plan.evaluate_many([[(0, 0), (1e200, 1), (2, 2)]])
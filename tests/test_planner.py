@@ -0,0 +1,79 @@
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.planner import DemandPlanner
+
+
+def make_decide(points, lcm, puv, demand_driven):
+    decide = Decide(demand_driven=demand_driven)
+    decide.POINTS = points
+    decide.LENGTH1, decide.RADIUS1, decide.AREA1 = 2, 1.5, 2
+    decide.EPSILON, decide.DIST = 0.5, 1
+    decide.Q_PTS, decide.QUADS, decide.N_PTS = 3, 1, 3
+    decide.K_PTS = decide.A_PTS = decide.B_PTS = decide.C_PTS = 1
+    decide.D_PTS = decide.E_PTS = decide.F_PTS = decide.G_PTS = 1
+    decide.LENGTH2, decide.RADIUS2, decide.AREA2 = 5, 4, 6
+    decide.LCM = lcm
+    decide.PUV = puv
+    return decide
+
+
+def test_demand_driven_matches_eager_decision():
+    """Demand-driven decisions agree with evaluating every LIC."""
+    rng = random.Random(2480)
+    for _ in range(200):
+        points = [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(8)]
+        connectors = rng.choice([["ANDD", "ORR"], ["NOTUSED"] * 4 + ["ANDD", "ORR"]])
+        lcm = [[rng.choice(connectors) for _ in range(15)] for _ in range(15)]
+        puv = [rng.random() < 0.3 for _ in range(15)]
+
+        eager = make_decide(points, lcm, puv, demand_driven=False)
+        lazy = make_decide(points, lcm, puv, demand_driven=True)
+        assert lazy.decide() == eager.decide()
+
+        assert lazy.stats.skipped == 15 - len(lazy.stats.evaluated)
+        for index in range(15):
+            if lazy.CMV[index] is not None:
+                assert lazy.CMV[index] == eager.CMV[index]
+            if lazy.FUV[index] is not None:
+                assert lazy.FUV[index] == eager.FUV[index]
+        assert set(lazy.stats.evaluated) <= set(DemandPlanner(lcm, puv).needed)
+
+
+def test_unconsulted_lics_are_skipped():
+    """With an all False PUV no LIC is evaluated and LAUNCH is YES."""
+    lcm = [["ANDD"] * 15 for _ in range(15)]
+    decide = make_decide([(0, 0), (1, 1), (2, 0)], lcm, [False] * 15, True)
+    assert decide.decide() == "YES"
+    assert decide.stats.evaluated == ()
+    assert decide.stats.skipped == 15
+    assert decide.CMV == [None] * 15
+
+
+def test_evaluation_short_circuits_on_false_FUV():
+    """Evaluation stops at the first row of the PUM that contains False."""
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    lcm[0][5] = lcm[5][0] = "ANDD"  # LIC 5 is False on a track moving right
+    lcm[3][4] = lcm[4][3] = "ORR"
+    puv = [False] * 15
+    puv[0] = puv[3] = True
+
+    decide = make_decide([(0, 0), (3, 0), (6, 0)], lcm, puv, True)
+    assert decide.decide() == "NO"
+    assert decide.stats.evaluated == (0, 5)
+    assert decide.stats.skipped == 13
+    assert decide.stats.short_circuited
+    assert decide.FUV[0] is False
+    assert decide.FUV[3] is None
+
+
+def test_eager_decision_reports_stats():
+    """The regular decide() evaluates all 15 LICs."""
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    decide = make_decide([(0, 0), (1, 1)], lcm, [False] * 15, False)
+    decide.decide()
+    assert decide.stats.evaluated == tuple(range(15))
+    assert decide.stats.skipped == 0
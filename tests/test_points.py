@@ -0,0 +1,103 @@
+import pytest
+import random
+import sys
+import os
+from array import array
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.points import PointArray
+
+
+def test_float64_buffers_are_not_copied():
+    """Contiguous float64 data is wrapped without copying."""
+    track = np.random.default_rng(0).normal(size=(50, 2))
+    assert np.shares_memory(PointArray(track).data, track)
+
+    flat = array("d", [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    points = PointArray(flat)
+    assert len(points) == 3
+    assert np.shares_memory(points.data, np.frombuffer(flat))
+    assert PointArray(memoryview(flat)) == [(0.0, 1.0), (2.0, 3.0), (4.0, 5.0)]
+
+
+def test_other_numeric_types_are_converted():
+    """Integer and float32 arrays are converted to float64 once."""
+    points = PointArray(np.arange(8, dtype=np.int32).reshape(4, 2))
+    assert points.data.dtype == np.float64
+    assert points[1] == (2.0, 3.0)
+    assert points[-1] == (6.0, 7.0)
+    assert points[1:3] == [(2, 3), (4, 5)]
+    assert list(points) == [(0, 1), (2, 3), (4, 5), (6, 7)]
+
+
+def test_invalid_shapes_and_types():
+    with pytest.raises(ValueError, match="POINTS must be a list of tuples"):
+        PointArray(np.zeros((4, 3)))
+    with pytest.raises(ValueError, match="POINTS must be a list of tuples"):
+        PointArray(array("d", [1.0, 2.0, 3.0]))
+    with pytest.raises(ValueError, match="POINTS must contain only numeric"):
+        PointArray(np.array([["a", "b"]]))
+    with pytest.raises(ValueError, match="POINTS must contain only numeric"):
+        PointArray(np.array([[1 + 2j, 0]]))
+
+
+def test_decide_accepts_arrays_and_buffers():
+    """Decide gives the same CMV for a PointArray and the list of tuples."""
+    rng = random.Random(2480)
+    for engine in ["python", "numpy"]:
+        for _ in range(20):
+            track = [(rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(12)]
+            vectors = []
+            for points in [track, np.array(track), array("d", np.ravel(track))]:
+                decide = Decide(engine=engine)
+                decide.POINTS = points
+                decide.LENGTH1, decide.RADIUS1, decide.AREA1 = 2, 1.5, 2
+                decide.Q_PTS, decide.QUADS, decide.N_PTS, decide.DIST = 3, 1, 3, 1
+                decide.K_PTS = decide.A_PTS = decide.B_PTS = decide.C_PTS = 1
+                decide.D_PTS = decide.E_PTS = decide.F_PTS = decide.G_PTS = 1
+                decide.calculate_CMV()
+                vectors.append(list(decide.CMV))
+            assert vectors[0] == vectors[1] == vectors[2]
+
+
+def test_later_changes_of_the_source_do_not_reach_decide():
+    """Writable arrays and buffers are copied on assignment, so the numpy
+    engine's cached geometry cannot go stale when the caller changes them."""
+    track = np.array([(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (3.0, 0.0)])
+    hidden = track.view()
+    hidden.flags.writeable = False  # Still writable through track
+    flat = array("d", np.ravel(track))
+    for source in [track, hidden, flat, memoryview(flat)]:
+        decide = Decide(engine="numpy")
+        decide.POINTS = source
+        decide.LENGTH1, decide.N_PTS = 5, 3
+        decide.calculate_CMV()
+        assert decide.CMV[0] is False
+        assert not np.shares_memory(np.asarray(decide.POINTS), track)
+        with pytest.raises(ValueError, match="read-only"):
+            np.asarray(decide.POINTS)[0, 0] = 1.0
+
+        original = track.copy()
+        track[2] = flat[4] = 100.0
+        decide.calculate_CMV()
+        assert decide.CMV[0] is False
+        assert decide.POINTS == [tuple(point) for point in original]
+        track[:], flat[:] = original, array("d", np.ravel(original))
+
+    # Read-only memory is not copied
+    frozen = np.array(track)
+    frozen.flags.writeable = False
+    decide = Decide()
+    decide.POINTS = frozen
+    assert np.shares_memory(np.asarray(decide.POINTS), frozen)
+
+
+def test_decide_accepts_numpy_scalars_in_lists():
+    decide = Decide()
+    decide.POINTS = [(np.int64(0), np.float32(1.5)), (np.float64(2), 3)]
+    assert decide.NUMPOINTS == 2
+    with pytest.raises(ValueError, match="between 2 and 100 points"):
+        Decide().POINTS = np.zeros((101, 2))
@@ -0,0 +1,197 @@
+import pytest
+import asyncio
+import json
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide import server as server_module
+from decide.server import (
+    DecisionServer,
+    evaluate_batch,
+    load_configurations,
+    percentile,
+)
+from decide.inputs import parse_points
+
+PARAMS = {"LENGTH1": 4, "RADIUS1": 2, "AREA1": 3, "N_PTS": 3, "DIST": 1}
+
+
+def configuration(puv_index):
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    lcm[0][3] = lcm[3][0] = "ANDD"
+    lcm[6][1] = "ORR"
+    puv = [False] * 15
+    puv[puv_index] = True
+    return {"parameters": PARAMS, "LCM": lcm, "PUV": puv}
+
+
+def reference(points, settings):
+    decide = Decide()
+    decide.POINTS = [tuple(point) for point in points]
+    for name, value in settings["parameters"].items():
+        setattr(decide, name, value)
+    decide.LCM, decide.PUV = settings["LCM"], settings["PUV"]
+    launch = decide.decide()
+    return {"LAUNCH": launch, "CMV": list(decide.CMV), "FUV": list(decide.FUV)}
+
+
+async def exchange(path, requests):
+    """Send all requests on one connection, then collect the responses by id."""
+    reader, writer = await asyncio.open_unix_connection(path)
+    for request in requests:
+        writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    return responses
+
+
+def test_concurrent_requests_are_batched(tmp_path):
+    rng = random.Random(2480)
+    scenarios = [
+        [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(rng.randint(2, 30))]
+        for _ in range(60)
+    ]
+    settings = configuration(0)
+
+    async def scenario():
+        server = DecisionServer({"default": settings}, max_delay=0.05)
+        path = str(tmp_path / "decide.sock")
+        await server.start_unix(path)
+        requests = [
+            {"id": index, "points": [list(point) for point in points]}
+            for index, points in enumerate(scenarios)
+        ]
+        halves = await asyncio.gather(
+            exchange(path, requests[:30]), exchange(path, requests[30:])
+        )
+        (stats,) = await exchange(path, [{"op": "stats"}])
+        await server.close()
+        return halves[0] + halves[1], stats
+
+    responses, stats = asyncio.run(scenario())
+    responses = {response.pop("id"): response for response in responses}
+    for index, points in enumerate(scenarios):
+        assert responses[index] == reference(points, settings)
+    assert stats["requests"] == 60
+    assert stats["batches"] < 60
+    assert 0 <= stats["p50_ms"] <= stats["p99_ms"]
+
+
+def test_reload_and_errors(tmp_path):
+    points = [[0, 0], [5, 0], [5, 5], [0, 5]]
+    path = tmp_path / "configurations.json"
+    path.write_text(json.dumps({"default": configuration(0)}))
+
+    async def scenario():
+        server = DecisionServer(path=str(path))
+        socket = str(tmp_path / "decide.sock")
+        await server.start_unix(socket)
+        before = await exchange(socket, [{"id": 1, "points": points}])
+        path.write_text(json.dumps({"default": configuration(2)}))
+        after = await exchange(socket, [{"op": "reload"}, {"id": 2, "points": points}])
+        failed = await exchange(
+            socket,
+            [
+                {"id": 3, "op": "reload", "configurations": {"default": {}}},
+                {"id": 4, "points": [[0, 0]]},
+                {"id": 5, "points": points, "configuration": "other"},
+                {"id": 6, "points": "nope"},
+                {"id": 7, "op": "restart"},
+            ],
+        )
+        await server.close()
+        return before, after, failed
+
+    before, after, failed = asyncio.run(scenario())
+    assert before[0]["FUV"][0] is True and before[0]["FUV"][2] is True
+    assert after[0] == {"reloaded": ["default"]}
+    assert after[1]["FUV"] == reference(points, configuration(2))["FUV"]
+    errors = {response["id"]: response["error"] for response in failed}
+    assert errors[3].startswith("configuration 'default'")
+    assert errors[4] == "POINTS must contain between 2 and 100 points"
+    assert errors[5] == "unknown configuration 'other'"
+    assert errors[6] == "points must be a list of [x, y] pairs"
+    assert errors[7] == "unknown op 'restart'"
+
+
+def test_failed_evaluations_do_not_stop_the_server(tmp_path, monkeypatch):
+    points = [[0, 0], [5, 0], [5, 5], [0, 5]]
+    settings = configuration(0)
+
+    def broken_batch(batch):
+        raise RuntimeError("worker failed")
+
+    async def scenario():
+        server = DecisionServer({"default": settings})
+        socket = str(tmp_path / "decide.sock")
+        await server.start_unix(socket)
+        overflow = await exchange(
+            socket,
+            [{"id": 1, "points": [[0, 0], [1e200, 1], [2, 2]]}],
+        )
+        valid = await exchange(socket, [{"id": 2, "points": points}])
+        with monkeypatch.context() as patch:
+            patch.setattr(server_module, "evaluate_batch", broken_batch)
+            broken = await exchange(socket, [{"id": 3, "points": points}])
+        recovered = await exchange(socket, [{"id": 4, "points": points}])
+        await server.close()
+        return overflow + valid + broken + recovered
+
+    # A stopped batcher would leave the later requests waiting forever
+    overflow, valid, broken, recovered = asyncio.run(asyncio.wait_for(scenario(), 10))
+    assert overflow["id"] == 1 and "error" in overflow
+    assert valid == {"id": 2, **reference(points, settings)}
+    assert broken == {"id": 3, "error": "worker failed"}
+    assert recovered == {"id": 4, **reference(points, settings)}
+
+
+def test_batches_are_grouped_by_configuration():
+    plans = load_configurations({"a": configuration(0), "b": configuration(2)})
+    rng = random.Random(5)
+    batch = [
+        (plans[name], [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(12)])
+        for name in "ab" * 10 + "a" * 3
+    ]
+    expected = [
+        reference(points, configuration(0 if plan is plans["a"] else 2))
+        for plan, points in batch
+    ]
+    assert evaluate_batch(batch) == expected
+
+    # A failing request sends its group back to evaluation one at a time
+    batch[4] = (plans["a"], [(0, 0), (1e200, 1), (2, 2)])
+    batch[6] = (plans["a"], [(0, 0)])
+    results = evaluate_batch(batch)
+    assert "error" in results[4]
+    assert results[6] == {"error": "POINTS must contain between 2 and 100 points"}
+    others = [index for index in range(len(batch)) if index not in (4, 6)]
+    assert [results[index] for index in others] == [expected[index] for index in others]
+
+
+def test_parse_points_and_percentile():
+    assert parse_points([[0, 1.5], [2, 3]]) == [(0, 1.5), (2, 3)]
+    for value in ([[0, True], [1, 2]], [[0, "1"], [1, 2]]):
+        try:
+            parse_points(value)
+        except ValueError as error:
+            assert "numeric" in str(error)
+        else:
+            raise AssertionError("non-numeric coordinates were accepted")
+    samples = list(range(1, 101))
+    assert percentile(samples, 0.5) == 51
+    assert percentile(samples, 0.99) == 100
+
+
+def test_large_input_configurations():
+    points = [(index % 7, index % 5) for index in range(150)]
+    plans = load_configurations(
+        {"default": configuration(0), "large": dict(configuration(0), large_input=True)}
+    )
+    assert not plans["default"].large_input and plans["large"].large_input
+    plans["large"].evaluate(points)
+    with pytest.raises(ValueError, match="between 2 and 100 points"):
+        plans["default"].evaluate(points)
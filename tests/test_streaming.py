@@ -0,0 +1,104 @@
+import pytest
+from fractions import Fraction
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.streaming import StreamingDecide
+
+PARAMS = {
+    "LENGTH1": 3,
+    "RADIUS1": 2,
+    "EPSILON": 1,
+    "AREA1": 3,
+    "LENGTH2": 2,
+    "RADIUS2": 2.5,
+    "AREA2": 1,
+    "Q_PTS": 3,
+    "QUADS": 2,
+    "DIST": 1.5,
+    "N_PTS": 4,
+    "K_PTS": 1,
+    "A_PTS": 1,
+    "B_PTS": 2,
+    "C_PTS": 2,
+    "D_PTS": 1,
+    "E_PTS": 1,
+    "F_PTS": 1,
+    "G_PTS": 2,
+}
+
+
+def decide_on(points, params, lcm, puv):
+    decide = Decide()
+    decide.POINTS = list(points)
+    for name, value in params.items():
+        setattr(decide, name, value)
+    decide.LCM = lcm
+    decide.PUV = puv
+    decide.decide()
+    return decide
+
+
+@pytest.mark.parametrize("window", [2, 3, 5, 8, 20])
+def test_streaming_matches_decide_on_window(window):
+    """After every push the streaming state equals a full Decide run on
+    the points currently in the window."""
+    rng = random.Random(window)
+    lcm = [
+        [rng.choice(["ANDD", "ORR", "NOTUSED"]) for _ in range(15)] for _ in range(15)
+    ]
+    puv = [rng.random() < 0.5 for _ in range(15)]
+    stream = StreamingDecide(window, PARAMS, lcm, puv)
+    for _ in range(150):
+        point = (rng.randint(-4, 4), rng.randint(-4, 4))
+        launch = stream.push(point)
+        assert len(stream.POINTS) <= window
+        if stream.NUMPOINTS < 2:
+            continue
+        reference = decide_on(stream.POINTS, PARAMS, lcm, puv)
+        assert stream.CMV == reference.CMV, stream.POINTS
+        assert stream.PUM == reference.PUM, stream.POINTS
+        assert stream.FUV == reference.FUV, stream.POINTS
+        assert launch == reference.LAUNCH
+
+
+def test_streaming_evicts_oldest_point():
+    """The window keeps only the most recent points."""
+    stream = StreamingDecide(3, {"LENGTH1": 5})
+    stream.extend([(0, 0), (10, 0), (10, 1), (10, 2)])
+    assert stream.POINTS == [(10, 0), (10, 1), (10, 2)]
+    assert stream.CMV[0] is False  # The 10 long step has left the window
+
+    stream.push((0, 2))
+    assert stream.CMV[0] is True
+
+
+def test_streaming_invalid_input():
+    """Invalid windows and points are rejected."""
+    with pytest.raises(ValueError, match="window must be an integer of at least 2"):
+        StreamingDecide(1)
+
+    stream = StreamingDecide(5)
+    for point in [(1, 2, 3), 5]:
+        with pytest.raises(ValueError, match="point must be a sequence of exactly 2"):
+            stream.push(point)
+    for point in [(1, "2"), (True, 1)]:
+        with pytest.raises(ValueError, match="point must contain only numeric"):
+            stream.push(point)
+
+
+def test_streaming_accepts_real_coordinates_in_any_sequence():
+    """Lists, NumPy scalars and fractions are accepted like tuples."""
+    np = pytest.importorskip("numpy")
+    points = [(0, 0), (3, 4), (1, 1), (6, 2)]
+    reference = StreamingDecide(3, PARAMS)
+    stream = StreamingDecide(3, PARAMS)
+    for point, other in zip(
+        points, [[0, 0], np.array([3.0, 4.0]), (Fraction(1), np.int64(1)), [6, 2.0]]
+    ):
+        assert stream.push(other) == reference.push(point)
+        assert stream.CMV == reference.CMV
+    assert stream.POINTS == points[1:]
@@ -0,0 +1,81 @@
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.summary import GapSummary
+from test_lic import random_decide
+
+THRESHOLDS = [
+    "LENGTH1",
+    "RADIUS1",
+    "AREA1",
+    "LENGTH2",
+    "RADIUS2",
+    "AREA2",
+    "QUADS",
+    "DIST",
+]
+
+
+def test_extrema_per_gap():
+    summary = GapSummary([(0, 0), (3, 4), (3, 0), (0, 0), (1, 1)])
+    assert summary.quadrant_counts(2) == (1, 1)
+    assert summary.interior_distances(3) == (1.3416407864998738, 4.0)
+    assert summary.distances(1) == (1.4142135623730951, 5.0)
+    assert summary.distances(2) == (2.23606797749979, 5.0)
+    assert summary.x_deltas(1) == (-3, 3)
+    assert summary.areas(1, 2) == (1.5, 6.0)
+    assert summary.enclosing_radii(1, 2) == (1.5, 2.5)
+    assert summary.scans == 7
+    summary.distances(1)
+    assert summary.scans == 7
+    assert GapSummary([(0, 0)]).distances(1) == (None, None)
+
+
+def test_threshold_changes_do_not_rescan():
+    decide = Decide(engine="summary")
+    reference = Decide()
+    rng = random.Random(2480)
+    decide.POINTS = reference.POINTS = [
+        (rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(60)
+    ]
+    for instance in (decide, reference):
+        instance.K_PTS = instance.A_PTS = instance.B_PTS = 2
+        instance.E_PTS = instance.F_PTS = instance.G_PTS = 1
+        instance.C_PTS = instance.D_PTS = 1
+        instance.N_PTS = instance.Q_PTS = 3
+    decide.calculate_CMV()
+    scans = decide.LIC.summary.scans
+    for _ in range(20):
+        for name in THRESHOLDS + ["EPSILON"]:
+            value = rng.uniform(0, 20)
+            setattr(decide, name, value)
+            setattr(reference, name, value)
+        decide.calculate_CMV()
+        reference.calculate_CMV()
+        assert list(decide.CMV) == list(reference.CMV)
+    assert decide.LIC.summary.scans == scans
+
+    # A new point set gets a new summary
+    summary = decide.LIC.summary
+    decide.POINTS = [(x + 1, y) for x, y in decide.POINTS]
+    assert decide.LIC.summary is not summary
+
+
+def test_summary_engine_agrees_after_threshold_changes():
+    rng = random.Random(2480)
+    for _ in range(200):
+        state = rng.getstate()
+        reference = random_decide(rng, "python")
+        rng.setstate(state)
+        decide = random_decide(rng, "summary")
+        for _ in range(3):
+            for name in THRESHOLDS:
+                value = rng.choice([-1, 0, 0.5, 1, 2, 3.5, 5])
+                setattr(reference, name, value)
+                setattr(decide, name, value)
+            reference.calculate_CMV()
+            decide.calculate_CMV()
+            assert list(decide.CMV) == list(reference.CMV), reference.POINTS
@@ -0,0 +1,118 @@
+import pytest
+import random
+import sys
+import os
+from itertools import product
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.sweep import decide_sweep, gap_tables
+from test_batch import PARAMS, random_lcm, reference_decision
+
+
+def assert_matches_reference(points, params, lcm, puv, axes):
+    result = decide_sweep(points, params, lcm, puv, axes)
+    shape = tuple(len(values) for values in axes.values())
+    assert result.cmv.shape == result.fuv.shape == shape + (15,)
+    assert result.launch.shape == shape
+    for cell in product(*(range(size) for size in shape)):
+        cell_params = dict(params)
+        for name, index in zip(axes, cell):
+            cell_params[name] = axes[name][index]
+        cmv, fuv, launch = reference_decision(points, cell_params, lcm, puv)
+        assert list(result.cmv[cell]) == cmv
+        assert list(result.fuv[cell]) == fuv
+        assert result.launch[cell] == launch
+
+
+def test_threshold_sweep_matches_decide():
+    """Every cell of a LENGTH1 x RADIUS1 x EPSILON x AREA1 grid equals a
+    Decide run with those values."""
+    rng = random.Random(2480)
+    points = [(rng.randint(-4, 4), rng.randint(-4, 4)) for _ in range(12)]
+    axes = {
+        "LENGTH1": [0, 1, 2.5, 6],
+        "RADIUS1": [0, 1.5, 3],
+        "EPSILON": [0, 0.5, np.pi],
+        "AREA1": [-1, 0, 2, 10],
+    }
+    assert_matches_reference(points, PARAMS, random_lcm(rng), [True] * 15, axes)
+
+
+def test_gap_and_threshold_sweep_matches_decide():
+    rng = random.Random(2480)
+    for _ in range(20):
+        points = [
+            (rng.uniform(-4, 4), rng.uniform(-4, 4)) for _ in range(rng.randint(5, 12))
+        ]
+        axes = {
+            "K_PTS": [0, 1, 3],
+            "LENGTH2": [-1, 1, 4],
+            "DIST": [0, 0.5, 2],
+            "N_PTS": [1, 3, 5],
+            "QUADS": [1, 2, 3],
+            "A_PTS": [1, 2],
+        }
+        puv = [rng.random() < 0.5 for _ in range(15)]
+        assert_matches_reference(points, PARAMS, random_lcm(rng), puv, axes)
+
+
+def test_sweep_falls_back_for_wrapping_gaps():
+    """LIC 14 gaps below 0 are evaluated cell by cell like the reference."""
+    points = [(0, 0), (3, 0), (0, 4), (1, 1), (5, 2), (2, 6)]
+    params = dict(PARAMS, E_PTS=-1, F_PTS=0)
+    axes = {"AREA1": [0, 3, 7], "AREA2": [-1, 2, 8], "LENGTH1": [1, 10]}
+    assert_matches_reference(
+        points, params, random_lcm(random.Random(1)), [True] * 15, axes
+    )
+
+
+def test_sweep_validates_its_inputs():
+    points = [(0, 0), (1, 1), (2, 0)]
+    lcm = [["NOTUSED"] * 15 for _ in range(15)]
+    with pytest.raises(ValueError, match="Unknown parameters: LENGTH3"):
+        decide_sweep(points, PARAMS, lcm, [True] * 15, {"LENGTH3": [1, 2]})
+    with pytest.raises(ValueError, match="PUV"):
+        decide_sweep(points, PARAMS, lcm, [True] * 14, {"LENGTH1": [1, 2]})
+    result = decide_sweep(points, PARAMS, lcm, [True] * 15, {"LENGTH1": []})
+    assert result.cmv.shape == (0, 15)
+
+
+# Gap parameters indexing the table of each LIC
+TABLE_GAPS = {
+    7: ("K_PTS",),
+    8: ("A_PTS", "B_PTS"),
+    9: ("C_PTS", "D_PTS"),
+    10: ("E_PTS", "F_PTS"),
+    11: ("G_PTS",),
+    12: ("K_PTS",),
+    13: ("A_PTS", "B_PTS"),
+    14: ("E_PTS", "F_PTS"),
+}
+
+
+@pytest.mark.parametrize("block_size", [1, 2**15])
+def test_gap_tables_match_checks_for_every_gap(block_size):
+    rng = random.Random(2480)
+    for _ in range(15):
+        points = [
+            (rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(rng.randint(2, 10))
+        ]
+        params = {
+            name: rng.choice([-1, 0, 0.5, 1, 2, 3.5])
+            for name in ["LENGTH1", "RADIUS1", "AREA1", "LENGTH2", "RADIUS2", "AREA2"]
+        }
+        params["EPSILON"] = rng.choice([0, 0.1, 1])
+        tables = gap_tables(points, params, block_size)
+        for index, names in TABLE_GAPS.items():
+            table = getattr(tables, f"lic_{index}")
+            assert table.shape == (len(points),) * len(names)
+            for gaps in product(range(len(points)), repeat=len(names)):
+                decide = Decide()
+                decide.POINTS = points
+                for name, value in list(params.items()) + list(zip(names, gaps)):
+                    setattr(decide, name, value)
+                check = getattr(decide.LIC, f"lic_{index}_check")
+                assert table[gaps] == check(), (index, gaps)
@@ -0,0 +1,104 @@
+import io
+import json
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from decide import Decide
+from decide.cli import read_csv, read_jsonl
+from decide.track import (
+    HEADER,
+    main,
+    open_track,
+    scenarios_to_points,
+    track_to_scenarios,
+    write_csv,
+    write_jsonl,
+    write_track,
+)
+
+
+def random_track(count, seed=2480):
+    return np.cumsum(np.random.default_rng(seed).normal(size=(count, 2)), axis=0)
+
+
+def test_header_layout(tmp_path):
+    path = tmp_path / "track.trk"
+    assert write_track(path, [(0, 1), (2.5, -3)]) == 2
+    data = path.read_bytes()
+    assert data[:8] == b"DECTRACK"
+    assert HEADER.unpack(data[:32])[1:] == (1, 32, 2, b"<f8\0\0\0\0\0")
+    assert np.frombuffer(data[32:], "<f8").tolist() == [0, 1, 2.5, -3]
+
+
+def test_windows_map_the_file_without_copying(tmp_path):
+    points = random_track(5000)
+    path = tmp_path / "track.trk"
+    # Generators are written in chunks
+    assert write_track(path, (tuple(point) for point in points)) == 5000
+    track = open_track(path)
+    assert len(track) == 5000
+    window = track.window(1000, 1300)
+    assert np.shares_memory(window.data, track.data)
+    assert np.array_equal(window.data, points[1000:1300])
+
+    decide = Decide(large_input=True)
+    decide.POINTS = window
+    assert np.shares_memory(np.asarray(decide.POINTS), track.data)
+    reference = Decide(large_input=True)
+    reference.POINTS = points[1000:1300].copy()
+    for name, value in {"LENGTH1": 3, "RADIUS1": 2, "N_PTS": 5, "DIST": 1}.items():
+        setattr(decide, name, value)
+        setattr(reference, name, value)
+    decide.calculate_CMV()
+    reference.calculate_CMV()
+    assert list(decide.CMV) == list(reference.CMV)
+
+
+def test_invalid_files(tmp_path):
+    path = tmp_path / "bad.trk"
+    path.write_bytes(b"NOTATRACK" + bytes(40))
+    with pytest.raises(ValueError, match="not a track file"):
+        open_track(path)
+    write_track(path, random_track(10))
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError, match="truncated"):
+        open_track(path)
+    write_track(path, [])
+    assert len(open_track(path)) == 0
+
+
+def test_scenario_conversions_round_trip(tmp_path):
+    points = random_track(250)
+    path = tmp_path / "track.trk"
+    write_track(path, points)
+    track = open_track(path)
+
+    windows = list(track_to_scenarios(track, window=100))
+    assert [scenario["id"] for scenario in windows] == [0, 100, 200]
+    assert len(windows[-1]["points"]) == 50
+    overlapping = list(track_to_scenarios(track, window=100, step=75))
+    assert [scenario["id"] for scenario in overlapping] == [0, 75, 150]
+
+    for write, read in ((write_jsonl, read_jsonl), (write_csv, read_csv)):
+        file = io.StringIO()
+        write(track_to_scenarios(track), file)
+        file.seek(0)
+        copy = tmp_path / "copy.trk"
+        write_track(copy, scenarios_to_points(read(file)))
+        assert np.array_equal(open_track(copy).data, points)
+
+
+def test_command_line(tmp_path, capsys):
+    track = tmp_path / "track.trk"
+    write_track(track, random_track(30))
+    scenarios = tmp_path / "scenarios.jsonl"
+    main([str(track), str(scenarios), "--window", "10"])
+    lines = scenarios.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [0, 10, 20]
+    main([str(scenarios), str(tmp_path / "copy.trk")])
+    assert "Wrote 30 points" in capsys.readouterr().out